@@ -0,0 +1,90 @@
+"""
+Перевірка детермінізму і швидкості робочого процесу AI.
+Кілька разів запускає headless-сцену з однаковим зерном і AIWorker та
+порівнює хеш стану: поля і атрибути ворогів (точки патрулювання, маршрути)
+та гравця. Вороги періодично отримують шкоду, тож перевіряються й відкинуті
+рішення, смерть і видалення ворогів. Для порівняння швидкості сцена
+запускається ще раз з AI в основному процесі (її стан інший: рішення
+робочого процесу приходять на крок пізніше).
+
+Запуск:
+    python -m benchmarks.ai_worker
+"""
+
+import os
+import hashlib
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from src.engine.headless import HeadlessRunner
+from src.utils import constants
+
+MAP_NAME = "level1"
+SEED = 20240517
+TICKS = 1200
+RUNS = 2
+HIT_INTERVAL = 20  # Кожні стільки кроків один ворог отримує шкоду
+HIT_DAMAGE = 20
+
+
+def state_hash(scene):
+    """Хеш стану сцени: поля і атрибути ворогів у порядку списку, стан гравця"""
+    state = [(enemy.entity_id, enemy.x, enemy.y, enemy.direction, enemy.state_id, enemy.health,
+              enemy.patrol_points, enemy.current_patrol_point, enemy.last_seen_player_pos,
+              enemy.path, enemy.path_target) for enemy in scene.enemies]
+    state.append((scene.player.x, scene.player.y, scene.player.health))
+    return hashlib.sha256(repr(state).encode()).hexdigest()
+
+
+def run(use_worker):
+    """
+    Один запуск сцени
+
+    Returns:
+        tuple або None: (хеш стану, секунд на крок, ворогів наприкінці);
+        None - робочий процес недоступний
+    """
+    constants.AI_WORKER_ENABLED = use_worker
+    runner = HeadlessRunner(MAP_NAME, seed=SEED)
+    try:
+        if not runner.setup():
+            raise RuntimeError(f"Не вдалося завантажити карту {MAP_NAME}")
+        scene = runner.scene_manager.current_scene
+        if use_worker and scene.ai_worker is None:
+            return None
+        # Бюджет часу AI залежить від швидкості машини
+        scene.ai_scheduler.budget_ms = None
+
+        seconds = 0.0
+        for hit in range(TICKS // HIT_INTERVAL):
+            seconds += runner.run(HIT_INTERVAL)["seconds"]
+            if scene.enemies:
+                scene.enemies[hit * 7 % len(scene.enemies)].take_damage(HIT_DAMAGE)
+        if use_worker and scene.ai_worker is None:
+            raise RuntimeError("Робочий процес AI зупинився під час запуску")
+        return state_hash(scene), seconds / TICKS, len(scene.enemies)
+    finally:
+        runner.shutdown()
+
+
+def main():
+    hashes = []
+    for index in range(RUNS):
+        outcome = run(use_worker=True)
+        if outcome is None:
+            print("Робочий процес AI недоступний (потрібні NumPy і multiprocessing.shared_memory)")
+            return
+        digest, per_tick, enemies = outcome
+        hashes.append(digest)
+        print(f"робочий процес, запуск {index + 1}: {digest[:16]}  {per_tick * 1000:.2f} мс/крок  ворогів {enemies}")
+
+    digest, per_tick, enemies = run(use_worker=False)
+    print(f"основний процес:            {digest[:16]}  {per_tick * 1000:.2f} мс/крок  ворогів {enemies}")
+
+    assert len(set(hashes)) == 1, "Робочий процес AI дав різний стан при однаковому зерні"
+    print("Стан усіх запусків з робочим процесом однаковий")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Бенчмарк broadphase системи зіткнень.
+Порівнює повний перебір пар (як до просторового хешу) з CollisionSystem
+при постійній щільності сутностей від 10 до 10 000.
+
+Запуск:
+    python -m benchmarks.collision_broadphase
+"""
+
+import os
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.systems.collision import CollisionSystem
+from src.utils.constants import TILE_SIZE
+
+ENTITY_COUNTS = [10, 100, 1000, 10000]
+BRUTE_FORCE_LIMIT = 2000  # Далі повний перебір займає хвилини
+TICKS = 20
+AREA_PER_ENTITY = 128 * 128  # Постійна щільність: площа світу росте разом з кількістю
+
+
+class BenchEntity:
+    """Мінімальна сутність для бенчмарку"""
+    
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.width = 32
+        self.height = 32
+        self.contacts = 0
+    
+    def on_collision(self, other):
+        self.contacts += 1
+
+
+def brute_force_movement(system, entity, delta_x, delta_y):
+    """Рух з перевіркою всіх пар (поведінка без broadphase)"""
+    if not system.check_tile_collision(entity.x + delta_x, entity.y, entity.width, entity.height):
+        entity.x += delta_x
+    if not system.check_tile_collision(entity.x, entity.y + delta_y, entity.width, entity.height):
+        entity.y += delta_y
+    for other in system.entities:
+        if other is not entity and system.check_entity_collision(entity, other):
+            entity.on_collision(other)
+            other.on_collision(entity)
+
+
+def make_world(count, seed):
+    """Створення системи зіткнень без стін і випадкових сутностей"""
+    rng = random.Random(seed)
+    side = int((count * AREA_PER_ENTITY) ** 0.5)
+    tiles = side // TILE_SIZE + 2
+    system = CollisionSystem({"tiles": [[0] * tiles for _ in range(tiles)]})
+    entities = [BenchEntity(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(count)]
+    for entity in entities:
+        system.register_entity(entity)
+    moves = [(rng.uniform(-4, 4), rng.uniform(-4, 4)) for _ in range(count)]
+    return system, entities, moves
+
+
+def run(count, use_hash):
+    """Середній час одного кроку, коли рухаються всі сутності"""
+    system, entities, moves = make_world(count, seed=count)
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        for entity, (delta_x, delta_y) in zip(entities, moves):
+            if use_hash:
+                system.resolve_movement(entity, delta_x, delta_y)
+            else:
+                brute_force_movement(system, entity, delta_x, delta_y)
+    elapsed = (time.perf_counter() - start) / TICKS
+    contacts = sum(entity.contacts for entity in entities)
+    return elapsed, contacts
+
+
+def main():
+    print(f"{'сутностей':>10} {'перебір, мс':>14} {'хеш, мс':>12} {'прискорення':>12}")
+    for count in ENTITY_COUNTS:
+        hashed, hashed_contacts = run(count, use_hash=True)
+        if count <= BRUTE_FORCE_LIMIT:
+            brute, brute_contacts = run(count, use_hash=False)
+            assert brute_contacts == hashed_contacts, "Broadphase змінив кількість зіткнень"
+            print(f"{count:>10} {brute * 1000:>14.2f} {hashed * 1000:>12.2f} {brute / hashed:>11.1f}x")
+        else:
+            print(f"{count:>10} {'-':>14} {hashed * 1000:>12.2f} {'-':>12}")
+
+
+if __name__ == "__main__":
+    main()
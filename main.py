@@ -1,19 +1,28 @@
 import pygame
 import sys
 import os
+import argparse
 from src.engine.game_loop import GameLoop
+from src.engine.replay import parse_seed
 from src.engine.scene_manager import SceneManager
-from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_TITLE
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 
-def main():
+def main(argv=None):
     """Основна функція запуску гри"""
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument("--map", help="Почати гру одразу з карти (без головного меню)")
+    parser.add_argument("--seed", type=parse_seed, help="Зерно генератора випадкових чисел")
+    parser.add_argument("--record", help="Записати введення у файл")
+    parser.add_argument("--replay", help="Відтворити введення з файлу (гра закривається в кінці запису)")
+    args = parser.parse_args(argv)
+    
     # Ініціалізація Pygame
     pygame.init()
     pygame.mixer.init()
     
     # Створення вікна
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption(GAME_TITLE)
+    pygame.display.set_caption(SCREEN_TITLE)
     
     # Створення менеджера сцен
     scene_manager = SceneManager()
@@ -21,8 +30,16 @@ def main():
     # Створення ігрового циклу
     game = GameLoop(screen, scene_manager)
     
+    # Зерно і запис введення встановлюються до завантаження першої сцени
+    if not game.start_session(args.seed, args.record, args.replay):
+        pygame.quit()
+        sys.exit(1)
+    
     # Запуск гри
-    game.run()
+    if args.map:
+        game.run("gameplay", map_name=args.map)
+    else:
+        game.run()
     
     # Закриття гри
     pygame.quit()
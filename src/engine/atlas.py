@@ -0,0 +1,182 @@
+"""
+Атлас текстур: пакування багатьох дрібних зображень у кілька великих поверхонь.
+Атлас будується заздалегідь і зберігається на диск разом з індексом
+(назва текстури -> сторінка та прямокутник), щоб гра завантажувала лише кілька файлів.
+
+Приклад побудови:
+    python -m src.engine.atlas assets/textures assets/atlas
+"""
+
+import os
+import sys
+import json
+import argparse
+import pygame
+from src.utils.constants import ATLAS_PAGE_SIZE, ATLAS_PADDING, ATLAS_INDEX_FILE
+
+
+class TextureAtlas:
+    """Набір сторінок атласу та індекс областей текстур"""
+    
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+        """Ініціалізація порожнього атласу"""
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []    # Список поверхонь-сторінок
+        self.regions = {}  # Назва -> (індекс сторінки, pygame.Rect)
+    
+    def pack(self, surfaces):
+        """
+        Пакування поверхонь у сторінки атласу (алгоритм полиць)
+        
+        Args:
+            surfaces: Словник назва -> pygame.Surface
+        """
+        # Сортування за висотою зменшує втрати місця на полицях
+        items = sorted(surfaces.items(), key=lambda item: (-item[1].get_height(), item[0]))
+        
+        placements = []  # (назва, поверхня, індекс сторінки, x, y)
+        page_index = -1
+        page_height = self.page_size  # Змушує створити першу сторінку
+        shelf_x = shelf_y = shelf_height = 0
+        
+        for name, surface in items:
+            width = surface.get_width() + self.padding
+            height = surface.get_height() + self.padding
+            
+            # Зображення, більші за сторінку, отримують окрему сторінку
+            if width > self.page_size or height > self.page_size:
+                self.pages.append(pygame.Surface(surface.get_size(), pygame.SRCALPHA))
+                placements.append((name, surface, len(self.pages) - 1, 0, 0))
+                continue
+            
+            # Перехід на нову полицю
+            if shelf_x + width > self.page_size:
+                shelf_y += shelf_height
+                shelf_x = shelf_height = 0
+            
+            # Перехід на нову сторінку
+            if page_index < 0 or shelf_y + height > page_height:
+                self.pages.append(pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA))
+                page_index = len(self.pages) - 1
+                shelf_x = shelf_y = shelf_height = 0
+            
+            placements.append((name, surface, page_index, shelf_x, shelf_y))
+            shelf_x += width
+            shelf_height = max(shelf_height, height)
+        
+        for name, surface, index, x, y in placements:
+            self.pages[index].blit(surface, (x, y))
+            self.regions[name] = (index, pygame.Rect(x, y, surface.get_width(), surface.get_height()))
+    
+    def get_region(self, name):
+        """Сторінка і прямокутник текстури або None"""
+        region = self.regions.get(name)
+        if region is None:
+            return None
+        return self.pages[region[0]], region[1]
+    
+    def save(self, directory):
+        """
+        Збереження сторінок (PNG) та індексу (JSON) у папку
+        
+        Returns:
+            bool: True якщо збереження успішне, False інакше
+        """
+        os.makedirs(directory, exist_ok=True)
+        index = {"pages": [], "regions": {}}
+        try:
+            for i, page in enumerate(self.pages):
+                filename = f"atlas_{i}.png"
+                pygame.image.save(page, os.path.join(directory, filename))
+                index["pages"].append(filename)
+            for name, (page_index, rect) in self.regions.items():
+                index["regions"][name] = [page_index, rect.x, rect.y, rect.width, rect.height]
+            with open(os.path.join(directory, ATLAS_INDEX_FILE), "w", encoding="utf-8") as file:
+                json.dump(index, file)
+            return True
+        except (OSError, pygame.error) as e:
+            print(f"Помилка збереження атласу {directory}: {e}")
+            return False
+    
+    @classmethod
+    def load(cls, directory):
+        """
+        Завантаження атласу, збереженого методом save
+        
+        Returns:
+            TextureAtlas: Атлас або None у випадку помилки
+        """
+        atlas = cls()
+        try:
+            with open(os.path.join(directory, ATLAS_INDEX_FILE), "r", encoding="utf-8") as file:
+                index = json.load(file)
+            for filename in index["pages"]:
+                page = pygame.image.load(os.path.join(directory, filename))
+                atlas.pages.append(page.convert_alpha() if pygame.display.get_surface() else page)
+            for name, (page_index, x, y, width, height) in index["regions"].items():
+                atlas.regions[name] = (page_index, pygame.Rect(x, y, width, height))
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            print(f"Помилка завантаження атласу {directory}: {e}")
+            return None
+        return atlas
+
+
+def collect_textures(source_dir):
+    """
+    Завантаження всіх PNG з папки (рекурсивно)
+    
+    Назва текстури - ім'я файлу без розширення (наприклад "tile_1", "player_idle_0").
+    
+    Returns:
+        dict: Назва -> pygame.Surface
+    """
+    surfaces = {}
+    for root, _, files in os.walk(source_dir):
+        for filename in sorted(files):
+            if not filename.lower().endswith(".png"):
+                continue
+            name = os.path.splitext(filename)[0]
+            path = os.path.join(root, filename)
+            if name in surfaces:
+                print(f"Пропущено текстуру з повторною назвою: {path}")
+                continue
+            try:
+                surfaces[name] = pygame.image.load(path).convert_alpha()
+            except pygame.error as e:
+                print(f"Помилка завантаження текстури {path}: {e}")
+    return surfaces
+
+
+def build_atlas(source_dir, output_dir):
+    """Побудова атласу з папки з текстурами та збереження його на диск"""
+    atlas = TextureAtlas()
+    atlas.pack(collect_textures(source_dir))
+    if not atlas.save(output_dir):
+        return None
+    return atlas
+
+
+def main(argv=None):
+    """Точка входу для побудови атласу з командного рядка"""
+    parser = argparse.ArgumentParser(description="Побудова атласу текстур")
+    parser.add_argument("source", help="Папка з PNG-текстурами")
+    parser.add_argument("output", help="Папка для сторінок атласу та індексу")
+    args = parser.parse_args(argv)
+    
+    # convert_alpha потребує відеорежиму, тому використовується фіктивний драйвер
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    
+    atlas = build_atlas(args.source, args.output)
+    pygame.quit()
+    if atlas is None:
+        return 1
+    
+    print(f"Текстур: {len(atlas.regions)}, сторінок: {len(atlas.pages)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,94 @@
 import pygame
 import sys
+import random
 from src.engine.input_handler import InputHandler
-from src.utils.constants import FPS, BLACK
+from src.engine.profiler import FrameProfiler
+from src.engine.replay import InputRecorder, InputReplay
+from src.utils.constants import FPS, BLACK, FIXED_TIMESTEP, TICK_RATE, MAX_SIMULATION_STEPS, MAX_FRAME_TIME
+from src.utils.constants import SHOW_FPS, PROFILER_EXPORT_PATH, DIRTY_RECT_RENDERING
 
 class GameLoop:
     """Основний цикл гри, відповідає за оновлення стану та рендеринг"""
     
-    def __init__(self, screen, scene_manager):
+    def __init__(self, screen, scene_manager, fixed_timestep=FIXED_TIMESTEP, dirty_rects=DIRTY_RECT_RENDERING):
         """Ініціалізація ігрового циклу"""
         self.screen = screen
         self.scene_manager = scene_manager
         self.input_handler = InputHandler()
         self.clock = pygame.time.Clock()
         self.running = True
+        
+        # Фіксований крок симуляції
+        self.fixed_timestep = fixed_timestep
+        self.tick_duration = 1.0 / TICK_RATE
+        self.accumulator = 0.0  # Накопичений, ще не симульований час
+        self.alpha = 1.0  # Коефіцієнт інтерполяції між двома останніми станами
+        
+        # Профайлер кадрів
+        self.profiler = FrameProfiler()
+        self.show_profiler_overlay = SHOW_FPS
+        self.scene_manager.set_profiler(self.profiler)
+        
+        # Режим оновлення лише змінених областей екрану
+        self.dirty_rect_mode = dirty_rects
+        self.previous_dirty_rects = []  # Області, змінені в попередньому кадрі
+        self.last_rendered_scene = None
+        
+        # Зерно генератора випадкових чисел, запис і відтворення введення (див. start_session)
+        self.seed = None
+        self.recorder = None
+        self.replay = None
+    
+    def start_session(self, seed=None, record_path=None, replay_path=None):
+        """
+        Встановлення зерна random і підключення запису або відтворення введення
+        
+        Викликається до завантаження сцени, бо вороги використовують random при створенні.
+        
+        Args:
+            seed: Зерно (None - випадкове; при відтворенні береться з файлу запису)
+            record_path: Файл для запису введення
+            replay_path: Файл запису для відтворення
+            
+        Returns:
+            bool: True якщо сесію підготовлено, False у випадку помилки
+        """
+        if replay_path:
+            self.replay = InputReplay.load(replay_path)
+            if self.replay is None:
+                return False
+            if not self.replay.bind(self.input_handler.key_map):
+                return False
+            seed = self.replay.seed
+            self.input_handler.replay = self.replay
+        elif seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        
+        if record_path:
+            self.recorder = InputRecorder.open(record_path, seed, list(self.input_handler.key_map))
+            if self.recorder is None:
+                return False
+            self.input_handler.recorder = self.recorder
+        
+        random.seed(seed)
+        return True
+    
+    def end_session(self):
+        """Закриття файлу запису введення"""
+        if self.recorder:
+            self.recorder.close()
+    
+    def load_scene(self, scene_name, **kwargs):
+        """Завантаження сцени з урахуванням запису або відтворення введення"""
+        if not self.scene_manager.load_scene(scene_name, **kwargs):
+            return False
+        
+        # Бюджет часу AI залежить від швидкості машини, тому запис і відтворення йдуть без нього
+        scene = self.scene_manager.current_scene
+        if (self.recorder or self.replay) and getattr(scene, "ai_scheduler", None):
+            scene.ai_scheduler.budget_ms = None
+        return True
     
     def process_events(self):
         """Обробка подій Pygame"""
@@ -23,37 +99,130 @@ class GameLoop:
         
         # Оновлення стану введення
         self.input_handler.update(events)
+    
+    def step(self, delta_time):
+        """Один крок симуляції поточної сцени"""
+        # Запис або відтворення введення для цього кроку
+        if not self.input_handler.tick():
+            self.running = False
+            return
         
-        # Обробка введення у поточній сцені
-        if self.scene_manager.current_scene:
-            self.scene_manager.current_scene.handle_input(self.input_handler)
+        scene = self.scene_manager.current_scene
+        if scene:
+            # Збереження попереднього стану для інтерполяції
+            scene.store_previous_state()
+            
+            # Обробка введення у поточній сцені
+            scene.handle_input(self.input_handler)
+            scene.update(delta_time)
     
     def update(self):
         """Оновлення ігрового стану"""
-        delta_time = self.clock.get_time() / 1000.0  # Переведення у секунди
+        frame_time = self.clock.get_time() / 1000.0  # Переведення у секунди
         
-        # Оновлення поточної сцени
-        if self.scene_manager.current_scene:
-            self.scene_manager.current_scene.update(delta_time)
+        if not self.fixed_timestep:
+            # Змінний крок: одне оновлення на кадр
+            self.step(frame_time)
+            self.alpha = 1.0
+            return
+        
+        # Обмеження часу кадру, щоб уникнути "спіралі смерті" після довгих пауз
+        self.accumulator += min(frame_time, MAX_FRAME_TIME)
+        
+        steps = 0
+        while self.accumulator >= self.tick_duration and steps < MAX_SIMULATION_STEPS:
+            self.step(self.tick_duration)
+            self.accumulator -= self.tick_duration
+            steps += 1
+        
+        # Якщо не встигаємо наздогнати, відкидаємо залишок цілих кроків
+        if self.accumulator >= self.tick_duration:
+            self.accumulator %= self.tick_duration
+        
+        self.alpha = self.accumulator / self.tick_duration
     
     def render(self):
         """Рендеринг гри"""
+        scene = self.scene_manager.current_scene
+        if self.dirty_rect_mode and scene and not scene.full_redraw and scene is self.last_rendered_scene:
+            self._render_dirty(scene)
+            return
+        self.last_rendered_scene = scene
+        
+        # Області, намальовані в повному кадрі, очищує наступний кадр з dirty rects
+        renderer = self.scene_manager.renderer
+        if self.dirty_rect_mode:
+            renderer.take_dirty_rects()
+            renderer.track_dirty = True
+        
         self.screen.fill(BLACK)  # Очищення екрану
         
         # Рендеринг поточної сцени
         if self.scene_manager.current_scene:
-            self.scene_manager.current_scene.render(self.screen)
+            self.scene_manager.current_scene.render(self.screen, self.alpha)
+        
+        # Оверлей зі статистикою часу кадру
+        if self.show_profiler_overlay:
+            overlay_rect = self.profiler.draw_overlay(self.screen)
+            if overlay_rect and self.dirty_rect_mode:
+                renderer.dirty_rects.append(overlay_rect)
+        
+        if self.dirty_rect_mode:
+            renderer.track_dirty = False
+            self.previous_dirty_rects = renderer.take_dirty_rects()
+        else:
+            self.previous_dirty_rects = []
         
         pygame.display.flip()  # Оновлення екрану
     
-    def run(self):
+    def _render_dirty(self, scene):
+        """Рендеринг з оновленням лише змінених областей екрану"""
+        # Якщо в сцені нічого не змінилося, кадр не малюється і не показується
+        if not scene.needs_redraw():
+            return
+        
+        renderer = self.scene_manager.renderer
+        renderer.take_dirty_rects()
+        renderer.track_dirty = True
+        
+        # Очищення областей, намальованих у попередньому кадрі
+        for rect in self.previous_dirty_rects:
+            self.screen.fill(BLACK, rect)
+        
+        scene.render(self.screen, self.alpha)
+        
+        # Оверлей оновлюється разом зі сценою
+        if self.show_profiler_overlay:
+            overlay_rect = self.profiler.draw_overlay(self.screen)
+            if overlay_rect:
+                renderer.dirty_rects.append(overlay_rect)
+        
+        renderer.track_dirty = False
+        rects = renderer.take_dirty_rects()
+        
+        pygame.display.update(self.previous_dirty_rects + rects)
+        self.previous_dirty_rects = rects
+    
+    def run(self, scene_name="main_menu", **scene_args):
         """Запуск ігрового циклу"""
         # Загрузка початкової сцени
-        self.scene_manager.load_scene("main_menu")
+        if not self.load_scene(scene_name, **scene_args):
+            self.running = False
         
         # Головний цикл
         while self.running:
-            self.process_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
\ No newline at end of file
+            self.profiler.begin_frame()
+            with self.profiler.section("events"):
+                self.process_events()
+            with self.profiler.section("update"):
+                self.update()
+            with self.profiler.section("render"):
+                self.render()
+            self.profiler.end_frame()
+            self.clock.tick(FPS)
+        
+        self.end_session()
+        
+        # Збереження профілю кадрів при виході
+        if PROFILER_EXPORT_PATH:
+            self.profiler.export(PROFILER_EXPORT_PATH)
@@ -0,0 +1,134 @@
+"""
+Запуск ігрової сцени без вікна (headless).
+Використовується для навантажувального тестування AI, зіткнень і фізики
+на машинах без дисплея та для вимірювання швидкості симуляції без обмеження FPS.
+
+Приклад:
+    python -m src.engine.headless --map level1 --ticks 10000
+"""
+
+import os
+import sys
+import time
+import argparse
+import pygame
+from src.engine.game_loop import GameLoop
+from src.engine.replay import parse_seed
+from src.engine.scene_manager import SceneManager
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class HeadlessRunner:
+    """Запуск ігрової сцени без вікна та без обмеження частоти кадрів"""
+    
+    def __init__(self, map_name="level1", render=False, seed=None, record_path=None, replay_path=None):
+        """Ініціалізація headless-запуску"""
+        self.map_name = map_name
+        self.render = render  # Чи виконувати рендеринг (у невидиму поверхню)
+        self.seed = seed  # Зерно генератора випадкових чисел (None - випадкове)
+        self.record_path = record_path  # Файл для запису введення
+        self.replay_path = replay_path  # Файл запису для відтворення
+        self.recorder = None
+        self.replay = None
+        self.screen = None
+        self.scene_manager = None
+        self.game_loop = None
+    
+    def setup(self):
+        """Ініціалізація Pygame з фіктивними драйверами та завантаження сцени"""
+        # Фіктивні драйвери SDL мають бути встановлені до ініціалізації дисплея
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+        
+        # Поверхня потрібна і без рендерингу: опитування клавіатури вимагає відеосистеми
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.scene_manager = SceneManager()
+        self.game_loop = GameLoop(self.screen, self.scene_manager)
+        
+        # Відтворення бере зерно з файлу запису
+        success = self.game_loop.start_session(self.seed, self.record_path, self.replay_path)
+        self.seed = self.game_loop.seed
+        self.recorder = self.game_loop.recorder
+        self.replay = self.game_loop.replay
+        if not success:
+            return False
+        return self.game_loop.load_scene("gameplay", map_name=self.map_name)
+    
+    def run(self, ticks):
+        """
+        Виконання заданої кількості кроків симуляції якнайшвидше
+        
+        Args:
+            ticks: Кількість кроків симуляції
+            
+        Returns:
+            dict: Кількість виконаних кроків, витрачений час і кроків за секунду
+        """
+        delta_time = self.game_loop.tick_duration
+        completed = 0
+        
+        profiler = self.game_loop.profiler
+        
+        start_time = time.perf_counter()
+        while completed < ticks and self.game_loop.running:
+            profiler.begin_frame()
+            with profiler.section("events"):
+                self.game_loop.process_events()
+            with profiler.section("update"):
+                self.game_loop.step(delta_time)
+            if self.render:
+                with profiler.section("render"):
+                    self.game_loop.render()
+            profiler.end_frame()
+            completed += 1
+        elapsed = time.perf_counter() - start_time
+        
+        return {
+            "ticks": completed,
+            "seconds": elapsed,
+            "ticks_per_second": completed / elapsed if elapsed > 0 else float("inf")
+        }
+    
+    def shutdown(self):
+        """Завершення роботи Pygame"""
+        if self.game_loop:
+            self.game_loop.end_session()
+        if self.scene_manager and self.scene_manager.current_scene:
+            self.scene_manager.current_scene.unload()
+        pygame.quit()
+
+
+def main(argv=None):
+    """Точка входу для запуску з командного рядка"""
+    parser = argparse.ArgumentParser(description="Headless-симуляція ігрової сцени")
+    parser.add_argument("--map", default="level1", help="Назва карти")
+    parser.add_argument("--ticks", type=int, default=10000, help="Кількість кроків симуляції")
+    parser.add_argument("--render", action="store_true", help="Виконувати рендеринг у невидиму поверхню")
+    parser.add_argument("--profile-out", help="Файл (.csv або .json) для збереження профілю кадрів")
+    parser.add_argument("--seed", type=parse_seed, help="Зерно генератора випадкових чисел")
+    parser.add_argument("--record", help="Записати введення у файл")
+    parser.add_argument("--replay", help="Відтворити введення з файлу (зупиняється в кінці запису)")
+    args = parser.parse_args(argv)
+    
+    runner = HeadlessRunner(args.map, render=args.render, seed=args.seed,
+                            record_path=args.record, replay_path=args.replay)
+    if not runner.setup():
+        print(f"Помилка: не вдалося підготувати сцену для карти {args.map}")
+        runner.shutdown()
+        return 1
+    
+    result = runner.run(args.ticks)
+    if args.profile_out:
+        runner.game_loop.profiler.export(args.profile_out)
+    runner.shutdown()
+    
+    print(f"Зерно: {runner.seed}")
+    print(f"Кроків: {result['ticks']}")
+    print(f"Час: {result['seconds']:.3f} с")
+    print(f"Кроків за секунду: {result['ticks_per_second']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
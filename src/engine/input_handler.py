@@ -24,9 +24,17 @@ class InputHandler:
             "sprint": pygame.K_LSHIFT,
             "pause": pygame.K_ESCAPE
         }
+        
+        # Запис і відтворення введення (по одному знімку на крок симуляції)
+        self.recorder = None
+        self.replay = None
     
     def update(self, events):
         """Оновлення стану введення"""
+        # Під час відтворення стан введення береться з запису
+        if self.replay:
+            return
+        
         # Оновлення стану клавіш
         self.keys_pressed = pygame.key.get_pressed()
         
@@ -38,6 +46,55 @@ class InputHandler:
         for event in events:
             pass  # Тут можна додати специфічну обробку (напр. одиночні натискання)
     
+    def snapshot(self):
+        """Компактний знімок поточного стану введення"""
+        keys_mask = 0
+        for bit, key in enumerate(self.key_map.values()):
+            if self.keys_pressed[key]:
+                keys_mask |= 1 << bit
+        
+        buttons_mask = 0
+        for bit, pressed in enumerate(self.mouse_buttons[:3]):
+            if pressed:
+                buttons_mask |= 1 << bit
+        
+        return (keys_mask, int(self.mouse_position[0]), int(self.mouse_position[1]), buttons_mask)
+    
+    def apply_snapshot(self, snapshot, keys=None):
+        """
+        Встановлення стану введення зі знімка
+        
+        Args:
+            snapshot: Знімок введення (див. snapshot)
+            keys: Клавіші для кожного біта маски (за замовчуванням - порядок key_map)
+        """
+        keys_mask, mouse_x, mouse_y, buttons_mask = snapshot
+        if keys is None:
+            keys = list(self.key_map.values())
+        self.keys_pressed = {key: False for key in self.key_map.values()}
+        for bit, key in enumerate(keys):
+            if keys_mask & (1 << bit):
+                self.keys_pressed[key] = True
+        self.mouse_position = (mouse_x, mouse_y)
+        self.mouse_buttons = tuple(bool(buttons_mask & (1 << bit)) for bit in range(3))
+    
+    def tick(self):
+        """
+        Обробка введення на початку кроку симуляції
+        
+        Returns:
+            bool: False якщо запис для відтворення закінчився, True інакше
+        """
+        if self.replay:
+            snapshot = self.replay.next_snapshot()
+            if snapshot is None:
+                return False
+            self.apply_snapshot(snapshot, self.replay.keys)
+        
+        if self.recorder:
+            self.recorder.record(self.snapshot())
+        return True
+    
     def is_key_pressed(self, key_name):
         """Перевірка, чи натиснута певна клавіша"""
         if key_name in self.key_map:
@@ -0,0 +1,163 @@
+import csv
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+from src.engine.text_cache import get_font
+from src.utils.constants import PROFILER_HISTORY, PROFILER_OVERLAY_REFRESH
+
+class _ProfileSection:
+    """Контекстний менеджер для вимірювання часу однієї секції кадру"""
+    
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """Профайлер кадрів: час фаз циклу та систем сцени з історією останніх кадрів"""
+    
+    def __init__(self, history=PROFILER_HISTORY):
+        """Ініціалізація профайлера"""
+        self.frames = deque(maxlen=history)  # Кільцевий буфер останніх кадрів
+        self.current_frame = None  # Час секцій поточного кадру (мс)
+        self.frame_start = 0.0
+        
+        # Кешовані рядки для оверлею
+        self.overlay_font = None
+        self.overlay_lines = []
+        self.frames_since_refresh = PROFILER_OVERLAY_REFRESH
+    
+    def begin_frame(self):
+        """Початок вимірювання нового кадру"""
+        self.current_frame = {}
+        self.frame_start = time.perf_counter()
+    
+    def end_frame(self):
+        """Завершення кадру та збереження його в історії"""
+        if self.current_frame is None:
+            return
+        self.current_frame["frame"] = (time.perf_counter() - self.frame_start) * 1000.0
+        self.frames.append(self.current_frame)
+        self.current_frame = None
+    
+    def section(self, name):
+        """
+        Вимірювання часу секції кадру
+        
+        Повторні виклики секції з тим самим ім'ям у межах кадру підсумовуються,
+        вкладені секції включають час дочірніх.
+        
+        Args:
+            name: Назва секції (наприклад "ai", "collision", "hud")
+        """
+        return _ProfileSection(self, name)
+    
+    def add_time(self, name, seconds):
+        """Додавання часу (у секундах) до секції поточного кадру"""
+        if self.current_frame is not None:
+            self.current_frame[name] = self.current_frame.get(name, 0.0) + seconds * 1000.0
+    
+    def section_names(self):
+        """Список назв усіх секцій, що зустрічаються в історії"""
+        names = []
+        for frame in self.frames:
+            for name in frame:
+                if name not in names:
+                    names.append(name)
+        return names
+    
+    def percentile(self, name, percent):
+        """
+        Перцентиль часу секції за історію кадрів
+        
+        Args:
+            name: Назва секції ("frame" - повний час кадру)
+            percent: Перцентиль від 0 до 100
+            
+        Returns:
+            float: Час у мілісекундах (0, якщо даних немає)
+        """
+        values = sorted(frame.get(name, 0.0) for frame in self.frames)
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, int(round(percent / 100.0 * (len(values) - 1))))
+        return values[index]
+    
+    def draw_overlay(self, surface, position=(10, 10)):
+        """
+        Відображення p50/p99 часу кадру та секцій поверх сцени
+        
+        Returns:
+            pygame.Rect: Область, зайнята оверлеєм (None, якщо нічого не намальовано)
+        """
+        if self.overlay_font is None:
+            self.overlay_font = get_font(None, 18)
+        
+        # Перцентилі перераховуються не кожен кадр, а раз на кілька кадрів
+        self.frames_since_refresh += 1
+        if self.frames_since_refresh >= PROFILER_OVERLAY_REFRESH:
+            self.frames_since_refresh = 0
+            self.overlay_lines = []
+            for name in self.section_names():
+                p50 = self.percentile(name, 50)
+                p99 = self.percentile(name, 99)
+                line = f"{name}: p50 {p50:.2f} мс  p99 {p99:.2f} мс"
+                self.overlay_lines.append(self.overlay_font.render(line, True, (255, 255, 0)))
+        
+        x, y = position
+        area = None
+        for line_surface in self.overlay_lines:
+            rect = surface.blit(line_surface, (x, y))
+            area = rect if area is None else area.union(rect)
+            y += line_surface.get_height()
+        return area
+    
+    def export(self, path):
+        """
+        Збереження історії кадрів у файл CSV або JSON (за розширенням)
+        
+        Args:
+            path: Шлях до файлу (.csv або .json)
+            
+        Returns:
+            bool: True якщо збереження успішне, False інакше
+        """
+        names = self.section_names()
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                if path.endswith(".json"):
+                    json.dump(list(self.frames), file)
+                else:
+                    writer = csv.writer(file)
+                    writer.writerow(names)
+                    for frame in self.frames:
+                        writer.writerow([f"{frame.get(name, 0.0):.4f}" for name in names])
+            return True
+        except OSError as e:
+            print(f"Помилка збереження профілю кадрів {path}: {e}")
+            return False
+
+
+class NullProfiler:
+    """Профайлер-заглушка, що нічого не вимірює"""
+    
+    _section = nullcontext()
+    
+    def section(self, name):
+        """Порожня секція"""
+        return self._section
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,108 @@
+import pygame
+from operator import itemgetter
+
+# Типи команд черги
+_SPRITE = 0
+_RECT = 1
+
+class RenderQueue:
+    """Черга команд малювання: відсікання за камерою, сортування за шаром і пакетний blits"""
+    
+    def __init__(self):
+        """Ініціалізація черги"""
+        self.commands = []  # (шар, порядковий номер, тип, дані...)
+        self.bounds = pygame.Rect(0, 0, 0, 0)  # Прямокутник камери в координатах екрану
+        
+        # Статистика останнього кадру
+        self.submitted = 0
+        self.culled = 0
+        self.batches = 0
+    
+    def begin(self, bounds):
+        """Початок нового кадру"""
+        self.commands.clear()
+        self.bounds = pygame.Rect(bounds)
+        self.submitted = 0
+        self.culled = 0
+        self.batches = 0
+    
+    def is_visible(self, rect):
+        """
+        Перевірка видимості команди з урахуванням статистики
+        
+        Викликається до підготовки спрайту, щоб невидимі спрайти не трансформувались.
+        
+        Args:
+            rect: Область на екрані (x, y, ширина, висота)
+        """
+        self.submitted += 1
+        if self.bounds.colliderect(rect):
+            return True
+        self.culled += 1
+        return False
+    
+    def submit_sprite(self, source, position, area=None, layer=0):
+        """
+        Додавання спрайту до черги (видимість перевіряється через is_visible)
+        
+        Args:
+            source: Поверхня-джерело (текстура або сторінка атласу)
+            position: Позиція на екрані (x, y)
+            area: Область джерела (None - вся поверхня)
+            layer: Шар малювання (менші шари малюються раніше)
+        """
+        self.commands.append((layer, len(self.commands), _SPRITE, source, position, area))
+    
+    def submit_rect(self, color, rect, layer=0):
+        """Додавання заповненого прямокутника до черги з відсіканням"""
+        if self.is_visible(rect):
+            self.commands.append((layer, len(self.commands), _RECT, color, rect, None))
+    
+    def flush(self, surface, collect_rects=False):
+        """
+        Малювання всіх команд у порядку шарів
+        
+        Послідовні спрайти об'єднуються в один виклик Surface.blits.
+        
+        Returns:
+            list: Намальовані області (лише якщо collect_rects=True)
+        """
+        self.commands.sort(key=itemgetter(0, 1))
+        rects = []
+        batch = []
+        
+        for _, _, kind, data, position, area in self.commands:
+            if kind == _SPRITE:
+                batch.append((data, position, area))
+                continue
+            
+            # Прямокутник перериває пакет спрайтів
+            if batch:
+                self._blit_batch(surface, batch, rects, collect_rects)
+                batch = []
+            rect = surface.fill(data, position)
+            if collect_rects:
+                rects.append(rect)
+        
+        if batch:
+            self._blit_batch(surface, batch, rects, collect_rects)
+        
+        self.commands.clear()
+        return rects
+    
+    def _blit_batch(self, surface, batch, rects, collect_rects):
+        """Малювання пакету спрайтів одним викликом"""
+        self.batches += 1
+        if collect_rects:
+            rects.extend(surface.blits(batch))
+        else:
+            surface.blits(batch, doreturn=False)
+    
+    def get_stats(self):
+        """Статистика останнього кадру"""
+        return {
+            "submitted": self.submitted,
+            "culled": self.culled,
+            "drawn": self.submitted - self.culled,
+            "batches": self.batches
+        }
@@ -1,5 +1,11 @@
+import os
 import pygame
-from src.utils.constants import TILE_SIZE
+from src.engine.atlas import TextureAtlas
+from src.engine.render_queue import RenderQueue
+from src.engine.sprite_cache import SpriteCache
+from src.engine.text_cache import font_registry, render_text
+from src.engine.tilemap import ChunkedTileMap, get_tile_rows
+from src.utils.constants import TILE_SIZE, ATLAS_INDEX_FILE
 
 class Renderer:
     """Відповідає за рендеринг різних елементів гри"""
@@ -8,63 +14,189 @@ class Renderer:
         """Ініціалізація рендерера"""
         self.textures = {}  # Словник для зберігання текстур
         self.fonts = {}     # Словник для зберігання шрифтів
+        self.sprite_cache = SpriteCache()  # Кеш масштабованих і повернутих текстур
+        self.map_cache = None  # Попередньо намальована карта поточної сцени
+        self.atlas_regions = {}  # Назва текстури -> (сторінка атласу, прямокутник)
+        self.atlas_index = {}  # Ім'я файлу без розширення -> (сторінка атласу, прямокутник)
+        
+        # Пакетний рендеринг: поки черга активна, малювання відкладається до end_batch
+        self.render_queue = RenderQueue()
+        self.batching = False
+        
+        # Відстеження змінених областей екрану (режим dirty rectangles)
+        self.track_dirty = False
+        self.dirty_rects = []
     
     def load_texture(self, name, path):
-        """Завантаження текстури з файлу"""
-        try:
-            texture = pygame.image.load(path).convert_alpha()
+        """
+        Завантаження текстури з файлу
+        
+        Якщо файл запаковано в завантажений атлас (області атласу названі за
+        ім'ям файлу без розширення), текстура посилається на його область,
+        і PNG не читається.
+        """
+        region = self.atlas_index.get(os.path.splitext(os.path.basename(path))[0])
+        if region:
+            self.textures[name] = region[0].subsurface(region[1])
+            self.atlas_regions[name] = region
+        else:
+            try:
+                texture = pygame.image.load(path).convert_alpha()
+            except (pygame.error, FileNotFoundError):
+                print(f"Помилка завантаження текстури: {path}")
+                return False
             self.textures[name] = texture
-            return True
-        except pygame.error:
-            print(f"Помилка завантаження текстури: {path}")
+            self.atlas_regions.pop(name, None)
+        
+        self.sprite_cache.invalidate(name)
+        if self.map_cache and name.startswith("tile_"):
+            self.map_cache.invalidate()
+        return True
+    
+    def load_atlas(self, directory):
+        """Завантаження побудованого атласу текстур (якщо він існує)"""
+        if not os.path.exists(os.path.join(directory, ATLAS_INDEX_FILE)):
+            return False
+        atlas = TextureAtlas.load(directory)
+        if atlas is None:
             return False
+        
+        for name, (page_index, rect) in atlas.regions.items():
+            page = atlas.pages[page_index]
+            self.atlas_index[name] = (page, rect)
+            self.atlas_regions[name] = (page, rect)
+            # Підповерхня не копіює пікселі, а посилається на сторінку атласу
+            self.textures[name] = page.subsurface(rect)
+            self.sprite_cache.invalidate(name)
+        if self.map_cache:
+            self.map_cache.invalidate()
+        return True
     
     def load_font(self, name, path, size):
         """Завантаження шрифту"""
         try:
-            font = pygame.font.Font(path, size)
+            font = font_registry.get(path, size)
             self.fonts[name] = font
             return True
-        except pygame.error:
+        except (pygame.error, OSError):
             print(f"Помилка завантаження шрифту: {path}")
             # Використання стандартного шрифту, якщо не вдалося завантажити
-            self.fonts[name] = pygame.font.SysFont("Arial", size)
+            self.fonts[name] = font_registry.get_sys_font("Arial", size)
             return False
     
-    def draw_texture(self, surface, texture_name, position, scale=1.0, rotation=0):
-        """Малювання текстури на поверхні"""
+    def get_texture(self, name):
+        """Отримання текстури за назвою (None, якщо не завантажена)"""
+        return self.textures.get(name)
+    
+    def bake_map(self, tile_map, collision_grid=None):
+        """
+        Підготовка фрагментованої карти для швидкого рендерингу (фрагменти малюються при першій появі)
+        
+        Args:
+            tile_map: Дані карти
+            collision_grid: CollisionGrid, що оновлюється разом з тайлами в set_tile
+        """
+        self.map_cache = ChunkedTileMap(tile_map, collision_grid=collision_grid)
+        return self.map_cache
+    
+    def begin_batch(self, surface):
+        """Початок пакетного рендерингу (відсікання за межами поверхні)"""
+        self.render_queue.begin(surface.get_rect())
+        self.batching = True
+    
+    def end_batch(self, surface):
+        """Малювання всіх накопичених команд"""
+        self.batching = False
+        rects = self.render_queue.flush(surface, collect_rects=self.track_dirty)
+        if self.track_dirty:
+            self.dirty_rects.extend(rects)
+    
+    def take_dirty_rects(self):
+        """Отримання та очищення списку змінених областей"""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        return rects
+    
+    def draw_texture(self, surface, texture_name, position, scale=1.0, rotation=0, layer=0):
+        """Малювання текстури на поверхні (layer враховується лише в пакетному режимі)"""
         if texture_name in self.textures:
             texture = self.textures[texture_name]
+            region = self.atlas_regions.get(texture_name)
             
-            # Масштабування, якщо потрібно
-            if scale != 1.0:
-                original_size = texture.get_size()
-                new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
-                texture = pygame.transform.scale(texture, new_size)
+            if self.batching:
+                self._submit_texture(texture_name, texture, region, position, scale, rotation, layer)
+                return
             
-            # Поворот, якщо потрібно
-            if rotation != 0:
-                texture = pygame.transform.rotate(texture, rotation)
+            if scale != 1.0 or rotation != 0:
+                # Масштабування і поворот беруться з кешу
+                texture = self.sprite_cache.get(texture_name, texture, scale, rotation)
+                rect = surface.blit(texture, position)
+            elif region:
+                # Малювання області зі сторінки атласу
+                rect = surface.blit(region[0], position, region[1])
+            else:
+                rect = surface.blit(texture, position)
             
-            # Малювання
-            surface.blit(texture, position)
+            if self.track_dirty:
+                self.dirty_rects.append(rect)
+    
+    def _submit_texture(self, texture_name, texture, region, position, scale, rotation, layer):
+        """Додавання текстури до черги з відсіканням до трансформації"""
+        width, height = texture.get_size()
+        if scale != 1.0:
+            width *= scale
+            height *= scale
+        if rotation != 0:
+            # Повернутий спрайт не виходить за квадрат зі стороною w + h
+            width = height = width + height
+        
+        queue = self.render_queue
+        if not queue.is_visible((position[0], position[1], width, height)):
+            return
+        
+        if scale != 1.0 or rotation != 0:
+            texture = self.sprite_cache.get(texture_name, texture, scale, rotation)
+            queue.submit_sprite(texture, position, None, layer)
+        elif region:
+            queue.submit_sprite(region[0], position, region[1], layer)
+        else:
+            queue.submit_sprite(texture, position, None, layer)
+    
+    def draw_rect(self, surface, color, rect, layer=0):
+        """Малювання заповненого прямокутника"""
+        if self.batching:
+            self.render_queue.submit_rect(color, rect, layer)
+            return
+        rect = surface.fill(color, rect)
+        if self.track_dirty:
+            self.dirty_rects.append(rect)
     
     def draw_text(self, surface, text, font_name, position, color, centered=False):
         """Малювання тексту на поверхні"""
         if font_name in self.fonts:
             font = self.fonts[font_name]
-            text_surface = font.render(text, True, color)
+            text_surface = render_text(font, text, color)
             
             # Центрування тексту, якщо потрібно
             if centered:
                 text_rect = text_surface.get_rect(center=position)
-                surface.blit(text_surface, text_rect)
+                rect = surface.blit(text_surface, text_rect)
             else:
-                surface.blit(text_surface, position)
+                rect = surface.blit(text_surface, position)
+            
+            if self.track_dirty:
+                self.dirty_rects.append(rect)
     
     def draw_map(self, surface, tile_map, camera_offset=(0, 0)):
         """Малювання карти з плиток"""
-        for y, row in enumerate(tile_map.data):
+        # Швидкий шлях: лише видимі попередньо намальовані фрагменти
+        if self.map_cache and self.map_cache.source is tile_map:
+            rects = self.map_cache.draw(surface, self, camera_offset)
+            if self.track_dirty:
+                self.dirty_rects.extend(rects)
+            return
+        
+        for y, row in enumerate(get_tile_rows(tile_map)):
             for x, tile_id in enumerate(row):
                 if tile_id > 0:  # 0 зазвичай означає порожню клітинку
                     # Обчислення позиції плитки з урахуванням зміщення камери
@@ -0,0 +1,147 @@
+"""
+Запис і відтворення введення для детермінованих прогонів.
+Файл запису містить заголовок (сигнатура, версія, зерно ГВЧ, список дій)
+та компактні знімки введення для кожного кроку симуляції.
+"""
+
+import struct
+import argparse
+
+REPLAY_MAGIC = b"GRPL"
+REPLAY_VERSION = 1
+
+# Заголовок: сигнатура, версія, зерно генератора випадкових чисел, довжина списку дій
+_HEADER = struct.Struct("<4sHQH")
+# Знімок кроку: маска натиснутих дій, позиція миші (x, y), маска кнопок миші
+_SNAPSHOT = struct.Struct("<HhhB")
+
+# Зерно зберігається як беззнакове 64-бітне число
+SEED_MASK = (1 << 64) - 1
+
+
+def parse_seed(value):
+    """Перевірка зерна з командного рядка (беззнакове 64-бітне число, як у файлі запису)"""
+    seed = int(value)
+    if not 0 <= seed <= SEED_MASK:
+        raise argparse.ArgumentTypeError(f"зерно має бути від 0 до {SEED_MASK}")
+    return seed
+
+
+class InputRecorder:
+    """Запис знімків введення у файл по одному на крок симуляції"""
+    
+    def __init__(self, file, actions):
+        """Ініціалізація запису (файл уже відкритий, заголовок записаний)"""
+        self.file = file
+        self.actions = actions
+        self.ticks = 0
+    
+    @classmethod
+    def open(cls, path, seed, actions):
+        """
+        Створення файлу запису
+        
+        Args:
+            path: Шлях до файлу запису
+            seed: Зерно генератора випадкових чисел сесії (від 0 до SEED_MASK)
+            actions: Список назв дій у порядку бітів маски
+            
+        Returns:
+            InputRecorder: Об'єкт запису або None у випадку помилки
+        """
+        if not 0 <= seed <= SEED_MASK:
+            print(f"Зерно {seed} не вміщується в запис (потрібне число від 0 до {SEED_MASK})")
+            return None
+        names = ",".join(actions).encode("utf-8")
+        try:
+            file = open(path, "wb")
+            file.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, len(names)))
+            file.write(names)
+        except OSError as e:
+            print(f"Помилка створення запису {path}: {e}")
+            return None
+        return cls(file, list(actions))
+    
+    def record(self, snapshot):
+        """Запис знімка введення одного кроку"""
+        self.file.write(_SNAPSHOT.pack(*snapshot))
+        self.ticks += 1
+    
+    def close(self):
+        """Закриття файлу запису"""
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class InputReplay:
+    """Відтворення знімків введення з файлу запису"""
+    
+    def __init__(self, seed, actions, data):
+        """Ініціалізація відтворення"""
+        self.seed = seed
+        self.actions = actions
+        self.data = data
+        self.ticks = len(data) // _SNAPSHOT.size
+        self.position = 0  # Номер наступного кроку
+        self.keys = []  # Клавіші поточних прив'язок для кожного біта маски (див. bind)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Завантаження файлу запису
+        
+        Args:
+            path: Шлях до файлу запису
+            
+        Returns:
+            InputReplay: Об'єкт відтворення або None у випадку помилки
+        """
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except OSError as e:
+            print(f"Помилка читання запису {path}: {e}")
+            return None
+        
+        if len(data) < _HEADER.size:
+            print(f"Пошкоджений файл запису: {path}")
+            return None
+        
+        magic, version, seed, names_length = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            print(f"Непідтримуваний формат запису: {path}")
+            return None
+        
+        offset = _HEADER.size + names_length
+        names = data[_HEADER.size:offset].decode("utf-8")
+        return cls(seed, names.split(",") if names else [], data[offset:])
+    
+    def bind(self, key_map):
+        """
+        Зіставлення записаних дій з поточними прив'язками клавіш
+        
+        Біти маски відповідають діям у порядку запису, тож зміна порядку чи
+        складу key_map після запису не переплутає дії. Дії, яких немає
+        в поточних прив'язках, відтворити неможливо.
+        
+        Args:
+            key_map: Назва дії -> клавіша (InputHandler.key_map)
+            
+        Returns:
+            bool: False, якщо запис містить невідомі дії
+        """
+        missing = [action for action in self.actions if action not in key_map]
+        if missing:
+            print(f"Запис містить дії, яких немає в поточних прив'язках: {', '.join(missing)}")
+            return False
+        self.keys = [key_map[action] for action in self.actions]
+        return True
+    
+    def next_snapshot(self):
+        """Наступний знімок введення або None, якщо запис закінчився"""
+        if self.position >= self.ticks:
+            return None
+        snapshot = _SNAPSHOT.unpack_from(self.data, self.position * _SNAPSHOT.size)
+        self.position += 1
+        return snapshot
@@ -1,6 +1,7 @@
 import pygame
 import json
 import os
+from src.engine.profiler import NULL_PROFILER
 from src.utils.constants import MAP_PATH
 
 class Scene:
@@ -10,6 +11,9 @@ class Scene:
         """Ініціалізація сцени"""
         self.renderer = renderer
         self.entities = []  # Список сутностей на сцені
+        self.profiler = NULL_PROFILER  # Профайлер кадрів (встановлюється менеджером сцен)
+        # Сцена малює не лише через Renderer, тому в режимі dirty rectangles оновлюється весь екран
+        self.full_redraw = True
     
     def load(self):
         """Завантаження ресурсів сцени"""
@@ -23,14 +27,22 @@ class Scene:
         """Обробка введення користувача"""
         pass
     
+    def store_previous_state(self):
+        """Збереження стану перед кроком симуляції (для інтерполяції)"""
+        pass
+    
+    def needs_redraw(self):
+        """Чи змінилася сцена з моменту останнього рендерингу"""
+        return True
+    
     def update(self, delta_time):
         """Оновлення стану сцени"""
         # Оновлення всіх сутностей
         for entity in self.entities:
             entity.update(delta_time)
     
-    def render(self, surface):
-        """Рендеринг сцени"""
+    def render(self, surface, alpha=1.0):
+        """Рендеринг сцени (alpha - коефіцієнт інтерполяції між кроками)"""
         # Рендеринг всіх сутностей
         for entity in self.entities:
             entity.render(surface, self.renderer)
@@ -48,8 +60,14 @@ class GameplayScene(Scene):
         self.enemies = []
         self.items = []
         self.camera_offset = [0, 0]
+        self.previous_positions = {}  # Позиції сутностей до останнього кроку
+        self.previous_camera_offset = (0, 0)
+        self.entity_store = None  # Масиви гарячих полів сутностей сцени
         self.collision_system = None
+        self.physics_system = None
         self.ai_system = None
+        self.ai_scheduler = None
+        self.ai_worker = None  # Робочий процес AI (AI_WORKER_ENABLED)
     
     def load(self):
         """Завантаження ресурсів сцени"""
@@ -65,21 +83,34 @@ class GameplayScene(Scene):
         # TODO: Створення гравця, ворогів, предметів на основі даних карти
         from src.entities.player import Player
         from src.entities.enemy import Enemy
+        from src.entities.entity_store import EntityStore
         from src.systems.collision import CollisionSystem
+        from src.systems.physics import PhysicsSystem
         from src.systems.ai import AISystem
+        from src.systems.ai_scheduler import AIScheduler
         
         # Створення систем
+        self.entity_store = EntityStore(len(self.map_data.get("enemies", [])) + 1)
         self.collision_system = CollisionSystem(self.map_data)
-        self.ai_system = AISystem()
+        self.collision_system.profiler = self.profiler
+        self.physics_system = PhysicsSystem(self.collision_system)
+        self.ai_system = AISystem(self.collision_system)
+        self.ai_scheduler = AIScheduler(self.ai_system)
+        
+        # Карта малюється фрагментами при їх першій появі на екрані; зміни тайлів оновлюють
+        # і сітку зіткнень, якщо вона побудована з тих самих тайлів (без окремого collision_layer)
+        collision_grid = None if "collision_layer" in self.map_data else self.collision_system.grid
+        self.renderer.bake_map(self.map_data, collision_grid)
         
         # Створення гравця
         player_start = self.map_data.get("player_start", {"x": 100, "y": 100})
-        self.player = Player(player_start["x"], player_start["y"])
+        self.player = Player(player_start["x"], player_start["y"], store=self.entity_store)
         self.entities.append(self.player)
         
         # Створення ворогів
         for enemy_data in self.map_data.get("enemies", []):
-            enemy = Enemy(enemy_data["x"], enemy_data["y"], enemy_data.get("type", "basic"))
+            enemy = Enemy(enemy_data["x"], enemy_data["y"], enemy_data.get("type", "basic"),
+                          store=self.entity_store)
             self.enemies.append(enemy)
             self.entities.append(enemy)
         
@@ -88,25 +119,97 @@ class GameplayScene(Scene):
             enemy.set_ai_system(self.ai_system)
         
         self.player.set_collision_system(self.collision_system)
+        self.player.set_physics_system(self.physics_system)
         for enemy in self.enemies:
             enemy.set_collision_system(self.collision_system)
         
+        # Рішення AI в окремому процесі (без NumPy або спільної пам'яті - в основному процесі)
+        from src.utils.constants import AI_WORKER_ENABLED
+        if AI_WORKER_ENABLED:
+            from src.systems.ai_worker import AIWorker
+            try:
+                self.ai_worker = AIWorker(self.collision_system.grid, self.entity_store)
+            except (ImportError, OSError) as error:
+                print(f"Робочий процес AI недоступний: {error}")
+        
         return True
     
+    def unload(self):
+        """Вивантаження ресурсів сцени"""
+        if self.renderer.map_cache and self.renderer.map_cache.source is self.map_data:
+            self.renderer.map_cache = None
+        if self.ai_worker:
+            self.ai_worker.close()
+            self.ai_worker = None
+        # Ідентифікатори сутностей повертаються у сховище сцени, яке більше не використовується
+        for entity in self.entities:
+            entity.release()
+        self.entities = []
+        self.enemies = []
+        self.player = None
+        self.physics_system = None
+        self.previous_positions = {}
+        self.entity_store = None
+    
     def handle_input(self, input_handler):
         """Обробка введення користувача"""
         # Передаємо керування гравцю
         if self.player:
             self.player.handle_input(input_handler)
     
+    def store_previous_state(self):
+        """Збереження позицій сутностей і камери для інтерполяції"""
+        self.previous_positions = {entity: (entity.x, entity.y) for entity in self.entities}
+        self.previous_camera_offset = (self.camera_offset[0], self.camera_offset[1])
+    
+    def _remove_finished(self):
+        """Видалення сутностей, позначених should_remove, і звільнення їхніх ідентифікаторів"""
+        removed = [entity for entity in self.enemies if entity.should_remove]
+        if not removed:
+            return
+        self.enemies = [enemy for enemy in self.enemies if not enemy.should_remove]
+        self.entities = [entity for entity in self.entities if not getattr(entity, "should_remove", False)]
+        for entity in removed:
+            self.previous_positions.pop(entity, None)
+            entity.release()
+    
+    def _interpolate_position(self, entity, alpha):
+        """Інтерпольована позиція сутності між двома кроками симуляції"""
+        previous = self.previous_positions.get(entity)
+        if previous is None:
+            return entity.x, entity.y
+        return (previous[0] + (entity.x - previous[0]) * alpha,
+                previous[1] + (entity.y - previous[1]) * alpha)
+    
     def update(self, delta_time):
         """Оновлення стану сцени"""
         # Оновлення систем
-        if self.ai_system:
-            self.ai_system.update(self.player, self.enemies, delta_time)
+        from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+        view_rect = (self.camera_offset[0], self.camera_offset[1], SCREEN_WIDTH, SCREEN_HEIGHT)
+        if self.ai_worker:
+            with self.profiler.section("ai"):
+                # Рішення попереднього кроку застосовуються, поточний крок рахується паралельно
+                if not self.ai_worker.update(self.player, self.enemies, delta_time, view_rect):
+                    self.ai_worker = None
+        if self.ai_scheduler and not self.ai_worker:
+            with self.profiler.section("ai"):
+                # Планувальник розподіляє рішення ворогів між кроками за відстанню і видимістю
+                self.ai_scheduler.update(self.player, self.enemies, delta_time, view_rect)
+        
+        # AI переміщує ворогів напряму, тому broadphase оновлюється після нього
+        if self.collision_system:
+            with self.profiler.section("collision"):
+                self.collision_system.refresh()
+        
+        # Рух зареєстрованих фізичних тіл (гравця) одним пакетом за крок
+        if self.physics_system:
+            with self.profiler.section("physics"):
+                self.physics_system.update_bodies(delta_time)
         
         # Оновлення сутностей
-        super().update(delta_time)
+        with self.profiler.section("entities"):
+            super().update(delta_time)
+            self._remove_finished()
         
         # Оновлення положення камери відносно гравця
         if self.player:
@@ -114,22 +217,33 @@ class GameplayScene(Scene):
             self.camera_offset[0] = self.player.x - SCREEN_WIDTH // 2
             self.camera_offset[1] = self.player.y - SCREEN_HEIGHT // 2
     
-    def render(self, surface):
-        """Рендеринг сцени"""
+    def render(self, surface, alpha=1.0):
+        """Рендеринг сцени (alpha - коефіцієнт інтерполяції між кроками)"""
+        # Інтерпольоване зміщення камери
+        camera_x = self.previous_camera_offset[0] + (self.camera_offset[0] - self.previous_camera_offset[0]) * alpha
+        camera_y = self.previous_camera_offset[1] + (self.camera_offset[1] - self.previous_camera_offset[1]) * alpha
+        
         # Рендеринг карти
         if self.map_data:
-            self.renderer.draw_map(surface, self.map_data, self.camera_offset)
+            with self.profiler.section("map_draw"):
+                self.renderer.draw_map(surface, self.map_data, (camera_x, camera_y))
         
         # Рендеринг сутностей з урахуванням зміщення камери
-        for entity in self.entities:
-            pos_x = entity.x - self.camera_offset[0]
-            pos_y = entity.y - self.camera_offset[1]
-            entity.render(surface, self.renderer, (pos_x, pos_y))
+        # Сутності надсилають команди в чергу, яка відсікає невидимі спрайти і малює пакетом
+        with self.profiler.section("entity_draw"):
+            self.renderer.begin_batch(surface)
+            for entity in self.entities:
+                entity_x, entity_y = self._interpolate_position(entity, alpha)
+                pos_x = entity_x - camera_x
+                pos_y = entity_y - camera_y
+                entity.render(surface, self.renderer, (pos_x, pos_y))
+            self.renderer.end_batch(surface)
         
         # Рендеринг інтерфейсу
         from src.ui.hud import HUD
-        hud = HUD(self.player)
-        hud.render(surface, self.renderer)
+        with self.profiler.section("hud"):
+            hud = HUD(self.player)
+            hud.render(surface, self.renderer)
 
 
 class MainMenuScene(Scene):
@@ -140,6 +254,10 @@ class MainMenuScene(Scene):
         super().__init__(renderer)
         self.selected_option = 0
         self.options = ["Нова гра", "Налаштування", "Вихід"]
+        
+        # Меню малює лише через Renderer і змінюється тільки при виборі опції
+        self.full_redraw = False
+        self.dirty = True
     
     def load(self):
         """Завантаження ресурсів сцени"""
@@ -147,16 +265,21 @@ class MainMenuScene(Scene):
         self.renderer.load_texture("menu_background", "assets/textures/menu_bg.png")
         self.renderer.load_font("menu_title", None, 48)  # Використовуємо стандартний шрифт
         self.renderer.load_font("menu_option", None, 24)
+        self.dirty = True
         return True
     
     def handle_input(self, input_handler):
         """Обробка введення користувача"""
         # Навігація по меню
+        previous_option = self.selected_option
         if input_handler.is_key_pressed("up"):
             self.selected_option = (self.selected_option - 1) % len(self.options)
         elif input_handler.is_key_pressed("down"):
             self.selected_option = (self.selected_option + 1) % len(self.options)
         
+        if self.selected_option != previous_option:
+            self.dirty = True
+        
         # Вибір опції
         if input_handler.is_key_pressed("shoot"):
             if self.options[self.selected_option] == "Нова гра":
@@ -169,8 +292,14 @@ class MainMenuScene(Scene):
                 pygame.quit()
                 sys.exit()
     
-    def render(self, surface):
+    def needs_redraw(self):
+        """Меню перемальовується лише після зміни вибраної опції"""
+        return self.dirty
+    
+    def render(self, surface, alpha=1.0):
         """Рендеринг сцени"""
+        self.dirty = False
+        
         # Фон
         self.renderer.draw_texture(surface, "menu_background", (0, 0))
         
@@ -192,9 +321,12 @@ class SceneManager:
     def __init__(self):
         """Ініціалізація менеджера сцен"""
         from src.engine.renderer import Renderer
+        from src.utils.constants import ATLAS_PATH
         self.renderer = Renderer()
+        self.renderer.load_atlas(ATLAS_PATH)  # Атлас текстур, якщо його побудовано
         self.scenes = {}
         self.current_scene = None
+        self.profiler = NULL_PROFILER
         
         # Реєстрація сцен
         self.register_scenes()
@@ -204,6 +336,14 @@ class SceneManager:
         self.scenes["main_menu"] = MainMenuScene(self.renderer)
         # Ігрові рівні будуть додаватись динамічно
     
+    def set_profiler(self, profiler):
+        """Встановлення профайлера кадрів для всіх сцен"""
+        self.profiler = profiler
+        for scene in self.scenes.values():
+            scene.profiler = profiler
+        if self.current_scene:
+            self.current_scene.profiler = profiler
+    
     def load_scene(self, scene_name, **kwargs):
         """Завантаження сцени за ім'ям"""
         # Вивантаження поточної сцени, якщо вона є
@@ -215,6 +355,7 @@ class SceneManager:
             # Спеціальна обробка ігрової сцени з картою
             map_name = kwargs.get("map_name", "level1")
             scene = GameplayScene(self.renderer, map_name)
+            scene.profiler = self.profiler
             success = scene.load()
             if success:
                 self.current_scene = scene
@@ -0,0 +1,106 @@
+import pygame
+from collections import OrderedDict
+from src.utils.constants import SPRITE_CACHE_ANGLE_STEP, SPRITE_CACHE_MAX_BYTES
+
+class SpriteCache:
+    """LRU-кеш масштабованих і повернутих текстур"""
+    
+    def __init__(self, angle_step=SPRITE_CACHE_ANGLE_STEP, max_bytes=SPRITE_CACHE_MAX_BYTES):
+        """
+        Ініціалізація кешу
+        
+        Args:
+            angle_step: Крок квантування кута повороту в градусах
+            max_bytes: Максимальний обсяг пам'яті під кешовані поверхні
+        """
+        self.angle_step = angle_step
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()  # (назва, кут, масштаб) -> поверхня
+        self.sizes = {}  # (назва, кут, масштаб) -> розмір у байтах
+        self.size_bytes = 0
+        
+        # Лічильники для статистики
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def quantize_angle(self, rotation):
+        """Округлення кута до кроку кешу (у діапазоні 0..360)"""
+        return (round(rotation / self.angle_step) * self.angle_step) % 360
+    
+    def get(self, texture_name, texture, scale=1.0, rotation=0):
+        """
+        Отримання трансформованої текстури з кешу або її створення
+        
+        Args:
+            texture_name: Назва текстури (частина ключа кешу)
+            texture: Вихідна поверхня
+            scale: Масштаб
+            rotation: Кут повороту в градусах
+            
+        Returns:
+            pygame.Surface: Трансформована поверхня
+        """
+        angle = self.quantize_angle(rotation)
+        scale = round(scale, 2)
+        if angle == 0 and scale == 1.0:
+            return texture
+        
+        key = (texture_name, angle, scale)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = texture
+        
+        # Масштабування, якщо потрібно
+        if scale != 1.0:
+            original_size = texture.get_size()
+            new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
+            surface = pygame.transform.scale(surface, new_size)
+        
+        # Поворот, якщо потрібно
+        if angle != 0:
+            surface = pygame.transform.rotate(surface, angle)
+        
+        self._store(key, surface)
+        return surface
+    
+    def _store(self, key, surface):
+        """Збереження поверхні з витісненням найдавніше використаних"""
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.surfaces[key] = surface
+        self.sizes[key] = size
+        self.size_bytes += size
+        
+        while self.size_bytes > self.max_bytes and len(self.surfaces) > 1:
+            old_key, _ = self.surfaces.popitem(last=False)
+            self.size_bytes -= self.sizes.pop(old_key)
+            self.evictions += 1
+    
+    def invalidate(self, texture_name):
+        """Видалення з кешу всіх варіантів текстури (наприклад, після перезавантаження)"""
+        for key in [key for key in self.surfaces if key[0] == texture_name]:
+            del self.surfaces[key]
+            self.size_bytes -= self.sizes.pop(key)
+    
+    def clear(self):
+        """Повне очищення кешу"""
+        self.surfaces.clear()
+        self.sizes.clear()
+        self.size_bytes = 0
+    
+    def get_stats(self):
+        """Статистика кешу"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "bytes": self.size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0
+        }
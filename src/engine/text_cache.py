@@ -0,0 +1,104 @@
+"""
+Спільний кеш шрифтів і текстових поверхонь.
+Кожна пара (шрифт, розмір) створюється один раз, а однакові рядки тексту
+не рендеряться повторно, поки вони залишаються в LRU-кеші.
+"""
+
+import pygame
+from collections import OrderedDict
+from src.utils.constants import TEXT_CACHE_SIZE
+
+
+class FontRegistry:
+    """Реєстр шрифтів: кожна пара (шрифт, розмір) створюється лише один раз"""
+    
+    def __init__(self):
+        """Ініціалізація реєстру"""
+        self.fonts = {}  # (шлях або назва, розмір, системний) -> pygame.font.Font
+    
+    def get(self, path, size):
+        """
+        Отримання шрифту з файлу
+        
+        Args:
+            path: Шлях до файлу шрифту (None для стандартного шрифту)
+            size: Розмір шрифту
+            
+        Returns:
+            pygame.font.Font: Шрифт (pygame.error, якщо файл не вдалося завантажити)
+        """
+        key = (path, size, False)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+        return font
+    
+    def get_sys_font(self, name, size):
+        """Отримання системного шрифту за назвою"""
+        key = (name, size, True)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+
+class TextCache:
+    """LRU-кеш відрендерених текстових поверхонь"""
+    
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        """Ініціалізація кешу"""
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()  # (шрифт, текст, колір, згладжування) -> поверхня
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, font, text, color, antialias=True):
+        """
+        Отримання поверхні з текстом з кешу або її рендеринг
+        
+        Шрифти з реєстру унікальні для кожної пари (шрифт, розмір),
+        тому сам об'єкт шрифту є частиною ключа.
+        
+        Args:
+            font: Шрифт pygame
+            text: Текст
+            color: Колір тексту (RGB)
+            antialias: Згладжування
+            
+        Returns:
+            pygame.Surface: Поверхня з текстом
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Очищення кешу"""
+        self.surfaces.clear()
+
+
+# Спільні екземпляри для рендерера, HUD, меню та допоміжних функцій
+font_registry = FontRegistry()
+text_cache = TextCache()
+
+
+def get_font(path, size):
+    """Отримання шрифту зі спільного реєстру"""
+    return font_registry.get(path, size)
+
+
+def render_text(font, text, color, antialias=True):
+    """Рендеринг тексту через спільний кеш"""
+    return text_cache.render(font, text, color, antialias)
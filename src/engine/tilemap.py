@@ -0,0 +1,111 @@
+import pygame
+from collections import OrderedDict
+from src.utils.constants import TILE_SIZE, MAP_CHUNK_TILES, MAP_CHUNK_CACHE_SIZE
+
+def get_tile_rows(tile_map):
+    """Рядки тайлів карти (словник з полем "tiles" або об'єкт з атрибутом data)"""
+    if isinstance(tile_map, dict):
+        return tile_map.get("tiles", [])
+    return tile_map.data
+
+
+class ChunkedTileMap:
+    """Карта тайлів, попередньо намальована у поверхні-фрагменти (chunks)"""
+    
+    def __init__(self, tile_map, chunk_tiles=MAP_CHUNK_TILES, cache_size=MAP_CHUNK_CACHE_SIZE, collision_grid=None):
+        """
+        Ініціалізація фрагментованої карти
+        
+        Args:
+            tile_map: Дані карти (словник з полем "tiles" або об'єкт з атрибутом data)
+            chunk_tiles: Розмір фрагмента в тайлах (по кожній осі)
+            cache_size: Максимальна кількість намальованих фрагментів у пам'яті
+            collision_grid: CollisionGrid, побудована з цих тайлів (оновлюється в set_tile)
+        """
+        self.source = tile_map
+        self.collision_grid = collision_grid
+        self.rows = get_tile_rows(tile_map)
+        self.height = len(self.rows)
+        self.width = max((len(row) for row in self.rows), default=0)
+        
+        self.chunk_tiles = chunk_tiles
+        self.chunk_pixels = chunk_tiles * TILE_SIZE
+        self.chunks_x = (self.width + chunk_tiles - 1) // chunk_tiles
+        self.chunks_y = (self.height + chunk_tiles - 1) // chunk_tiles
+        
+        # Фрагменти малюються ліниво при першій появі на екрані
+        self.cache_size = cache_size
+        self.chunks = OrderedDict()  # (cx, cy) -> pygame.Surface
+        self.bakes = 0  # Кількість перемальовувань фрагментів (для статистики)
+    
+    def set_tile(self, x, y, tile_id):
+        """
+        Зміна тайлу з перемальовуванням лише його фрагмента
+        
+        Якщо карта пов'язана з сіткою зіткнень, тайл змінюється і в ній (tile_id > 0 - стіна).
+        Без сітки зміна лише візуальна.
+        """
+        self.rows[y][x] = tile_id
+        self.chunks.pop((x // self.chunk_tiles, y // self.chunk_tiles), None)
+        if self.collision_grid is not None:
+            self.collision_grid.set_tile(x, y, tile_id > 0)
+    
+    def invalidate(self):
+        """Скидання всіх фрагментів (наприклад, після перезавантаження текстур тайлів)"""
+        self.chunks.clear()
+    
+    def _bake_chunk(self, cx, cy, renderer):
+        """Малювання одного фрагмента карти в окрему поверхню"""
+        x0 = cx * self.chunk_tiles
+        y0 = cy * self.chunk_tiles
+        x1 = min(x0 + self.chunk_tiles, self.width)
+        y1 = min(y0 + self.chunk_tiles, self.height)
+        
+        chunk = pygame.Surface(((x1 - x0) * TILE_SIZE, (y1 - y0) * TILE_SIZE), pygame.SRCALPHA)
+        for y in range(y0, y1):
+            row = self.rows[y]
+            for x in range(x0, min(x1, len(row))):
+                tile_id = row[x]
+                if tile_id > 0:  # 0 зазвичай означає порожню клітинку
+                    texture = renderer.get_texture(f"tile_{tile_id}")
+                    if texture:
+                        chunk.blit(texture, ((x - x0) * TILE_SIZE, (y - y0) * TILE_SIZE))
+        
+        self.bakes += 1
+        return chunk
+    
+    def _get_chunk(self, cx, cy, renderer):
+        """Фрагмент з кешу або його малювання"""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self._bake_chunk(cx, cy, renderer)
+            self.chunks[key] = chunk
+            if len(self.chunks) > self.cache_size:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return chunk
+    
+    def draw(self, surface, renderer, camera_offset=(0, 0)):
+        """
+        Малювання видимих фрагментів карти
+        
+        Returns:
+            list: Області екрану, на які були намальовані фрагменти
+        """
+        camera_x, camera_y = camera_offset
+        
+        # Діапазон фрагментів, що перетинаються з прямокутником камери
+        cx0 = max(0, int(camera_x // self.chunk_pixels))
+        cy0 = max(0, int(camera_y // self.chunk_pixels))
+        cx1 = min(self.chunks_x - 1, int((camera_x + surface.get_width()) // self.chunk_pixels))
+        cy1 = min(self.chunks_y - 1, int((camera_y + surface.get_height()) // self.chunk_pixels))
+        
+        rects = []
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                chunk = self._get_chunk(cx, cy, renderer)
+                position = (cx * self.chunk_pixels - camera_x, cy * self.chunk_pixels - camera_y)
+                rects.append(surface.blit(chunk, position))
+        return rects
@@ -1,49 +1,108 @@
 import pygame
 import math
 import random
-from src.utils.constants import ENEMY_HEALTH, ENEMY_SPEED, ENEMY_DAMAGE, ENEMY_ATTACK_RATE
+from src.entities.entity_store import StoreField, entity_store
+from src.utils.constants import (ENEMY_BASE_HEALTH, ENEMY_BASE_SPEED, ENEMY_BASE_DAMAGE,
+                                 ENEMY_BASE_ATTACK_RATE, RENDER_LAYERS, ENEMY_STATES, ENEMY_TYPES,
+                                 ENEMY_ANIMATION_FRAMES)
+
+# Назва стану -> state_id
+ENEMY_STATE_IDS = {state: state_id for state_id, state in enumerate(ENEMY_STATES)}
+IDLE, PATROL, CHASE, ATTACK, HURT, DEAD = (ENEMY_STATE_IDS[state] for state in
+                                           ("idle", "patrol", "chase", "attack", "hurt", "dead"))
+
+# Множники характеристик для type_id: здоров'я, швидкість, шкода, дальність атаки, частота атак
+ENEMY_TYPE_STATS = (
+    (1, 1, 1, 50, 1),          # basic
+    (0.7, 1.5, 0.8, 40, 0.7),  # fast
+    (2, 0.7, 1.5, 60, 1.3),    # heavy
+)
+
+
+def _texture_keys(enemy_type):
+    """Ключі текстур типу ворога: [state_id][кадр]"""
+    return tuple(tuple(f"enemy_{enemy_type}_{state}_{frame}" for frame in range(ENEMY_ANIMATION_FRAMES))
+                 for state in ENEMY_STATES)
+
+
+# Назви типів за type_id, назва -> type_id і ключі текстур [type_id][state_id][кадр],
+# щоб не форматувати рядок кожен кадр
+ENEMY_TYPE_NAMES = list(ENEMY_TYPES)
+ENEMY_TYPE_IDS = {enemy_type: type_id for type_id, enemy_type in enumerate(ENEMY_TYPE_NAMES)}
+ENEMY_TEXTURES = [_texture_keys(enemy_type) for enemy_type in ENEMY_TYPE_NAMES]
+
+
+def enemy_type_id(enemy_type):
+    """type_id для назви типу (невідомий тип реєструється разом із ключами текстур)"""
+    type_id = ENEMY_TYPE_IDS.get(enemy_type)
+    if type_id is None:
+        type_id = ENEMY_TYPE_IDS[enemy_type] = len(ENEMY_TYPE_NAMES)
+        ENEMY_TYPE_NAMES.append(enemy_type)
+        ENEMY_TEXTURES.append(_texture_keys(enemy_type))
+    return type_id
+
 
 class Enemy:
     """Клас ворога"""
     
-    def __init__(self, x, y, enemy_type="basic"):
-        """Ініціалізація ворога"""
+    # Категорія зіткнень і категорії, з якими ворог може зіткнутися
+    collision_category = "enemy"
+    collision_mask = ("player", "projectile")
+    
+    # Гарячі поля зберігаються в EntityStore
+    x = StoreField()
+    y = StoreField()
+    width = StoreField()
+    height = StoreField()
+    velocity_x = StoreField()
+    velocity_y = StoreField()
+    direction = StoreField()
+    speed = StoreField()
+    health = StoreField()
+    damage = StoreField()
+    attack_range = StoreField()
+    attack_rate = StoreField()
+    attack_cooldown = StoreField()
+    state_id = StoreField()
+    type_id = StoreField()
+    idle_time = StoreField()
+    idle_duration = StoreField()
+    hurt_time = StoreField()
+    death_time = StoreField()
+    move_x = StoreField()
+    move_y = StoreField()
+    drift_x = StoreField()
+    drift_y = StoreField()
+    last_think = StoreField()
+    
+    def __init__(self, x, y, enemy_type="basic", store=None):
+        """
+        Ініціалізація ворога
+        
+        Args:
+            x, y: Початкова позиція
+            enemy_type: Тип ворога
+            store: Сховище компонентів (за замовчуванням спільне entity_store)
+        """
+        self.store = store if store is not None else entity_store
+        self.entity_id = self.store.allocate(self)
         self.x = x
         self.y = y
         self.width = 32  # Ширина спрайту
         self.height = 32  # Висота спрайту
-        self.type = enemy_type
+        self.type_id = enemy_type_id(enemy_type)
         self.direction = 0  # Кут напрямку (в радіанах)
         
-        # Характеристики відповідно до типу
-        if enemy_type == "basic":
-            self.health = ENEMY_HEALTH
-            self.speed = ENEMY_SPEED
-            self.damage = ENEMY_DAMAGE
-            self.attack_range = 50
-            self.attack_rate = ENEMY_ATTACK_RATE
-        elif enemy_type == "fast":
-            self.health = ENEMY_HEALTH * 0.7
-            self.speed = ENEMY_SPEED * 1.5
-            self.damage = ENEMY_DAMAGE * 0.8
-            self.attack_range = 40
-            self.attack_rate = ENEMY_ATTACK_RATE * 0.7
-        elif enemy_type == "heavy":
-            self.health = ENEMY_HEALTH * 2
-            self.speed = ENEMY_SPEED * 0.7
-            self.damage = ENEMY_DAMAGE * 1.5
-            self.attack_range = 60
-            self.attack_rate = ENEMY_ATTACK_RATE * 1.3
-        else:
-            # За замовчуванням - базовий ворог
-            self.health = ENEMY_HEALTH
-            self.speed = ENEMY_SPEED
-            self.damage = ENEMY_DAMAGE
-            self.attack_range = 50
-            self.attack_rate = ENEMY_ATTACK_RATE
+        # Характеристики відповідно до типу (невідомий тип - базовий ворог)
+        stats = ENEMY_TYPE_STATS[self.type_id] if self.type_id < len(ENEMY_TYPE_STATS) else ENEMY_TYPE_STATS[0]
+        health_scale, speed_scale, damage_scale, self.attack_range, rate_scale = stats
+        self.health = ENEMY_BASE_HEALTH * health_scale
+        self.speed = ENEMY_BASE_SPEED * speed_scale
+        self.damage = ENEMY_BASE_DAMAGE * damage_scale
+        self.attack_rate = ENEMY_BASE_ATTACK_RATE * rate_scale
         
         self.max_health = self.health
-        self.state = "idle"  # Початковий стан
+        self.state_id = IDLE  # Початковий стан
         self.ai_system = None
         self.collision_system = None
         
@@ -61,11 +120,27 @@ class Enemy:
         
         # Для AI
         self.last_seen_player_pos = None
+        self.path = []  # Точки маршруту до path_target (з HierarchicalPathfinder)
+        self.path_target = None
         self.should_remove = False
         
         # Анімація
         self.animation_frame = 0
     
+    @property
+    def state(self):
+        """Назва поточного стану (зберігається як state_id; для налагодження і зовнішнього коду)"""
+        return ENEMY_STATES[self.state_id]
+    
+    @state.setter
+    def state(self, value):
+        self.state_id = ENEMY_STATE_IDS[value]
+    
+    @property
+    def type(self):
+        """Назва типу ворога (зберігається як type_id)"""
+        return ENEMY_TYPE_NAMES[self.type_id]
+    
     def generate_patrol_points(self):
         """Генерація точок патрулювання"""
         # В реальній грі це може бути визначено в даних рівня
@@ -95,12 +170,12 @@ class Enemy:
             self.die()
         else:
             # Перехід до стану отримання шкоди
-            self.state = "hurt"
+            self.state_id = HURT
             self.hurt_time = 0.3  # 300 мс стану отримання шкоди
     
     def die(self):
         """Смерть ворога"""
-        self.state = "dead"
+        self.state_id = DEAD
         self.health = 0
         # Якщо є система зіткнень, відключаємо зіткнення
         if self.collision_system:
@@ -110,7 +185,20 @@ class Enemy:
         """Оновлення стану ворога"""
         # Оновлення анімації
         self.animation_frame += delta_time * 8
-        self.animation_frame %= 4  # Припускаємо 4 кадри анімації
+        self.animation_frame %= ENEMY_ANIMATION_FRAMES
+        
+        # AI не оновлює загиблих ворогів, тому анімація смерті відлічується тут
+        if self.state_id == DEAD and not self.should_remove:
+            self.death_time -= delta_time
+            if self.death_time <= 0:
+                # Позначаємо ворога для видалення зі сцени
+                self.should_remove = True
+    
+    def release(self):
+        """Видалення ворога з систем і звільнення його ідентифікатора в сховищі"""
+        if self.collision_system:
+            self.collision_system.unregister_entity(self)
+        self.store.release(self.entity_id)
     
     def render(self, surface, renderer, position=None):
         """Рендеринг ворога"""
@@ -118,20 +206,27 @@ class Enemy:
             position = (self.x, self.y)
         
         # Вибір текстури відповідно до типу і стану
-        texture_name = f"enemy_{self.type}_{self.state}_{int(self.animation_frame)}"
+        texture_name = ENEMY_TEXTURES[self.type_id][self.state_id][int(self.animation_frame)]
         
         # Відображення ворога з поворотом відповідно до напрямку
-        renderer.draw_texture(surface, texture_name, position, rotation=-math.degrees(self.direction))
+        renderer.draw_texture(surface, texture_name, position, rotation=-math.degrees(self.direction),
+                              layer=RENDER_LAYERS["enemies"])
         
         # Відображення шкали здоров'я
         health_width = 30 * (self.health / self.max_health)
-        pygame.draw.rect(surface, (255, 0, 0), (position[0] - 15, position[1] - 20, 30, 5))
-        pygame.draw.rect(surface, (0, 255, 0), (position[0] - 15, position[1] - 20, health_width, 5))
+        renderer.draw_rect(surface, (255, 0, 0), (position[0] - 15, position[1] - 20, 30, 5),
+                           layer=RENDER_LAYERS["overlay"])
+        renderer.draw_rect(surface, (0, 255, 0), (position[0] - 15, position[1] - 20, health_width, 5),
+                           layer=RENDER_LAYERS["overlay"])
     
     def on_collision(self, other):
         """Обробка зіткнень з іншими об'єктами"""
-        from src.entities.player import Player
+        if self.collision_system:
+            category = self.collision_system.category_of(other)
+        else:
+            category = getattr(other, "collision_category", None)
+        
         # Реакція на зіткнення з гравцем
-        if isinstance(other, Player) and self.state != "dead":
+        if category == "player" and self.state_id != DEAD:
             # Можна додати додаткову логіку при контакті з гравцем
             pass
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Сховище гарячих полів сутностей у форматі "структура масивів".
+Координати, розміри, швидкості, здоров'я, стан і таймери всіх сутностей
+зберігаються в суцільних масивах за ідентифікатором сутності, тому системи
+можуть обробляти їх цілими масивами NumPy, а об'єкти Player і Enemy
+лишаються тонкими обгортками з тим самим API.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього системи працюють з масивами array поелементно
+    np = None
+
+
+# Поля сховища: назва -> код типу array ('d' - float64, 'i' - int32)
+ENTITY_FIELDS = {
+    "x": "d",
+    "y": "d",
+    "width": "d",
+    "height": "d",
+    "velocity_x": "d",
+    "velocity_y": "d",
+    "direction": "d",
+    "speed": "d",
+    "health": "d",
+    "damage": "d",
+    "attack_range": "d",
+    "attack_rate": "d",
+    "attack_cooldown": "d",
+    "state_id": "i",
+    "type_id": "i",
+    "idle_time": "d",
+    "idle_duration": "d",
+    "hurt_time": "d",
+    "death_time": "d",
+    "move_x": "d",  # Швидкість за останнім рішенням AI (рух між рішеннями)
+    "move_y": "d",
+    "drift_x": "d",  # Зміщення, накопичене між рішеннями AI
+    "drift_y": "d",
+    "last_think": "i",  # Крок планувальника AI, на якому ворог востаннє приймав рішення
+}
+
+
+class EntityStore:
+    """Сховище компонентів сутностей: один масив на поле, індекс - ідентифікатор сутності"""
+    
+    def __init__(self, capacity=64):
+        """
+        Ініціалізація сховища
+        
+        Args:
+            capacity: Початкова кількість місць (масиви подвоюються при заповненні)
+        """
+        self.capacity = capacity
+        self.size = 0  # Найбільший виданий ідентифікатор + 1
+        self.columns = {name: array(typecode, bytes(array(typecode).itemsize * capacity))
+                        for name, typecode in ENTITY_FIELDS.items()}
+        self.owners = [None] * capacity  # ідентифікатор -> об'єкт сутності
+        self.free_ids = []  # Звільнені ідентифікатори для повторного використання
+    
+    def __len__(self):
+        return self.size - len(self.free_ids)
+    
+    def allocate(self, owner):
+        """
+        Виділення ідентифікатора для сутності (усі поля обнуляються)
+        
+        Returns:
+            int: Ідентифікатор сутності
+        """
+        if self.free_ids:
+            entity_id = self.free_ids.pop()
+        else:
+            if self.size == self.capacity:
+                self._grow()
+            entity_id = self.size
+            self.size += 1
+        
+        for column in self.columns.values():
+            column[entity_id] = 0
+        self.owners[entity_id] = owner
+        return entity_id
+    
+    def release(self, entity_id):
+        """Звільнення ідентифікатора сутності"""
+        if self.owners[entity_id] is not None:
+            self.owners[entity_id] = None
+            self.free_ids.append(entity_id)
+    
+    def _grow(self):
+        """
+        Подвоєння місткості
+        
+        Створюються нові масиви, а не розширюються старі: на старі можуть
+        посилатися подання NumPy, які не дозволяють змінювати розмір буфера.
+        """
+        extra = max(self.capacity, 1)
+        for name, column in self.columns.items():
+            grown = array(column.typecode, column)
+            grown.frombytes(bytes(column.itemsize * extra))
+            self.columns[name] = grown
+        self.owners.extend([None] * extra)
+        self.capacity += extra
+    
+    def view(self, name):
+        """
+        Подання поля для векторизованої обробки
+        
+        Returns:
+            Масив NumPy довжиною size без копіювання (або сам array без NumPy).
+            Подання залишається дійсним до наступного виділення ідентифікатора.
+        """
+        column = self.columns[name]
+        if np is None:
+            return column
+        return np.frombuffer(column, dtype=column.typecode)[:self.size]
+    
+    def ids_of(self, entities):
+        """Масив ідентифікаторів для списку сутностей (список без NumPy)"""
+        if np is None:
+            return [entity.entity_id for entity in entities]
+        return np.fromiter((entity.entity_id for entity in entities), dtype=np.int64, count=len(entities))
+
+
+class StoreField:
+    """Дескриптор атрибута сутності, що читає і записує поле сховища"""
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, entity, owner=None):
+        if entity is None:
+            return self
+        return entity.store.columns[self.name][entity.entity_id]
+    
+    def __set__(self, entity, value):
+        entity.store.columns[self.name][entity.entity_id] = value
+
+
+# Спільне сховище для сутностей, створених без явного сховища
+entity_store = EntityStore()
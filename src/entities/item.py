@@ -1,9 +1,14 @@
 import pygame
 import math
+from src.utils.constants import RENDER_LAYERS
 
 class Item:
     """Базовий клас для предметів, які можна підібрати"""
     
+    # Категорія зіткнень і категорії, з якими предмет може зіткнутися
+    collision_category = "item"
+    collision_mask = ("player",)
+    
     def __init__(self, x, y, item_type="health"):
         """Ініціалізація предмета"""
         self.x = x
@@ -56,6 +61,10 @@ class Item:
         if self.collision_system:
             self.collision_system.unregister_entity(self)
     
+    def on_collision(self, other):
+        """Обробка зіткнень (підбір обробляє гравець)"""
+        pass
+    
     def render(self, surface, renderer, position=None):
         """Рендеринг предмета"""
         if not self.is_active:
@@ -71,7 +80,8 @@ class Item:
         texture_name = f"item_{self.type}"
         
         # Відображення предмета з обертанням
-        renderer.draw_texture(surface, texture_name, position, rotation=self.rotation)
+        renderer.draw_texture(surface, texture_name, position, rotation=self.rotation,
+                              layer=RENDER_LAYERS["items"])
 
 
 class Weapon:
@@ -180,4 +190,5 @@ class Weapon:
         texture_name = f"weapon_{self.type}"
         
         # Відображення зброї з поворотом відповідно до напрямку
-        renderer.draw_texture(surface, texture_name, (weapon_x, weapon_y), rotation=-math.degrees(direction))
\ No newline at end of file
+        renderer.draw_texture(surface, texture_name, (weapon_x, weapon_y), rotation=-math.degrees(direction),
+                              layer=RENDER_LAYERS["weapons"])
\ No newline at end of file
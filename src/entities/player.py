@@ -1,12 +1,38 @@
 import pygame
 import math
-from src.utils.constants import PLAYER_SPEED, PLAYER_HEALTH, PLAYER_ATTACK_RATE
+from src.entities.entity_store import StoreField, entity_store
+from src.utils.constants import PLAYER_SPEED, PLAYER_HEALTH, PLAYER_ATTACK_RATE, RENDER_LAYERS, TICK_RATE
 
 class Player:
     """Клас гравця"""
     
-    def __init__(self, x, y):
-        """Ініціалізація гравця"""
+    # Категорія зіткнень і категорії, з якими гравець може зіткнутися
+    collision_category = "player"
+    collision_mask = ("enemy", "item", "projectile")
+    
+    # Гарячі поля зберігаються в EntityStore
+    x = StoreField()
+    y = StoreField()
+    width = StoreField()
+    height = StoreField()
+    velocity_x = StoreField()
+    velocity_y = StoreField()
+    direction = StoreField()
+    speed = StoreField()
+    health = StoreField()
+    attack_rate = StoreField()
+    attack_cooldown = StoreField()
+    
+    def __init__(self, x, y, store=None):
+        """
+        Ініціалізація гравця
+        
+        Args:
+            x, y: Початкова позиція
+            store: Сховище компонентів (за замовчуванням спільне entity_store)
+        """
+        self.store = store if store is not None else entity_store
+        self.entity_id = self.store.allocate(self)
         self.x = x
         self.y = y
         self.width = 32  # Ширина спрайту
@@ -21,6 +47,7 @@ class Player:
         self.weapons = []
         self.current_weapon = None
         self.collision_system = None
+        self.physics_system = None
         self.animation_state = "idle"  # Стан анімації
         self.animation_frame = 0  # Кадр анімації
     
@@ -29,6 +56,11 @@ class Player:
         self.collision_system = collision_system
         collision_system.register_entity(self)
     
+    def set_physics_system(self, physics_system):
+        """Встановлення системи фізики (рух гравця виконує її пакетне оновлення)"""
+        self.physics_system = physics_system
+        physics_system.register_body(self)
+    
     def handle_input(self, input_handler):
         """Обробка введення користувача"""
         # Рух гравця
@@ -54,7 +86,11 @@ class Player:
             self.animation_state = "idle"
         
         # Застосування швидкості
-        if self.collision_system:
+        if self.physics_system:
+            # Переміщує система фізики на кроці сцени (speed - пікселів за крок, швидкість - за секунду)
+            self.velocity_x = move_x * self.speed * TICK_RATE
+            self.velocity_y = move_y * self.speed * TICK_RATE
+        elif self.collision_system:
             self.collision_system.resolve_movement(self, move_x * self.speed, move_y * self.speed)
         else:
             self.x += move_x * self.speed
@@ -87,6 +123,14 @@ class Player:
         self.animation_frame += delta_time * 10  # 10 FPS для анімації
         self.animation_frame %= 4  # Припускаємо 4 кадри анімації
     
+    def release(self):
+        """Видалення гравця з систем і звільнення його ідентифікатора в сховищі"""
+        if self.physics_system:
+            self.physics_system.unregister_body(self)
+        if self.collision_system:
+            self.collision_system.unregister_entity(self)
+        self.store.release(self.entity_id)
+    
     def take_damage(self, amount):
         """Отримання шкоди"""
         self.health -= amount
@@ -114,7 +158,8 @@ class Player:
         texture_name = f"player_{self.animation_state}_{int(self.animation_frame)}"
         
         # Відображення гравця з поворотом відповідно до напрямку
-        renderer.draw_texture(surface, texture_name, position, rotation=-math.degrees(self.direction))
+        renderer.draw_texture(surface, texture_name, position, rotation=-math.degrees(self.direction),
+                              layer=RENDER_LAYERS["player"])
         
         # Відображення зброї
         if self.current_weapon:
@@ -122,6 +167,9 @@ class Player:
     
     def on_collision(self, other):
         """Обробка зіткнень з іншими об'єктами"""
-        from src.entities.item import Item
-        if isinstance(other, Item):
+        if self.collision_system:
+            category = self.collision_system.category_of(other)
+        else:
+            category = getattr(other, "collision_category", None)
+        if category == "item":
             other.pickup(self)
\ No newline at end of file
@@ -1,62 +1,298 @@
 import math
 import random
-from src.utils.constants import ENEMY_VIEW_DISTANCE
+from src.systems.flow_field import FlowField
+from src.systems.line_of_sight import LineOfSight
+from src.systems.pathfinding import HierarchicalPathfinder
+from src.systems.separation import SeparationSteering
+from src.entities.enemy import IDLE, PATROL, CHASE, ATTACK, HURT, DEAD
+from src.utils.constants import ENEMY_VIEW_DISTANCE, AI_BATCH_THRESHOLD
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього AI завжди оновлюється поелементно
+    np = None
+
+# Переходи за видимістю гравця для кожного state_id:
+# (бачить у межах атаки, бачить далі, не бачить)
+SIGHT_TRANSITIONS = {
+    IDLE: (ATTACK, CHASE, IDLE),
+    PATROL: (ATTACK, CHASE, PATROL),
+    CHASE: (ATTACK, CHASE, PATROL),  # Втративши гравця з виду, повертається до патрулювання
+    ATTACK: (ATTACK, ATTACK, ATTACK),
+    HURT: (HURT, HURT, HURT),
+    DEAD: (DEAD, DEAD, DEAD),
+}
+SIGHT_TRANSITIONS = tuple(SIGHT_TRANSITIONS[state_id] for state_id in sorted(SIGHT_TRANSITIONS))
+SIGHT_TRANSITION_TABLE = np.array(SIGHT_TRANSITIONS) if np is not None else None
 
 class AISystem:
     """Система штучного інтелекту для ворогів"""
     
-    def __init__(self):
-        """Ініціалізація системи AI"""
+    def __init__(self, collision_system=None):
+        """
+        Ініціалізація системи AI
+        
+        Args:
+            collision_system: Система зіткнень для просторових запитів (без неї відстані рахуються для кожного ворога)
+        """
+        self.collision_system = collision_system
+        self.line_of_sight = LineOfSight(collision_system.grid) if collision_system else None
+        self.flow_field = FlowField(collision_system.grid) if collision_system else None
+        self.pathfinder = HierarchicalPathfinder(collision_system.grid) if collision_system else None
+        self.separation = SeparationSteering(collision_system.grid if collision_system else None)
+        self.enemies_in_view = None  # Вороги в радіусі огляду від гравця на поточному кроці
         self.patrolling_enemies = []  # Вороги в режимі патрулювання
         self.chasing_enemies = []     # Вороги, що переслідують гравця
         self.attacking_enemies = []   # Вороги, що атакують гравця
         
-        # Різні стани ворогів
-        self.states = {
-            "idle": self._update_idle,
-            "patrol": self._update_patrol,
-            "chase": self._update_chase,
-            "attack": self._update_attack,
-            "hurt": self._update_hurt,
-            "dead": self._update_dead
-        }
+        # Обробники станів за state_id
+        self.state_handlers = [None] * len(SIGHT_TRANSITIONS)
+        self.state_handlers[IDLE] = self._update_idle
+        self.state_handlers[PATROL] = self._update_patrol
+        self.state_handlers[CHASE] = self._update_chase
+        self.state_handlers[ATTACK] = self._update_attack
+        self.state_handlers[HURT] = self._update_hurt
+        self.state_handlers[DEAD] = self._update_dead
     
     def update(self, player, enemies, delta_time):
         """Оновлення AI всіх ворогів"""
+        # Поле напрямків перебудовується лише після переходу гравця на інший тайл
+        if self.flow_field:
+            self.flow_field.update(player.x, player.y)
+        
+        # Великі натовпи з одного EntityStore оновлюються масивами
+        if np is not None and len(enemies) >= AI_BATCH_THRESHOLD and self._shares_store(enemies):
+            self._update_batch(player, enemies, delta_time)
+            return
+        
+        # Один запит до broadphase замість перевірки відстані кожного ворога
+        # (для невеликих груп, наприклад пакетів планувальника, відстані дешевше порахувати напряму)
+        self.enemies_in_view = None
+        if self.collision_system and len(enemies) >= AI_BATCH_THRESHOLD:
+            self.enemies_in_view = set(self.collision_system.query_radius(
+                player.x, player.y, ENEMY_VIEW_DISTANCE, categories=("enemy",)))
+        
+        handlers = self.state_handlers
         for enemy in enemies:
-            if enemy.state == "dead":
+            state = enemy.state_id
+            if state == DEAD:
                 # Пропускаємо мертвих ворогів
                 continue
             
-            # Перевірка, чи бачить ворог гравця
-            can_see_player = self._can_see_player(enemy, player)
-            
             # Оновлення стану ворога на основі видимості гравця
-            if enemy.state != "hurt" and enemy.state != "attack":
-                if can_see_player:
-                    distance_to_player = self._calculate_distance(enemy, player)
-                    if distance_to_player < enemy.attack_range:
-                        enemy.state = "attack"
-                    else:
-                        enemy.state = "chase"
-                elif enemy.state == "chase":
-                    # Якщо втратив гравця з виду, повертається до патрулювання
+            seen_near, seen_far, unseen = SIGHT_TRANSITIONS[state]
+            if self._can_see_player(enemy, player):
+                if seen_near == seen_far or self._calculate_distance(enemy, player) < enemy.attack_range:
+                    new_state = seen_near
+                else:
+                    new_state = seen_far
+            else:
+                new_state = unseen
+                if new_state != state:
+                    # Втратив гравця з виду - запам'ятовує, де бачив його востаннє
                     enemy.last_seen_player_pos = (player.x, player.y)
-                    enemy.state = "patrol"
+            if new_state != state:
+                enemy.state_id = new_state
             
             # Оновлення поведінки відповідно до стану
-            if enemy.state in self.states:
-                self.states[enemy.state](enemy, player, delta_time)
+            handlers[new_state](enemy, player, delta_time)
+    
+    def separate(self, enemies, delta_time):
+        """
+        Розштовхування ворогів, що переслідують або атакують гравця
+        
+        Викликається раз на крок для всього списку ворогів (не для пакетів
+        планувальника), щоб сусіди шукалися серед усіх живих ворогів.
+        """
+        if not enemies:
+            return
+        if np is not None and len(enemies) >= AI_BATCH_THRESHOLD and self._shares_store(enemies):
+            store = enemies[0].store
+            ids = store.ids_of(enemies)
+            state = store.view("state_id")[ids]
+            steered = np.flatnonzero((state == CHASE) | (state == ATTACK))
+            self.separation.apply_batch(store, ids, state != DEAD, steered, delta_time)
+            return
+        steered = [index for index, enemy in enumerate(enemies) if enemy.state_id in (CHASE, ATTACK)]
+        self.separation.apply(enemies, steered, delta_time)
+    
+    def _shares_store(self, enemies):
+        """Чи зберігаються всі вороги в одному EntityStore"""
+        store = getattr(enemies[0], "store", None)
+        return store is not None and all(getattr(enemy, "store", None) is store for enemy in enemies)
+    
+    def _update_batch(self, player, enemies, delta_time):
+        """
+        Векторизоване оновлення всіх ворогів
+        
+        Повторює поелементний шлях: спочатку переходи за видимістю гравця, потім
+        рівно один обробник стану для кожного ворога. Відстані, маски станів і рух
+        рахуються масивами NumPy над полями EntityStore; у циклі Python лишаються
+        тільки рідкісні події (атака, втрата гравця з виду) і вибір точок патрулювання.
+        """
+        store = enemies[0].store
+        ids = store.ids_of(enemies)
+        x = store.view("x")
+        y = store.view("y")
+        speed = store.view("speed")[ids] * delta_time
+        attack_range = store.view("attack_range")[ids]
+        state = store.view("state_id")[ids]
+        alive = state != DEAD
+        
+        # Відстані до гравця і видимість (ті самі формули, що й у поелементному шляху)
+        enemy_x = x[ids]
+        enemy_y = y[ids]
+        dx = player.x - enemy_x
+        dy = player.y - enemy_y
+        distance_sq = dx * dx + dy * dy
+        distance = np.sqrt(distance_sq)
+        visible = alive & (distance_sq <= ENEMY_VIEW_DISTANCE * ENEMY_VIEW_DISTANCE)
+        if self.line_of_sight:
+            in_view = np.flatnonzero(visible)
+            visible[in_view] = self.line_of_sight.can_see_many(enemy_x[in_view], enemy_y[in_view],
+                                                               player.x, player.y)
+        
+        # Переходи за видимістю гравця
+        in_range = distance < attack_range
+        transitions = SIGHT_TRANSITION_TABLE[state]
+        new_state = np.where(visible, np.where(in_range, transitions[:, 0], transitions[:, 1]), transitions[:, 2])
+        lost = ~visible & (new_state != state)
+        state = new_state.astype(state.dtype)
+        for index in np.flatnonzero(lost).tolist():
+            enemies[index].last_seen_player_pos = (player.x, player.y)
+        
+        # Обробники станів (маски беруться до змін, тож кожен ворог обробляється один раз)
+        idle = np.flatnonzero(state == IDLE)
+        patrol = np.flatnonzero(state == PATROL)
+        chase = np.flatnonzero(state == CHASE)
+        attack = np.flatnonzero(state == ATTACK)
+        hurt = np.flatnonzero(state == HURT)
+        
+        if len(idle):
+            self._batch_idle(store, ids[idle], idle, state, delta_time)
+        if len(patrol):
+            self._batch_patrol(store, enemies, ids, patrol, state, speed, delta_time)
+        
+        direction = store.view("direction")
+        if len(chase):
+            far = distance[chase] > attack_range[chase]
+            moving = chase[far]
+            move_x, move_y, move_distance = dx[moving], dy[moving], distance[moving]
+            if self.flow_field:
+                # Крок до центру наступного тайла поля напрямків (без нього - прямо до гравця)
+                half_width = store.view("width")[ids[moving]] / 2
+                half_height = store.view("height")[ids[moving]] / 2
+                center_x = enemy_x[moving] + half_width
+                center_y = enemy_y[moving] + half_height
+                waypoint_x, waypoint_y, found = self.flow_field.next_waypoints(center_x, center_y)
+                to_x = waypoint_x - center_x
+                to_y = waypoint_y - center_y
+                to_distance = np.sqrt(to_x * to_x + to_y * to_y)
+                found &= to_distance > 0
+                move_x = np.where(found, to_x, move_x)
+                move_y = np.where(found, to_y, move_y)
+                move_distance = np.where(found, to_distance, move_distance)
+            moving_ids = ids[moving]
+            x[moving_ids] = enemy_x[moving] + (move_x / move_distance) * speed[moving]
+            y[moving_ids] = enemy_y[moving] + (move_y / move_distance) * speed[moving]
+            state[chase[~far]] = ATTACK
+            direction[ids[chase]] = np.arctan2(dy[chase], dx[chase])
+        
+        if len(attack):
+            direction[ids[attack]] = np.arctan2(dy[attack], dx[attack])
+            out_of_range = distance[attack] > attack_range[attack]
+            state[attack[out_of_range]] = CHASE
+            self._batch_attack(store, player, ids[attack[~out_of_range]], delta_time)
+        
+        if len(hurt):
+            hurt_time = store.view("hurt_time")
+            hurt_ids = ids[hurt]
+            hurt_time[hurt_ids] -= delta_time
+            recovered = hurt[hurt_time[hurt_ids] <= 0]
+            state[recovered] = np.where(visible[recovered], CHASE, PATROL)
+        
+        store.view("state_id")[ids] = state
+    
+    def _batch_idle(self, store, idle_ids, idle, state, delta_time):
+        """Пакетний стан спокою: накопичення часу і перехід до патрулювання"""
+        idle_time = store.view("idle_time")
+        elapsed = idle_time[idle_ids] + delta_time
+        rested = elapsed > store.view("idle_duration")[idle_ids]
+        elapsed[rested] = 0
+        idle_time[idle_ids] = elapsed
+        state[idle[rested]] = PATROL
+    
+    def _batch_patrol(self, store, enemies, ids, patrol, state, speed, delta_time):
+        """Пакетне патрулювання: цілі й маршрути вибираються по одному, рух рахується векторно"""
+        waypoints = []
+        walking = []
+        for index in patrol.tolist():
+            enemy = enemies[index]
+            target = self._patrol_target(enemy)
+            if target is None:
+                state[index] = IDLE
+                continue
+            
+            # Досягнута ціль: наступна точка і відпочинок
+            dx = target[0] - enemy.x
+            dy = target[1] - enemy.y
+            if math.sqrt(dx * dx + dy * dy) < 5:
+                self._reach_patrol_target(enemy)
+                enemy.idle_time = 0
+                state[index] = IDLE
+                continue
+            
+            waypoint = self._path_waypoint(enemy, target)
+            if waypoint is None:
+                self._drop_patrol_target(enemy, target)
+                continue
+            walking.append(index)
+            waypoints.append(waypoint)
+        if not walking:
+            return
+        
+        walking = np.array(walking, dtype=np.int64)
+        walking_ids = ids[walking]
+        waypoints = np.array(waypoints, dtype=np.float64)
+        x = store.view("x")
+        y = store.view("y")
+        enemy_x = x[walking_ids]
+        enemy_y = y[walking_ids]
+        dx = waypoints[:, 0] - enemy_x
+        dy = waypoints[:, 1] - enemy_y
+        distance = np.sqrt(dx * dx + dy * dy)
+        
+        moving = distance > 0
+        step = speed[walking[moving]]
+        x[walking_ids[moving]] = enemy_x[moving] + (dx[moving] / distance[moving]) * step
+        y[walking_ids[moving]] = enemy_y[moving] + (dy[moving] / distance[moving]) * step
+        store.view("direction")[walking_ids] = np.arctan2(dy, dx)
+    
+    def _batch_attack(self, store, player, attack_ids, delta_time):
+        """Пакетна атака: кулдауни масивом, шкода гравцю - у порядку ворогів"""
+        if not len(attack_ids):
+            return
+        cooldown = store.view("attack_cooldown")
+        remaining = cooldown[attack_ids] - delta_time
+        ready = remaining <= 0
+        remaining[ready] = store.view("attack_rate")[attack_ids[ready]]
+        cooldown[attack_ids] = remaining
+        damage = store.columns["damage"]
+        for entity_id in attack_ids[ready].tolist():
+            player.take_damage(damage[entity_id])
     
     def _can_see_player(self, enemy, player):
         """Перевірка, чи бачить ворог гравця"""
         # Перевірка відстані
-        distance = self._calculate_distance(enemy, player)
-        if distance > ENEMY_VIEW_DISTANCE:
+        if self.enemies_in_view is not None:
+            if enemy not in self.enemies_in_view:
+                return False
+        elif self._calculate_distance(enemy, player) > ENEMY_VIEW_DISTANCE:
             return False
         
-        # TODO: Додати перевірку прямої видимості (ray casting)
-        # Це спрощена версія, яка перевіряє тільки відстань
+        # Перевірка прямої видимості по сітці зіткнень (результат кешується за парою тайлів)
+        if self.line_of_sight:
+            return self.line_of_sight.can_see(enemy.x, enemy.y, player.x, player.y)
         return True
     
     def _calculate_distance(self, entity1, entity2):
@@ -71,28 +307,39 @@ class AISystem:
         enemy.idle_time += delta_time
         if enemy.idle_time > enemy.idle_duration:
             enemy.idle_time = 0
-            enemy.state = "patrol"
+            enemy.state_id = PATROL
     
     def _update_patrol(self, enemy, player, delta_time):
         """Оновлення ворога в стані патрулювання"""
         # Якщо немає точок патрулювання, то стоїмо на місці
-        if not enemy.patrol_points:
-            enemy.state = "idle"
+        target = self._patrol_target(enemy)
+        if target is None:
+            enemy.state_id = IDLE
             return
         
         # Рух до поточної точки патрулювання
-        target_x, target_y = enemy.patrol_points[enemy.current_patrol_point]
+        target_x, target_y = target
         dx = target_x - enemy.x
         dy = target_y - enemy.y
         distance = math.sqrt(dx * dx + dy * dy)
         
         # Якщо досягли точки, вибираємо наступну
         if distance < 5:  # Tolerance
-            enemy.current_patrol_point = (enemy.current_patrol_point + 1) % len(enemy.patrol_points)
+            self._reach_patrol_target(enemy)
             enemy.idle_time = 0
-            enemy.state = "idle"
+            enemy.state_id = IDLE
             return
         
+        # Маршрут в обхід стін (без пошуку шляху - напряму до точки)
+        waypoint = self._path_waypoint(enemy, target)
+        if waypoint is None:
+            self._drop_patrol_target(enemy, target)
+            return
+        if waypoint is not target:
+            dx = waypoint[0] - enemy.x
+            dy = waypoint[1] - enemy.y
+            distance = math.sqrt(dx * dx + dy * dy)
+        
         # Рух до точки
         speed = enemy.speed * delta_time
         if distance > 0:
@@ -102,6 +349,66 @@ class AISystem:
         # Встановлюємо напрямок погляду
         enemy.direction = math.atan2(dy, dx)
     
+    def _patrol_target(self, enemy):
+        """Ціль патрулювання: остання відома позиція гравця (якщо є пошук шляху) або поточна точка"""
+        if self.pathfinder and enemy.last_seen_player_pos is not None:
+            return enemy.last_seen_player_pos
+        if enemy.patrol_points:
+            return enemy.patrol_points[enemy.current_patrol_point]
+        return None
+    
+    def _reach_patrol_target(self, enemy):
+        """Ціль досягнута: позиція гравця забувається або вибирається наступна точка"""
+        if self.pathfinder and enemy.last_seen_player_pos is not None:
+            enemy.last_seen_player_pos = None
+        else:
+            enemy.current_patrol_point = (enemy.current_patrol_point + 1) % len(enemy.patrol_points)
+        enemy.path = []
+        enemy.path_target = None
+    
+    def _drop_patrol_target(self, enemy, target):
+        """Недосяжна ціль: позиція гравця забувається, точка патрулювання видаляється"""
+        if target is enemy.last_seen_player_pos:
+            enemy.last_seen_player_pos = None
+        else:
+            del enemy.patrol_points[enemy.current_patrol_point]
+            if enemy.patrol_points:
+                enemy.current_patrol_point %= len(enemy.patrol_points)
+            else:
+                enemy.current_patrol_point = 0
+    
+    def _path_waypoint(self, enemy, target):
+        """
+        Наступна точка маршруту ворога до цілі
+        
+        Маршрут шукається лише при зміні цілі і зберігається у ворога; пройдені точки
+        відкидаються. Без пошуку шляху (або коли ворог стоїть у стіні) повертається сама ціль.
+        
+        Returns:
+            tuple або None: Точка (x, y); None - ціль недосяжна
+        """
+        if not self.pathfinder or not self.pathfinder.is_walkable(enemy.x, enemy.y):
+            return target
+        
+        if enemy.path_target != target or not enemy.path:
+            path = self.pathfinder.find_path(enemy.x, enemy.y, target[0], target[1])
+            if path is None:
+                enemy.path = []
+                enemy.path_target = None
+                return None
+            path[-1] = target
+            enemy.path = path
+            enemy.path_target = target
+        
+        path = enemy.path
+        while len(path) > 1:
+            dx = path[0][0] - enemy.x
+            dy = path[0][1] - enemy.y
+            if dx * dx + dy * dy >= 25:
+                break
+            path.pop(0)
+        return path[0]
+    
     def _update_chase(self, enemy, player, delta_time):
         """Оновлення ворога в стані переслідування"""
         # Розрахунок напрямку до гравця
@@ -112,11 +419,26 @@ class AISystem:
         # Рух до гравця
         if distance > enemy.attack_range:
             speed = enemy.speed * delta_time
-            if distance > 0:
-                enemy.x += (dx / distance) * speed
-                enemy.y += (dy / distance) * speed
+            move_x, move_y, move_distance = dx, dy, distance
+            
+            # Крок до центру наступного тайла поля напрямків (якщо ворог у межах поля)
+            waypoint = None
+            if self.flow_field:
+                center_x = enemy.x + enemy.width / 2
+                center_y = enemy.y + enemy.height / 2
+                waypoint = self.flow_field.next_waypoint(center_x, center_y)
+            if waypoint:
+                to_x = waypoint[0] - center_x
+                to_y = waypoint[1] - center_y
+                to_distance = math.sqrt(to_x * to_x + to_y * to_y)
+                if to_distance > 0:
+                    move_x, move_y, move_distance = to_x, to_y, to_distance
+            
+            if move_distance > 0:
+                enemy.x += (move_x / move_distance) * speed
+                enemy.y += (move_y / move_distance) * speed
         else:
-            enemy.state = "attack"
+            enemy.state_id = ATTACK
         
         # Встановлюємо напрямок погляду
         enemy.direction = math.atan2(dy, dx)
@@ -131,7 +453,7 @@ class AISystem:
         # Перевірка, чи можна атакувати
         distance = math.sqrt(dx * dx + dy * dy)
         if distance > enemy.attack_range:
-            enemy.state = "chase"
+            enemy.state_id = CHASE
             return
         # Атака з певним кулдауном
         enemy.attack_cooldown -= delta_time
@@ -148,14 +470,11 @@ class AISystem:
         if enemy.hurt_time <= 0:
             # Повернення до переслідування, якщо гравець видимий
             if self._can_see_player(enemy, player):
-                enemy.state = "chase"
+                enemy.state_id = CHASE
             else:
-                enemy.state = "patrol"
+                enemy.state_id = PATROL
     
     def _update_dead(self, enemy, player, delta_time):
         """Оновлення ворога в стані смерті"""
-        # Анімація смерті триває певний час
-        enemy.death_time -= delta_time
-        if enemy.death_time <= 0:
-            # Позначаємо ворога для видалення
-            enemy.should_remove = True
\ No newline at end of file
+        # Загиблі вороги не приймають рішень: анімацію смерті відлічує Enemy.update,
+        # а сцена видаляє ворога після її завершення
\ No newline at end of file
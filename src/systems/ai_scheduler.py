@@ -0,0 +1,212 @@
+import time
+from src.entities.enemy import DEAD
+from src.utils.constants import (AI_UPDATE_RATE, AI_TICK_BUDGET_MS, AI_LOD_NEAR_DISTANCE, AI_SCHEDULER_CHUNK,
+                                 AI_BATCH_THRESHOLD)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього розклад складається поелементно
+    np = None
+
+
+class AIScheduler:
+    """
+    Планувальник AI з рівнями деталізації і бюджетом часу
+    
+    Вороги поблизу гравця або на екрані думають кожен крок. Решта розподілені
+    по update_rate кошиках за позицією в списку і думають по черзі раз на
+    update_rate кроків, отримуючи весь час, що минув, щоб таймери не відставали.
+    Між рішеннями далекі вороги рухаються з останньою швидкістю (move_x, move_y),
+    а перед наступним рішенням цей рух (drift_x, drift_y) скасовується, тож
+    сумарне переміщення визначає лише AI. Якщо бюджет кроку вичерпано, решта
+    ворогів чекає наступного кроку і отримує вищий пріоритет.
+    """
+    
+    def __init__(self, ai_system, update_rate=AI_UPDATE_RATE, budget_ms=AI_TICK_BUDGET_MS,
+                 near_distance=AI_LOD_NEAR_DISTANCE, chunk_size=AI_SCHEDULER_CHUNK):
+        """
+        Ініціалізація планувальника
+        
+        Args:
+            ai_system: AISystem, що приймає рішення
+            update_rate: Як часто (у кроках) думають далекі вороги
+            budget_ms: Бюджет часу на крок у мілісекундах (None - без обмеження, детерміновано)
+            near_distance: Відстань до гравця, ближче якої ворог думає кожен крок
+            chunk_size: Скільки ворогів обробляється між перевірками бюджету
+        """
+        self.ai_system = ai_system
+        self.update_rate = update_rate
+        self.budget_ms = budget_ms
+        self.near_distance = near_distance
+        self.chunk_size = chunk_size
+        self.tick = 0
+        
+        # Статистика останнього кроку
+        self.thought = 0
+        self.deferred = 0
+    
+    def update(self, player, enemies, delta_time, view_rect=None):
+        """
+        Крок планувальника
+        
+        Args:
+            player: Гравець
+            enemies: Список ворогів (позиція в списку визначає кошик)
+            delta_time: Тривалість кроку
+            view_rect: Видима область світу (x, y, ширина, висота) для пріоритету
+        """
+        if delta_time <= 0:
+            # Без плину часу немає ні рішень, ні руху (і швидкість у _think не визначена)
+            return
+        self.tick += 1
+        store = ids = None
+        if np is not None and len(enemies) >= AI_BATCH_THRESHOLD and self.ai_system._shares_store(enemies):
+            store = enemies[0].store
+            ids = store.ids_of(enemies)
+            due, waits = self._due_batch(store, ids, player, view_rect)
+        else:
+            due, waits = self._due(enemies, player, view_rect)
+        
+        # Рішення пакетами з однаковим часом очікування, поки не вичерпано бюджет
+        deadline = None
+        if self.budget_ms is not None:
+            deadline = time.perf_counter() + self.budget_ms / 1000
+        start = 0
+        while start < len(due):
+            if deadline is not None and start and time.perf_counter() > deadline:
+                break
+            waited = waits[start]
+            end = start + 1
+            while end < len(due) and end - start < self.chunk_size and waits[end] == waited:
+                end += 1
+            self._think(player, enemies, due[start:end], waited * delta_time, store, ids)
+            start = end
+        self.thought = start
+        self.deferred = len(due) - start
+        
+        # Решта ворогів продовжує рух за останнім рішенням
+        if store is not None:
+            self._drift_batch(store, ids, due[:start], delta_time)
+        else:
+            thinking = set(due[:start])
+            for index, enemy in enumerate(enemies):
+                if index in thinking or enemy.state_id == DEAD or not (enemy.move_x or enemy.move_y):
+                    continue
+                step_x = enemy.move_x * delta_time
+                step_y = enemy.move_y * delta_time
+                enemy.x += step_x
+                enemy.y += step_y
+                enemy.drift_x += step_x
+                enemy.drift_y += step_y
+        
+        # Вороги біля гравця розходяться, щоб не збиватися в одну точку
+        # (після всіх рішень кроку, серед усіх живих ворогів)
+        self.ai_system.separate(enemies, delta_time)
+    
+    def _waited(self, last_think):
+        """Скільки кроків ворог чекає рішення (0 у last_think - ще не думав)"""
+        return self.tick - last_think if last_think else 1
+    
+    def _due(self, enemies, player, view_rect):
+        """
+        Вороги, які мають думати на цьому кроці, у порядку пріоритету
+        
+        Returns:
+            tuple: (індекси ворогів, кроки очікування для кожного)
+        """
+        tick = self.tick
+        rate = self.update_rate
+        near_sq = self.near_distance * self.near_distance
+        items = []
+        for index, enemy in enumerate(enemies):
+            waited = self._waited(enemy.last_think)
+            dx = enemy.x - player.x
+            dy = enemy.y - player.y
+            near = dx * dx + dy * dy <= near_sq or (view_rect is not None and
+                                                     view_rect[0] <= enemy.x < view_rect[0] + view_rect[2] and
+                                                     view_rect[1] <= enemy.y < view_rect[1] + view_rect[3])
+            if near:
+                items.append((0, -waited, index))
+            elif waited > rate or index % rate == tick % rate:
+                # Свій кошик або прострочене рішення (бюджет попередніх кроків вичерпався)
+                items.append((1, -waited, index))
+        items.sort()
+        return [index for _, _, index in items], [-waited for _, waited, _ in items]
+    
+    def _due_batch(self, store, ids, player, view_rect):
+        """Векторизований _due для ворогів з одного EntityStore"""
+        x = store.view("x")[ids]
+        y = store.view("y")[ids]
+        dx = x - player.x
+        dy = y - player.y
+        near = dx * dx + dy * dy <= self.near_distance * self.near_distance
+        if view_rect is not None:
+            near |= ((x >= view_rect[0]) & (x < view_rect[0] + view_rect[2])
+                     & (y >= view_rect[1]) & (y < view_rect[1] + view_rect[3]))
+        
+        last_think = store.view("last_think")[ids]
+        waited = np.where(last_think == 0, 1, self.tick - last_think)
+        index = np.arange(len(ids))
+        rate = self.update_rate
+        due = np.flatnonzero(near | (waited > rate) | (index % rate == self.tick % rate))
+        due = due[np.lexsort((due, -waited[due], ~near[due]))]
+        return due.tolist(), waited[due].tolist()
+    
+    def _think(self, player, enemies, chunk, elapsed, store, ids):
+        """Рішення AI для групи ворогів, що чекали однаковий час"""
+        group = [enemies[index] for index in chunk]
+        tick = self.tick
+        
+        if store is not None:
+            chunk_ids = ids[chunk]
+            x = store.view("x")
+            y = store.view("y")
+            drift_x = store.view("drift_x")
+            drift_y = store.view("drift_y")
+            
+            # Скасування руху за інерцією: рішення приймається з позиції минулого рішення
+            x[chunk_ids] -= drift_x[chunk_ids]
+            y[chunk_ids] -= drift_y[chunk_ids]
+            drift_x[chunk_ids] = 0
+            drift_y[chunk_ids] = 0
+            start_x = x[chunk_ids]
+            start_y = y[chunk_ids]
+            
+            self.ai_system.update(player, group, elapsed)
+            
+            store.view("move_x")[chunk_ids] = (x[chunk_ids] - start_x) / elapsed
+            store.view("move_y")[chunk_ids] = (y[chunk_ids] - start_y) / elapsed
+            store.view("last_think")[chunk_ids] = tick
+            return
+        
+        starts = []
+        for enemy in group:
+            enemy.x -= enemy.drift_x
+            enemy.y -= enemy.drift_y
+            enemy.drift_x = 0
+            enemy.drift_y = 0
+            starts.append((enemy.x, enemy.y))
+        
+        self.ai_system.update(player, group, elapsed)
+        
+        for enemy, (start_x, start_y) in zip(group, starts):
+            enemy.move_x = (enemy.x - start_x) / elapsed
+            enemy.move_y = (enemy.y - start_y) / elapsed
+            enemy.last_think = tick
+    
+    def _drift_batch(self, store, ids, thinking, delta_time):
+        """Рух за останнім рішенням для всіх ворогів, що не думали на цьому кроці"""
+        waiting = np.ones(len(ids), dtype=bool)
+        waiting[thinking] = False
+        move_x = store.view("move_x")
+        move_y = store.view("move_y")
+        moving = ids[waiting & (store.view("state_id")[ids] != DEAD)
+                     & ((move_x[ids] != 0) | (move_y[ids] != 0))]
+        if not len(moving):
+            return
+        step_x = move_x[moving] * delta_time
+        step_y = move_y[moving] * delta_time
+        store.view("x")[moving] += step_x
+        store.view("y")[moving] += step_y
+        store.view("drift_x")[moving] += step_x
+        store.view("drift_y")[moving] += step_y
@@ -0,0 +1,290 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from src.entities.entity_store import ENTITY_FIELDS, EntityStore
+from src.entities.enemy import Enemy
+
+try:
+    import numpy as np
+except ImportError:  # Без NumPy робочий процес недоступний, AI працює в основному процесі
+    np = None
+
+# Поля, які AI змінює і які повертаються з робочого процесу
+# (x і y застосовуються як зміщення, решта - як нові значення)
+AI_WORKER_FIELDS = ("x", "y", "direction", "state_id", "idle_time", "idle_duration",
+                    "attack_cooldown", "hurt_time",
+                    "move_x", "move_y", "drift_x", "drift_y", "last_think")
+
+# Атрибути ворога поза EntityStore: передаються робочому процесу при першій появі ворога
+# і повертаються в основний процес для ворогів, що приймали рішення на кроці
+AI_WORKER_ATTRIBUTES = ("patrol_points", "current_patrol_point", "last_seen_player_pos", "path", "path_target")
+
+
+def _attribute_values(enemy):
+    """Значення AI_WORKER_ATTRIBUTES ворога (списки копіюються, бо AI змінює їх на місці)"""
+    return tuple(list(value) if isinstance(value, list) else value
+                 for value in (getattr(enemy, name) for name in AI_WORKER_ATTRIBUTES))
+
+
+def _layout(capacity):
+    """Зміщення полів у спільній пам'яті: назва -> (зміщення, тип), загальний розмір"""
+    layout = {}
+    offset = 0
+    for name, typecode in ENTITY_FIELDS.items():
+        layout[name] = (offset, np.dtype(typecode))
+        offset += np.dtype(typecode).itemsize * capacity
+    return layout, offset
+
+
+def _columns(buffer, layout, capacity):
+    """Масиви NumPy над спільною пам'яттю для кожного поля"""
+    return {name: np.ndarray(capacity, dtype=dtype, buffer=buffer, offset=offset)
+            for name, (offset, dtype) in layout.items()}
+
+
+class _PlayerView:
+    """Гравець у робочому процесі: позиція і накопичена шкода"""
+    
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.damage_taken = []
+    
+    def take_damage(self, amount):
+        self.damage_taken.append(amount)
+
+
+def _worker_main(connection, state_name, result_name, grid_name, capacity, grid_width, grid_height):
+    """
+    Цикл робочого процесу
+    
+    Кожне повідомлення - крок симуляції: знімок полів ворогів читається зі
+    спільної пам'яті, AIScheduler (без бюджету часу, щоб лишатися
+    детермінованим) оновлює власні копії ворогів, змінені поля записуються
+    в пам'ять результатів, а шкода гравцю і атрибути ворогів, що приймали
+    рішення, повертаються повідомленням (атрибути - лише ті, що змінилися
+    відносно копії основного процесу).
+    """
+    from src.systems.ai import AISystem
+    from src.systems.ai_scheduler import AIScheduler
+    from src.systems.collision import CollisionSystem
+    from src.systems.collision_grid import CollisionGrid
+    
+    state_memory = shared_memory.SharedMemory(name=state_name)
+    result_memory = shared_memory.SharedMemory(name=result_name)
+    grid_memory = shared_memory.SharedMemory(name=grid_name)
+    layout, _ = _layout(capacity)
+    state = _columns(state_memory.buf, layout, capacity)
+    result = _columns(result_memory.buf, layout, capacity)
+    
+    # Сітка зіткнень робочого процесу оновлюється зі спільної пам'яті при зміні версії
+    collision_system = CollisionSystem({})
+    collision_system.grid = CollisionGrid(grid_width, grid_height, bytearray(grid_memory.buf[:grid_width * grid_height]))
+    scheduler = AIScheduler(AISystem(collision_system), budget_ms=None)
+    
+    store = EntityStore(capacity)
+    player = _PlayerView()
+    shared = {}  # ідентифікатор -> атрибути ворога, які має основний процес
+    try:
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+            ids, player_x, player_y, delta_time, view_rect, new_enemies, grid_version = message
+            
+            if grid_version is not None:
+                grid = collision_system.grid
+                grid.cells[:] = grid_memory.buf[:grid_width * grid_height]
+                grid._build_summed_area()
+                grid.version = grid_version
+            
+            # Копії нових ворогів займають ті самі ідентифікатори, що й в основному сховищі
+            for entity_id, attributes in new_enemies:
+                enemy = Enemy.__new__(Enemy)
+                enemy.store = store
+                enemy.entity_id = entity_id
+                enemy.should_remove = False
+                for name, value in zip(AI_WORKER_ATTRIBUTES, attributes):
+                    setattr(enemy, name, value)
+                store.owners[entity_id] = enemy
+                store.size = max(store.size, entity_id + 1)
+                shared[entity_id] = _attribute_values(enemy)
+            
+            for name in ENTITY_FIELDS:
+                store.view(name)[:] = state[name][:store.size]
+            
+            player.x = player_x
+            player.y = player_y
+            player.damage_taken = []
+            scheduler.update(player, [store.owners[entity_id] for entity_id in ids], delta_time, view_rect)
+            
+            for name in AI_WORKER_FIELDS:
+                result[name][:store.size] = store.view(name)
+            
+            # Атрибути змінюють лише обробники станів, тобто вороги, що думали на цьому кроці
+            ids = np.asarray(ids, dtype=np.int64)
+            attributes = []
+            for entity_id in ids[store.view("last_think")[ids] == scheduler.tick].tolist():
+                values = _attribute_values(store.owners[entity_id])
+                if values != shared[entity_id]:
+                    shared[entity_id] = values
+                    attributes.append((entity_id, values))
+            connection.send((player.damage_taken, attributes))
+    finally:
+        # Масиви над спільною пам'яттю звільняються до її закриття
+        state.clear()
+        result.clear()
+        state_memory.close()
+        result_memory.close()
+        grid_memory.close()
+
+
+class AIWorker:
+    """
+    Рішення AI в окремому процесі
+    
+    На кожному кроці основний процес застосовує результат попереднього кроку і
+    надсилає знімок поточного: рішення приходять рівно на один крок пізніше
+    незалежно від швидкості процесів, тож симуляція лишається детермінованою.
+    Поля ворогів і сітка зіткнень передаються через multiprocessing.shared_memory.
+    Рішення для ворога відкидається, якщо за цей крок його стан змінився
+    в основному процесі (отримав шкоду або загинув). Атрибути поза EntityStore
+    (точки патрулювання, маршрути) повертаються разом з рішенням і так само
+    відстають на крок; після відкинутого рішення робочий процес отримує
+    атрибути основного процесу заново.
+    """
+    
+    def __init__(self, grid, store):
+        """
+        Запуск робочого процесу
+        
+        Args:
+            grid: CollisionGrid карти
+            store: EntityStore ворогів (місткість фіксується при запуску)
+        """
+        if np is None:
+            raise ImportError("AIWorker потребує NumPy")
+        self.grid = grid
+        self.store = store
+        self.capacity = store.capacity
+        self.layout, size = _layout(self.capacity)
+        self.state_memory = shared_memory.SharedMemory(create=True, size=size)
+        self.result_memory = shared_memory.SharedMemory(create=True, size=size)
+        self.grid_memory = shared_memory.SharedMemory(create=True, size=max(grid.width * grid.height, 1))
+        self.state = _columns(self.state_memory.buf, self.layout, self.capacity)
+        self.result = _columns(self.result_memory.buf, self.layout, self.capacity)
+        self.grid_version = None
+        self.known = {}  # ідентифікатор -> ворог, якого вже має робочий процес
+        self.pending = None  # Надісланий крок, результат якого ще не застосовано
+        
+        context = multiprocessing.get_context("spawn")
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, daemon=True,
+            args=(worker_connection, self.state_memory.name, self.result_memory.name, self.grid_memory.name,
+                  self.capacity, grid.width, grid.height))
+        self.process.start()
+        worker_connection.close()
+    
+    def update(self, player, enemies, delta_time, view_rect=None):
+        """
+        Крок: застосування рішень попереднього кроку і надсилання поточного
+        
+        Args:
+            player: Гравець
+            enemies: Список ворогів
+            delta_time: Тривалість кроку
+            view_rect: Видима область світу для планувальника AI
+        
+        Returns:
+            bool: False, якщо робочий процес більше не може працювати (сховище
+            виросло або процес завершився) - тоді AI має оновлюватися в основному процесі
+        """
+        if not self._collect(player):
+            return False
+        if self.store.capacity != self.capacity:
+            # Після розширення сховища спільна пам'ять уже не вміщує поля
+            self.close()
+            return False
+        if enemies:
+            self._submit(player, enemies, delta_time, view_rect)
+        return True
+    
+    def _submit(self, player, enemies, delta_time, view_rect):
+        """Знімок полів ворогів у спільну пам'ять і повідомлення робочому процесу"""
+        store = self.store
+        ids = store.ids_of(enemies)
+        new_enemies = []
+        for enemy in enemies:
+            if self.known.get(enemy.entity_id) is not enemy:
+                self.known[enemy.entity_id] = enemy
+                new_enemies.append((enemy.entity_id, tuple(getattr(enemy, name) for name in AI_WORKER_ATTRIBUTES)))
+        
+        for name in ENTITY_FIELDS:
+            self.state[name][:store.size] = store.view(name)
+        
+        grid_version = None
+        if self.grid_version != self.grid.version:
+            self.grid_memory.buf[:len(self.grid.cells)] = self.grid.cells
+            grid_version = self.grid_version = self.grid.version
+        
+        self.connection.send((ids.tolist(), player.x, player.y, delta_time, view_rect, new_enemies, grid_version))
+        self.pending = (enemies, ids)
+    
+    def _collect(self, player):
+        """Очікування і застосування результату надісланого кроку"""
+        if self.pending is None:
+            return True
+        enemies, ids = self.pending
+        self.pending = None
+        try:
+            damage_taken, attributes = self.connection.recv()
+        except (EOFError, OSError):
+            self.close()
+            return False
+        
+        store = self.store
+        state_id = store.view("state_id")
+        # Рішення застосовується лише для тих самих ворогів, чий стан не змінився з моменту знімка
+        current = np.fromiter((store.owners[entity_id] is enemy for entity_id, enemy in zip(ids.tolist(), enemies)),
+                              dtype=bool, count=len(ids))
+        current &= state_id[ids] == self.state["state_id"][ids]
+        # Копія відкинутого ворога в робочому процесі розійшлася з основною - її буде замінено
+        for entity_id in ids[~current].tolist():
+            self.known.pop(entity_id, None)
+        ids = ids[current]
+        for name in AI_WORKER_FIELDS:
+            column = store.view(name)
+            if name in ("x", "y"):
+                column[ids] += self.result[name][ids] - self.state[name][ids]
+            else:
+                column[ids] = self.result[name][ids]
+        
+        accepted = set(ids.tolist())
+        for entity_id, values in attributes:
+            if entity_id in accepted:
+                enemy = store.owners[entity_id]
+                for name, value in zip(AI_WORKER_ATTRIBUTES, values):
+                    setattr(enemy, name, value)
+        
+        for amount in damage_taken:
+            player.take_damage(amount)
+        return True
+    
+    def close(self):
+        """Зупинка робочого процесу і звільнення спільної пам'яті"""
+        if self.process is None:
+            return
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process = None
+        self.pending = None
+        self.connection.close()
+        self.state = self.result = None
+        for memory in (self.state_memory, self.result_memory, self.grid_memory):
+            memory.close()
+            memory.unlink()
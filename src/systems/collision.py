@@ -1,5 +1,17 @@
+import math
 import pygame
-from src.utils.constants import TILE_SIZE
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього пакетні запити виконуються циклом
+    np = None
+from src.engine.profiler import NULL_PROFILER
+from src.systems.collision_grid import CollisionGrid
+from src.systems.spatial_hash import SpatialHash
+from src.utils.constants import SPATIAL_HASH_CELL_SIZE, COLLISION_MASK, CCD_THRESHOLD
+
+# Маска, що дозволяє зіткнення з усіма категоріями
+ALL_CATEGORIES = sum(COLLISION_MASK.values())
 
 class CollisionSystem:
     """Система для обробки зіткнень між об'єктами"""
@@ -7,8 +19,16 @@ class CollisionSystem:
     def __init__(self, map_data):
         """Ініціалізація системи зіткнень"""
         self.map_data = map_data
-        self.collision_map = self._generate_collision_map()
+        self.grid = CollisionGrid.from_rows(self._generate_collision_map())
         self.entities = []  # Список всіх сутностей для перевірки зіткнень
+        self.profiler = NULL_PROFILER  # Профайлер кадрів
+        
+        # Broadphase: просторовий хеш і порядок реєстрації (для детермінованого порядку обробників)
+        self.spatial_hash = SpatialHash(SPATIAL_HASH_CELL_SIZE)
+        self.entity_order = {}  # сутність -> порядковий номер реєстрації
+        self.next_order = 0
+        self.collision_filters = {}  # сутність -> (біти категорії, біти маски)
+        self.collision_categories = {}  # сутність -> назва категорії, з якою її зареєстровано (або None)
     
     def _generate_collision_map(self):
         """Генерація карти зіткнень на основі даних карти"""
@@ -31,39 +51,401 @@ class CollisionSystem:
         
         return collision_map
     
-    def register_entity(self, entity):
-        """Реєстрація сутності для перевірки зіткнень"""
-        if entity not in self.entities:
+    def register_entity(self, entity, category=None, mask=None):
+        """
+        Реєстрація сутності для перевірки зіткнень
+        
+        Args:
+            entity: Сутність
+            category: Назва категорії з COLLISION_MASK (за замовчуванням entity.collision_category)
+            mask: Назви категорій, з якими можливе зіткнення (за замовчуванням entity.collision_mask)
+        """
+        if entity not in self.entity_order:
             self.entities.append(entity)
+            self.entity_order[entity] = self.next_order
+            self.next_order += 1
+            self.spatial_hash.insert(entity, *self._get_bounds(entity))
+        self.set_collision_filter(entity, category, mask)
     
     def unregister_entity(self, entity):
         """Видалення сутності з перевірки зіткнень"""
-        if entity in self.entities:
+        if entity in self.entity_order:
             self.entities.remove(entity)
+            del self.entity_order[entity]
+            del self.collision_filters[entity]
+            del self.collision_categories[entity]
+            self.spatial_hash.remove(entity)
+    
+    def set_collision_filter(self, entity, category=None, mask=None):
+        """Встановлення категорії та маски зіткнень сутності"""
+        if category is None:
+            category = getattr(entity, "collision_category", None)
+        if mask is None:
+            mask = getattr(entity, "collision_mask", None)
+        
+        # Сутності без категорії чи маски стикаються з усім
+        category_bits = COLLISION_MASK[category] if category else ALL_CATEGORIES
+        mask_bits = ALL_CATEGORIES
+        if mask is not None:
+            mask_bits = 0
+            for name in mask:
+                mask_bits |= COLLISION_MASK[name]
+        self.collision_filters[entity] = (category_bits, mask_bits)
+        self.collision_categories[entity] = category
+    
+    def category_of(self, entity):
+        """
+        Категорія зіткнень сутності
+        
+        Returns:
+            str: Категорія, з якою сутність зареєстровано (з урахуванням перевизначення
+            в register_entity), інакше її collision_category; None - категорії немає
+        """
+        if entity in self.collision_categories:
+            return self.collision_categories[entity]
+        return getattr(entity, "collision_category", None)
+    
+    def can_collide(self, entity1, entity2):
+        """Чи дозволяють категорії та маски зіткнення двох сутностей"""
+        category1, mask1 = self.collision_filters.get(entity1, (ALL_CATEGORIES, ALL_CATEGORIES))
+        category2, mask2 = self.collision_filters.get(entity2, (ALL_CATEGORIES, ALL_CATEGORIES))
+        return bool(category1 & mask2) and bool(category2 & mask1)
+    
+    def _get_bounds(self, entity):
+        """Прямокутник сутності для broadphase (з запасом на округлення pygame.Rect)"""
+        return entity.x - 1, entity.y - 1, entity.width + 2, entity.height + 2
+    
+    def update_entity(self, entity):
+        """Оновлення положення сутності в broadphase після переміщення"""
+        if entity in self.entity_order:
+            self.spatial_hash.update(entity, *self._get_bounds(entity))
+    
+    def refresh(self):
+        """Оновлення broadphase для всіх сутностей (після руху в обхід resolve_movement)"""
+        update = self.spatial_hash.update
+        for entity in self.entities:
+            update(entity, entity.x - 1, entity.y - 1, entity.width + 2, entity.height + 2)
+    
+    def get_collision_candidates(self, entity):
+        """
+        Кандидати на зіткнення з сутністю з просторового хешу
+        
+        Пари, чиї категорії та маски не перетинаються, відкидаються ще до точної перевірки.
+        
+        Returns:
+            list: Зареєстровані сутності в порядку реєстрації (без самої сутності)
+        """
+        candidates = self.spatial_hash.query_rect(*self._get_bounds(entity))
+        candidates.discard(entity)
+        
+        filters = self.collision_filters
+        category, mask = filters.get(entity, (ALL_CATEGORIES, ALL_CATEGORIES))
+        candidates = [other for other in candidates
+                      if filters[other][0] & mask and filters[other][1] & category]
+        candidates.sort(key=self.entity_order.__getitem__)
+        return candidates
+    
+    def _category_bits(self, categories):
+        """Біти категорій для фільтра запиту (None - усі категорії)"""
+        if categories is None:
+            return ALL_CATEGORIES
+        bits = 0
+        for name in categories:
+            bits |= COLLISION_MASK[name]
+        return bits
+    
+    def _query_candidates(self, x, y, width, height, bits):
+        """Кандидати з просторового хешу, чия категорія входить у bits"""
+        filters = self.collision_filters
+        return [other for other in self.spatial_hash.query_rect(x, y, width, height)
+                if filters[other][0] & bits]
+    
+    def query_rect(self, x, y, width, height, categories=None):
+        """
+        Сутності, чиї прямокутники перетинаються з прямокутником
+        
+        Args:
+            x, y, width, height: Прямокутник у координатах світу
+            categories: Назви категорій з COLLISION_MASK (None - усі)
+            
+        Returns:
+            list: Сутності в порядку реєстрації
+        """
+        result = [other for other in self._query_candidates(x, y, width, height, self._category_bits(categories))
+                  if other.x < x + width and other.x + other.width > x
+                  and other.y < y + height and other.y + other.height > y]
+        result.sort(key=self.entity_order.__getitem__)
+        return result
+    
+    def query_radius(self, x, y, radius, categories=None):
+        """
+        Сутності, чия позиція (x, y) знаходиться не далі radius від точки
+        
+        Returns:
+            list: Сутності в порядку реєстрації
+        """
+        radius_sq = radius * radius
+        result = []
+        for other in self._query_candidates(x - radius, y - radius, radius * 2, radius * 2,
+                                            self._category_bits(categories)):
+            dx = other.x - x
+            dy = other.y - y
+            if dx * dx + dy * dy <= radius_sq:
+                result.append(other)
+        result.sort(key=self.entity_order.__getitem__)
+        return result
+    
+    def query_nearest(self, x, y, count=1, max_distance=None, categories=None):
+        """
+        count найближчих до точки сутностей
+        
+        Радіус пошуку подвоюється, доки не знайдеться достатньо сутностей; коли квадрат
+        пошуку охоплює більше клітинок, ніж зайнято в хеші, перебираються всі сутності.
+        
+        Returns:
+            list: Сутності за зростанням відстані (при рівній відстані - в порядку реєстрації)
+        """
+        bits = self._category_bits(categories)
+        cell_size = self.spatial_hash.cell_size
+        radius = cell_size if max_distance is None else min(cell_size, max_distance)
+        while True:
+            cells_covered = (2 * radius / cell_size + 1) ** 2
+            if cells_covered > len(self.spatial_hash.cells):
+                filters = self.collision_filters
+                candidates = [other for other in self.entities if filters[other][0] & bits]
+                radius = math.inf if max_distance is None else max_distance
+            else:
+                candidates = self._query_candidates(x - radius, y - radius, radius * 2, radius * 2, bits)
+            
+            found = []
+            radius_sq = radius * radius
+            for other in candidates:
+                dx = other.x - x
+                dy = other.y - y
+                distance_sq = dx * dx + dy * dy
+                if distance_sq <= radius_sq:
+                    found.append((distance_sq, self.entity_order[other], other))
+            
+            # Сутності за межами кола могли не потрапити в кандидати, тому коло має містити count
+            if len(found) >= count or radius == math.inf or radius == max_distance:
+                found.sort(key=lambda item: item[:2])
+                return [other for _, _, other in found[:count]]
+            
+            radius *= 2
+            if max_distance is not None:
+                radius = min(radius, max_distance)
+    
+    def raycast(self, x1, y1, x2, y2, categories=None, tiles=True):
+        """
+        Перше зіткнення відрізка з тайлами або прямокутниками сутностей
+        
+        Returns:
+            tuple або None: (час від 0 до 1 уздовж відрізка, сутність або None для тайла)
+        """
+        delta_x = x2 - x1
+        delta_y = y2 - y1
+        hit_time = 1.0
+        if tiles:
+            hit_time = self.grid.sweep_rect(x1, y1, 0, 0, delta_x, delta_y)[0]
+        
+        # Кандидати шукаються лише на відрізку до стіни
+        end_x = x1 + delta_x * hit_time
+        end_y = y1 + delta_y * hit_time
+        best = None
+        for other in self._query_candidates(min(x1, end_x), min(y1, end_y), abs(end_x - x1), abs(end_y - y1),
+                                            self._category_bits(categories)):
+            entry_x, exit_x, _ = self._sweep_axis(x1, 0, other.x, other.width, delta_x)
+            if entry_x is None:
+                continue
+            entry_y, exit_y, _ = self._sweep_axis(y1, 0, other.y, other.height, delta_y)
+            if entry_y is None:
+                continue
+            entry = max(entry_x, entry_y, 0.0)
+            if entry > min(exit_x, exit_y) or entry > hit_time:
+                continue
+            key = (entry, self.entity_order[other])
+            if best is None or key < best[0]:
+                best = (key, other)
+        
+        if best is not None:
+            return best[0][0], best[1]
+        if hit_time < 1.0:
+            return hit_time, None
+        return None
+    
+    def _gather_pairs(self, bounds, bits):
+        """
+        Пари (запит, сутність) для пакетного запиту з просторового хешу
+        
+        Returns:
+            tuple: (індекси запитів, сутності, масиви x, y, width, height і порядку реєстрації сутностей)
+        """
+        query_indices = []
+        entities = []
+        for index, (x, y, width, height) in enumerate(bounds):
+            candidates = self._query_candidates(x, y, width, height, bits)
+            query_indices.extend([index] * len(candidates))
+            entities.extend(candidates)
+        
+        count = len(entities)
+        xs = np.fromiter((entity.x for entity in entities), dtype=np.float64, count=count)
+        ys = np.fromiter((entity.y for entity in entities), dtype=np.float64, count=count)
+        widths = np.fromiter((entity.width for entity in entities), dtype=np.float64, count=count)
+        heights = np.fromiter((entity.height for entity in entities), dtype=np.float64, count=count)
+        order = self.entity_order
+        orders = np.fromiter((order[entity] for entity in entities), dtype=np.int64, count=count)
+        return np.array(query_indices, dtype=np.int64), entities, xs, ys, widths, heights, orders
+    
+    def _split_pairs(self, query_count, query_indices, entities, keep, sort_key):
+        """Розбиття відібраних пар на списки по запитах (сортування за sort_key у межах запиту)"""
+        selected = np.flatnonzero(keep)
+        selected = selected[np.lexsort((sort_key[selected], query_indices[selected]))]
+        results = [[] for _ in range(query_count)]
+        for pair in selected.tolist():
+            results[query_indices[pair]].append(entities[pair])
+        return results
+    
+    def query_rects(self, xs, ys, widths, heights, categories=None):
+        """Пакетний query_rect: список результатів для кожного прямокутника"""
+        if np is None:
+            if not hasattr(widths, "__len__"):
+                widths = [widths] * len(xs)
+            if not hasattr(heights, "__len__"):
+                heights = [heights] * len(xs)
+            return [self.query_rect(x, y, w, h, categories) for x, y, w, h in zip(xs, ys, widths, heights)]
+        
+        qx = np.asarray(xs, dtype=np.float64)
+        qy = np.asarray(ys, dtype=np.float64)
+        qw = np.broadcast_to(np.asarray(widths, dtype=np.float64), qx.shape)
+        qh = np.broadcast_to(np.asarray(heights, dtype=np.float64), qx.shape)
+        pairs, entities, ex, ey, ew, eh, orders = self._gather_pairs(
+            zip(qx.tolist(), qy.tolist(), qw.tolist(), qh.tolist()), self._category_bits(categories))
+        
+        # Точна перевірка всіх пар одним векторизованим проходом
+        keep = ((ex < qx[pairs] + qw[pairs]) & (ex + ew > qx[pairs])
+                & (ey < qy[pairs] + qh[pairs]) & (ey + eh > qy[pairs]))
+        return self._split_pairs(len(qx), pairs, entities, keep, orders)
+    
+    def query_radii(self, xs, ys, radii, categories=None):
+        """Пакетний query_radius: список результатів для кожного кола"""
+        if np is None:
+            if not hasattr(radii, "__len__"):
+                radii = [radii] * len(xs)
+            return [self.query_radius(x, y, r, categories) for x, y, r in zip(xs, ys, radii)]
+        
+        qx = np.asarray(xs, dtype=np.float64)
+        qy = np.asarray(ys, dtype=np.float64)
+        qr = np.broadcast_to(np.asarray(radii, dtype=np.float64), qx.shape)
+        pairs, entities, ex, ey, _, _, orders = self._gather_pairs(
+            zip((qx - qr).tolist(), (qy - qr).tolist(), (qr * 2).tolist(), (qr * 2).tolist()),
+            self._category_bits(categories))
+        
+        dx = ex - qx[pairs]
+        dy = ey - qy[pairs]
+        keep = dx * dx + dy * dy <= qr[pairs] * qr[pairs]
+        return self._split_pairs(len(qx), pairs, entities, keep, orders)
+    
+    def query_nearest_batch(self, xs, ys, count=1, max_distance=None, categories=None):
+        """
+        Пакетний query_nearest
+        
+        З max_distance усі точки обробляються одним векторизованим проходом;
+        без нього (або без NumPy) кожна точка шукається окремо.
+        """
+        if np is None or max_distance is None:
+            return [self.query_nearest(x, y, count, max_distance, categories) for x, y in zip(xs, ys)]
+        
+        qx = np.asarray(xs, dtype=np.float64)
+        qy = np.asarray(ys, dtype=np.float64)
+        pairs, entities, ex, ey, _, _, orders = self._gather_pairs(
+            [(x - max_distance, y - max_distance, max_distance * 2, max_distance * 2)
+             for x, y in zip(qx.tolist(), qy.tolist())],
+            self._category_bits(categories))
+        
+        dx = ex - qx[pairs]
+        dy = ey - qy[pairs]
+        distance_sq = dx * dx + dy * dy
+        keep = distance_sq <= max_distance * max_distance
+        
+        # Сортування за (запит, відстань, порядок реєстрації) і обрізання до count
+        selected = np.flatnonzero(keep)
+        selected = selected[np.lexsort((orders[selected], distance_sq[selected], pairs[selected]))]
+        results = [[] for _ in range(len(qx))]
+        for pair in selected.tolist():
+            result = results[pairs[pair]]
+            if len(result) < count:
+                result.append(entities[pair])
+        return results
+    
+    def raycasts(self, x1s, y1s, x2s, y2s, categories=None, tiles=True):
+        """
+        Пакетний raycast
+        
+        Обхід тайлів виконується для кожного відрізка окремо, а перевірка відрізків
+        проти прямокутників сутностей - одним векторизованим проходом.
+        """
+        if np is None:
+            return [self.raycast(x1, y1, x2, y2, categories, tiles) for x1, y1, x2, y2 in zip(x1s, y1s, x2s, y2s)]
+        
+        qx = np.asarray(x1s, dtype=np.float64)
+        qy = np.asarray(y1s, dtype=np.float64)
+        qdx = np.asarray(x2s, dtype=np.float64) - qx
+        qdy = np.asarray(y2s, dtype=np.float64) - qy
+        if tiles:
+            sweep_rect = self.grid.sweep_rect
+            hit_times = np.array([sweep_rect(x, y, 0, 0, dx, dy)[0] for x, y, dx, dy
+                                  in zip(qx.tolist(), qy.tolist(), qdx.tolist(), qdy.tolist())],
+                                 dtype=np.float64)
+        else:
+            hit_times = np.ones(qx.shape)
+        
+        end_x = qx + qdx * hit_times
+        end_y = qy + qdy * hit_times
+        pairs, entities, ex, ey, ew, eh, orders = self._gather_pairs(
+            zip(np.minimum(qx, end_x).tolist(), np.minimum(qy, end_y).tolist(),
+                np.abs(end_x - qx).tolist(), np.abs(end_y - qy).tolist()),
+            self._category_bits(categories))
+        
+        # Перетин відрізків з прямокутниками методом плит (slab test)
+        px = qx[pairs]
+        py = qy[pairs]
+        pdx = qdx[pairs]
+        pdy = qdy[pairs]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tx1 = (ex - px) / pdx
+            tx2 = (ex + ew - px) / pdx
+            ty1 = (ey - py) / pdy
+            ty2 = (ey + eh - py) / pdy
+        inside_x = (px > ex) & (px < ex + ew)
+        inside_y = (py > ey) & (py < ey + eh)
+        entry_x = np.where(pdx != 0, np.minimum(tx1, tx2), np.where(inside_x, -np.inf, np.inf))
+        exit_x = np.where(pdx != 0, np.maximum(tx1, tx2), np.where(inside_x, np.inf, -np.inf))
+        entry_y = np.where(pdy != 0, np.minimum(ty1, ty2), np.where(inside_y, -np.inf, np.inf))
+        exit_y = np.where(pdy != 0, np.maximum(ty1, ty2), np.where(inside_y, np.inf, -np.inf))
+        entry = np.maximum(np.maximum(entry_x, entry_y), 0.0)
+        keep = (entry <= np.minimum(exit_x, exit_y)) & (entry <= hit_times[pairs])
+        
+        results = []
+        for hit_time in hit_times.tolist():
+            results.append((hit_time, None) if hit_time < 1.0 else None)
+        selected = np.flatnonzero(keep)
+        selected = selected[np.lexsort((orders[selected], entry[selected], pairs[selected]))]
+        previous = -1
+        for pair in selected.tolist():
+            query = pairs[pair]
+            if query != previous:
+                # Перша пара запиту після сортування - найближча сутність
+                results[query] = (float(entry[pair]), entities[pair])
+                previous = query
+        return results
     
     def check_tile_collision(self, x, y, width, height):
-        """Перевірка зіткнень з тайлами карти"""
-        # Конвертація координат світу в координати тайлів
-        tile_x1 = int(x // TILE_SIZE)
-        tile_y1 = int(y // TILE_SIZE)
-        tile_x2 = int((x + width) // TILE_SIZE)
-        tile_y2 = int((y + height) // TILE_SIZE)
-        
-        # Перевірка меж карти
-        if (tile_x1 < 0 or tile_y1 < 0 or 
-            tile_x2 >= len(self.collision_map[0]) if self.collision_map else 0 or 
-            tile_y2 >= len(self.collision_map) if self.collision_map else 0):
-            return True  # За межами карти вважаємо зіткненням
-        
-        # Перевірка зіткнень з тайлами
-        for ty in range(tile_y1, tile_y2 + 1):
-            for tx in range(tile_x1, tile_x2 + 1):
-                if (ty < len(self.collision_map) and 
-                    tx < len(self.collision_map[ty]) and 
-                    self.collision_map[ty][tx] == 1):
-                    return True
-        
-        return False
+        """Перевірка зіткнень з тайлами карти (за межами карти вважаємо зіткненням)"""
+        return self.grid.rect_blocked(x, y, width, height)
+    
+    def check_tile_collisions(self, xs, ys, widths, heights):
+        """Пакетна перевірка зіткнень багатьох прямокутників з тайлами карти"""
+        return self.grid.rects_blocked(xs, ys, widths, heights)
     
     def check_entity_collision(self, entity1, entity2):
         """Перевірка зіткнень між двома сутностями"""
@@ -74,8 +456,128 @@ class CollisionSystem:
         # Перевірка перетину прямокутників
         return rect1.colliderect(rect2)
     
+    def sweep_tiles(self, x, y, width, height, delta_x, delta_y):
+        """Неперервна перевірка руху прямокутника відносно тайлів (див. CollisionGrid.sweep_rect)"""
+        return self.grid.sweep_rect(x, y, width, height, delta_x, delta_y)
+    
+    def sweep_entity(self, entity, other, delta_x, delta_y):
+        """
+        Swept AABB рухомої сутності відносно нерухомої
+        
+        Returns:
+            tuple або None: (час входу, час виходу, нормаль x, нормаль y), якщо прямокутники
+                            перетинаються протягом кроку; час входу < 0 - перетин був ще на початку
+        """
+        entry_x, exit_x, normal_x = self._sweep_axis(entity.x, entity.width, other.x, other.width, delta_x)
+        if entry_x is None:
+            return None
+        entry_y, exit_y, normal_y = self._sweep_axis(entity.y, entity.height, other.y, other.height, delta_y)
+        if entry_y is None:
+            return None
+        
+        entry = max(entry_x, entry_y)
+        exit_time = min(exit_x, exit_y)
+        if entry >= exit_time or entry > 1.0 or exit_time <= 0.0:
+            return None
+        
+        # Нормаль дає вісь, по якій перетин почався останнім
+        if entry_x >= entry_y:
+            return entry, exit_time, normal_x, 0
+        return entry, exit_time, 0, normal_y
+    
+    @staticmethod
+    def _sweep_axis(start, size, other_start, other_size, delta):
+        """Інтервал часу перетину по одній осі: (вхід, вихід, нормаль) або (None, None, 0)"""
+        if delta > 0:
+            return (other_start - (start + size)) / delta, (other_start + other_size - start) / delta, -1
+        if delta < 0:
+            return (other_start + other_size - start) / delta, (other_start - (start + size)) / delta, 1
+        if start < other_start + other_size and start + size > other_start:
+            return -math.inf, math.inf, 0
+        return None, None, 0
+    
+    def sweep(self, entity, delta_x, delta_y):
+        """
+        Неперервна перевірка руху сутності відносно тайлів і інших сутностей
+        
+        Returns:
+            tuple: (час зіткнення з тайлами, (нормаль x, нормаль y), сутності) - сутності, з якими
+                   прямокутник перетинається до зіткнення з тайлами, у порядку часу і реєстрації
+        """
+        time, normal_x, normal_y = self.grid.sweep_rect(entity.x, entity.y, entity.width, entity.height,
+                                                        delta_x, delta_y)
+        
+        # Кандидати з просторового хешу в межах усього пройденого шляху
+        moved_x = delta_x * time
+        moved_y = delta_y * time
+        query_x = entity.x + min(moved_x, 0)
+        query_y = entity.y + min(moved_y, 0)
+        candidates = self.spatial_hash.query_rect(query_x - 1, query_y - 1,
+                                                  entity.width + abs(moved_x) + 2,
+                                                  entity.height + abs(moved_y) + 2)
+        candidates.discard(entity)
+        
+        filters = self.collision_filters
+        category, mask = filters.get(entity, (ALL_CATEGORIES, ALL_CATEGORIES))
+        hits = []
+        for other in candidates:
+            if not (filters[other][0] & mask and filters[other][1] & category):
+                continue
+            contact = self.sweep_entity(entity, other, delta_x, delta_y)
+            if contact is not None and contact[0] <= time:
+                hits.append((max(contact[0], 0.0), self.entity_order[other], other))
+        hits.sort(key=lambda hit: hit[:2])
+        
+        return time, (normal_x, normal_y), [other for _, _, other in hits]
+    
     def resolve_movement(self, entity, delta_x, delta_y):
-        """Вирішення зіткнень при русі"""
+        """Вирішення зіткнень при русі (швидкі сутності перевіряються неперервно)"""
+        with self.profiler.section("collision"):
+            if max(abs(delta_x), abs(delta_y)) >= CCD_THRESHOLD:
+                return self._resolve_swept(entity, delta_x, delta_y)
+            return self._resolve_movement(entity, delta_x, delta_y)
+    
+    def _resolve_swept(self, entity, delta_x, delta_y):
+        """
+        Неперервне переміщення: рух до першої стіни, потім ковзання вздовж неї
+        
+        Сутності не зупиняють рух (як і в _resolve_movement), але всі, з якими прямокутник
+        перетнувся на шляху, отримують on_collision, навіть якщо крок їх перестрибнув.
+        """
+        if self.check_tile_collision(entity.x, entity.y, entity.width, entity.height):
+            # Сутність уже в стіні - неперервна перевірка неможлива
+            return self._resolve_movement(entity, delta_x, delta_y)
+        
+        touched = []
+        for _ in range(2):
+            time, (normal_x, normal_y), others = self.sweep(entity, delta_x, delta_y)
+            for other in others:
+                if other not in touched:
+                    touched.append(other)
+            
+            entity.x += delta_x * time
+            entity.y += delta_y * time
+            if time >= 1.0:
+                break
+            
+            # Залишок руху без компоненти вздовж нормалі стіни
+            delta_x = 0 if normal_x else delta_x * (1.0 - time)
+            delta_y = 0 if normal_y else delta_y * (1.0 - time)
+            if not delta_x and not delta_y:
+                break
+        
+        self.update_entity(entity)
+        
+        for other in touched:
+            # Обробник попереднього зіткнення міг видалити сутність (наприклад, підібраний предмет)
+            if other in self.entity_order:
+                entity.on_collision(other)
+                other.on_collision(entity)
+        
+        return entity.x, entity.y
+    
+    def _resolve_movement(self, entity, delta_x, delta_y):
+        """Переміщення сутності з перевіркою тайлів і сутностей"""
         # Спочатку намагаємося рухатися по осі X
         new_x = entity.x + delta_x
         if not self.check_tile_collision(new_x, entity.y, entity.width, entity.height):
@@ -86,11 +588,16 @@ class CollisionSystem:
         if not self.check_tile_collision(entity.x, new_y, entity.width, entity.height):
             entity.y = new_y
         
-        # Перевірка зіткнень з іншими сутностями
-        for other in self.entities:
-            if other is not entity and self.check_entity_collision(entity, other):
+        self.update_entity(entity)
+        self.dispatch_collisions(entity)
+        return entity.x, entity.y
+    
+    def dispatch_collisions(self, entity):
+        """Виклик on_collision для сутності і всіх сутностей, з якими вона перетинається"""
+        # Перевірка зіткнень лише з сусідами з просторового хешу
+        for other in self.get_collision_candidates(entity):
+            # Обробник попереднього зіткнення міг видалити сутність (наприклад, підібраний предмет)
+            if other in self.entity_order and self.check_entity_collision(entity, other):
                 # Викликаємо обробник зіткнень в обох сутностях
                 entity.on_collision(other)
-                other.on_collision(entity)
-        
-        return entity.x, entity.y
\ No newline at end of file
+                other.on_collision(entity)
\ No newline at end of file
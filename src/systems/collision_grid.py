@@ -0,0 +1,247 @@
+from array import array
+import math
+from src.utils.constants import TILE_SIZE
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього пакетні запити виконуються циклом
+    np = None
+
+# Зазор, на якому прямокутник зупиняється перед стіною (захист від похибки округлення)
+SWEEP_EPSILON = 1e-3
+
+
+class CollisionGrid:
+    """Компактна сітка зіткнень: один байт на тайл і таблиця префіксних сум"""
+    
+    def __init__(self, width, height, cells=None):
+        """
+        Ініціалізація сітки
+        
+        Args:
+            width, height: Розмір сітки в тайлах
+            cells: bytearray з width * height байтів (1 - стіна, 0 - прохід)
+        """
+        self.width = width
+        self.height = height
+        self.cells = cells if cells is not None else bytearray(width * height)
+        self.version = 0  # Збільшується при кожній зміні сітки
+        self._build_summed_area()
+    
+    @classmethod
+    def from_rows(cls, rows):
+        """Створення сітки зі списку рядків (значення 1 означає стіну)"""
+        height = len(rows)
+        width = max((len(row) for row in rows), default=0)
+        cells = bytearray(width * height)
+        for y, row in enumerate(rows):
+            offset = y * width
+            for x, value in enumerate(row):
+                if value == 1:
+                    cells[offset + x] = 1
+        return cls(width, height, cells)
+    
+    def _build_summed_area(self):
+        """
+        Побудова таблиці префіксних сум (summed-area table)
+        
+        summed[(y + 1) * (width + 1) + (x + 1)] - кількість стін у прямокутнику (0, 0)-(x, y).
+        Завдяки їй перевірка будь-якого прямокутника тайлів займає O(1).
+        """
+        stride = self.width + 1
+        if np is not None and self.width and self.height:
+            grid = np.frombuffer(bytes(self.cells), dtype=np.uint8).reshape(self.height, self.width)
+            summed = np.zeros((self.height + 1, stride), dtype=np.int64)
+            summed[1:, 1:] = grid.cumsum(axis=0, dtype=np.int64).cumsum(axis=1)
+            self.summed = array("q", summed.tobytes())
+        else:
+            self.summed = array("q", bytes(8 * stride * (self.height + 1)))
+            cells = self.cells
+            summed = self.summed
+            for y in range(self.height):
+                row_sum = 0
+                row = y * self.width
+                above = y * stride
+                current = (y + 1) * stride
+                for x in range(self.width):
+                    row_sum += cells[row + x]
+                    summed[current + x + 1] = summed[above + x + 1] + row_sum
+        
+        # Подання тих самих даних для векторизованих запитів (без копіювання)
+        if np is not None:
+            self.summed_view = np.frombuffer(self.summed, dtype=np.int64).reshape(self.height + 1, stride)
+        else:
+            self.summed_view = None
+    
+    def is_solid(self, tile_x, tile_y):
+        """Чи є тайл стіною (тайли за межами сітки вважаються стінами)"""
+        if 0 <= tile_x < self.width and 0 <= tile_y < self.height:
+            return self.cells[tile_y * self.width + tile_x] == 1
+        return True
+    
+    def set_tile(self, tile_x, tile_y, solid):
+        """Зміна тайлу (таблиця префіксних сум перебудовується)"""
+        self.cells[tile_y * self.width + tile_x] = 1 if solid else 0
+        self._build_summed_area()
+        self.version += 1
+    
+    def count_solid(self, tile_x1, tile_y1, tile_x2, tile_y2):
+        """Кількість стін у прямокутнику тайлів (межі включно, в межах сітки)"""
+        stride = self.width + 1
+        summed = self.summed
+        top = tile_y1 * stride
+        bottom = (tile_y2 + 1) * stride
+        return (summed[bottom + tile_x2 + 1] - summed[top + tile_x2 + 1]
+                - summed[bottom + tile_x1] + summed[top + tile_x1])
+    
+    def rect_blocked(self, x, y, width, height):
+        """
+        Перевірка, чи перекриває прямокутник у координатах світу хоча б одну стіну
+        
+        Прямокутник за межами карти вважається зіткненням; порожня сітка не блокує рух.
+        """
+        if not self.width:
+            return False
+        
+        # Конвертація координат світу в координати тайлів
+        tile_x1 = int(x // TILE_SIZE)
+        tile_y1 = int(y // TILE_SIZE)
+        tile_x2 = int((x + width) // TILE_SIZE)
+        tile_y2 = int((y + height) // TILE_SIZE)
+        
+        # Перевірка меж карти
+        if tile_x1 < 0 or tile_y1 < 0 or tile_x2 >= self.width or tile_y2 >= self.height:
+            return True
+        
+        return self.count_solid(tile_x1, tile_y1, tile_x2, tile_y2) > 0
+    
+    def _strip_blocked(self, tile_x1, tile_y1, tile_x2, tile_y2):
+        """Чи є стіна в смузі тайлів (вихід за межі сітки вважається стіною)"""
+        if tile_x1 < 0 or tile_y1 < 0 or tile_x2 >= self.width or tile_y2 >= self.height:
+            return True
+        return self.count_solid(tile_x1, tile_y1, tile_x2, tile_y2) > 0
+    
+    def sweep_rect(self, x, y, width, height, delta_x, delta_y):
+        """
+        Неперервна перевірка руху прямокутника по сітці (swept AABB + DDA)
+        
+        Обхід іде від перетину до перетину меж тайлів переднім краєм прямокутника;
+        на кожному перетині одна смуга нових тайлів перевіряється за O(1) через
+        таблицю префіксних сум, тож вартість залежить лише від кількості перетнутих тайлів.
+        
+        Args:
+            x, y, width, height: Прямокутник у координатах світу на початку руху
+            delta_x, delta_y: Зміщення за крок
+            
+        Returns:
+            tuple: (час зіткнення від 0 до 1, нормаль x, нормаль y); без зіткнення - (1.0, 0, 0).
+                   Якщо прямокутник уже перекриває стіну, повертається (0.0, 0, 0).
+        """
+        if not self.width or (not delta_x and not delta_y):
+            return 1.0, 0, 0
+        if self.rect_blocked(x, y, width, height):
+            return 0.0, 0, 0
+        
+        # Наступний стовпець/рядок тайлів і час, коли передній край до нього дійде
+        if delta_x > 0:
+            step_x = 1
+            column = int((x + width) // TILE_SIZE) + 1
+            time_x = (column * TILE_SIZE - (x + width)) / delta_x
+        elif delta_x < 0:
+            step_x = -1
+            column = int(x // TILE_SIZE) - 1
+            time_x = ((column + 1) * TILE_SIZE - x) / delta_x
+        else:
+            step_x = 0
+            column = 0
+            time_x = math.inf
+        
+        if delta_y > 0:
+            step_y = 1
+            row = int((y + height) // TILE_SIZE) + 1
+            time_y = (row * TILE_SIZE - (y + height)) / delta_y
+        elif delta_y < 0:
+            step_y = -1
+            row = int(y // TILE_SIZE) - 1
+            time_y = ((row + 1) * TILE_SIZE - y) / delta_y
+        else:
+            step_y = 0
+            row = 0
+            time_y = math.inf
+        
+        delta_time_x = TILE_SIZE / abs(delta_x) if delta_x else math.inf
+        delta_time_y = TILE_SIZE / abs(delta_y) if delta_y else math.inf
+        
+        while min(time_x, time_y) <= 1.0:
+            if time_x <= time_y:
+                # Передній край входить у новий стовпець: перевіряємо рядки, які займає прямокутник
+                top = y + delta_y * time_x
+                tile_y1, tile_y2 = self._span(top, top + height, step_y)
+                if self._strip_blocked(column, tile_y1, column, tile_y2):
+                    if step_x > 0:
+                        contact = column * TILE_SIZE - width - SWEEP_EPSILON
+                    else:
+                        contact = (column + 1) * TILE_SIZE + SWEEP_EPSILON
+                    return max(0.0, min(time_x, (contact - x) / delta_x)), -step_x, 0
+                column += step_x
+                time_x += delta_time_x
+            else:
+                left = x + delta_x * time_y
+                tile_x1, tile_x2 = self._span(left, left + width, step_x)
+                if self._strip_blocked(tile_x1, row, tile_x2, row):
+                    if step_y > 0:
+                        contact = row * TILE_SIZE - height - SWEEP_EPSILON
+                    else:
+                        contact = (row + 1) * TILE_SIZE + SWEEP_EPSILON
+                    return max(0.0, min(time_y, (contact - y) / delta_y)), 0, -step_y
+                row += step_y
+                time_y += delta_time_y
+        
+        return 1.0, 0, 0
+    
+    def _span(self, start, end, step):
+        """
+        Діапазон тайлів, які займає відрізок [start, end] одразу після поточного моменту
+        
+        При русі в напрямку зменшення координати межа тайлу, на якій стоїть край,
+        уже перетинається, тому індекс береться на одиницю менший.
+        """
+        if step < 0:
+            return math.ceil(start / TILE_SIZE) - 1, math.ceil(end / TILE_SIZE) - 1
+        return int(start // TILE_SIZE), int(end // TILE_SIZE)
+    
+    def rects_blocked(self, xs, ys, widths, heights):
+        """
+        Пакетна перевірка багатьох прямокутників
+        
+        Args:
+            xs, ys, widths, heights: Послідовності (або масиви NumPy) однакової довжини
+            
+        Returns:
+            Масив NumPy bool (або список bool без NumPy)
+        """
+        if np is None:
+            return [self.rect_blocked(x, y, w, h) for x, y, w, h in zip(xs, ys, widths, heights)]
+        
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if not self.width:
+            return np.zeros(xs.shape, dtype=bool)
+        
+        tile_x1 = np.floor_divide(xs, TILE_SIZE).astype(np.int64)
+        tile_y1 = np.floor_divide(ys, TILE_SIZE).astype(np.int64)
+        tile_x2 = np.floor_divide(xs + widths, TILE_SIZE).astype(np.int64)
+        tile_y2 = np.floor_divide(ys + heights, TILE_SIZE).astype(np.int64)
+        
+        outside = (tile_x1 < 0) | (tile_y1 < 0) | (tile_x2 >= self.width) | (tile_y2 >= self.height)
+        
+        # Індекси обмежуються межами сітки; результат для них визначає outside
+        tx1 = np.clip(tile_x1, 0, self.width - 1)
+        ty1 = np.clip(tile_y1, 0, self.height - 1)
+        tx2 = np.clip(tile_x2, 0, self.width - 1)
+        ty2 = np.clip(tile_y2, 0, self.height - 1)
+        
+        summed = self.summed_view
+        solid = (summed[ty2 + 1, tx2 + 1] - summed[ty1, tx2 + 1]
+                 - summed[ty2 + 1, tx1] + summed[ty1, tx1])
+        return outside | (solid > 0)
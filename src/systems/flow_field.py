@@ -0,0 +1,158 @@
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього пакетний режим читає поле поелементно
+    np = None
+
+from src.utils.constants import TILE_SIZE, FLOW_FIELD_RADIUS
+
+# Сусіди тайла: спочатку прямі, потім діагональні (порядок визначає вибір при рівній відстані)
+ORTHOGONAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL = ((1, 1), (-1, 1), (1, -1), (-1, -1))
+
+
+class FlowField:
+    """
+    Спільне поле напрямків до цілі (гравця) над сіткою зіткнень
+    
+    Поле відстаней будується пошуком у ширину від тайла цілі і перебудовується
+    лише тоді, коли ціль переходить на інший тайл. Для кожного досягнутого тайла
+    одразу запам'ятовується наступний тайл шляху, тож ворог отримує крок за O(1)
+    незалежно від кількості ворогів.
+    """
+    
+    def __init__(self, grid, radius=FLOW_FIELD_RADIUS):
+        """
+        Ініціалізація поля
+        
+        Args:
+            grid: CollisionGrid
+            radius: Максимальна довжина шляху в тайлах (далі поле не будується)
+        """
+        self.grid = grid
+        self.radius = radius
+        size = grid.width * grid.height
+        self.distances = array("i", [-1]) * size   # Відстань до цілі в кроках (-1 - не досягнуто)
+        self.next_tiles = array("i", [-1]) * size  # Наступний тайл шляху (-1 - немає)
+        self.visited = []  # Тайли, заповнені останньою побудовою (для швидкого скидання)
+        self.target = None
+        self.version = grid.version
+        self.builds = 0
+    
+    def _tile_of(self, x, y):
+        """Індекс тайла точки (None - за межами сітки)"""
+        tile_x = int(x // TILE_SIZE)
+        tile_y = int(y // TILE_SIZE)
+        if 0 <= tile_x < self.grid.width and 0 <= tile_y < self.grid.height:
+            return tile_y * self.grid.width + tile_x
+        return None
+    
+    def update(self, x, y):
+        """
+        Оновлення поля для цілі в точці (x, y)
+        
+        Returns:
+            bool: True, якщо поле було перебудовано
+        """
+        target = self._tile_of(x, y)
+        if target == self.target and self.version == self.grid.version:
+            return False
+        self.target = target
+        self.version = self.grid.version
+        self._build()
+        return True
+    
+    def _build(self):
+        """Пошук у ширину від цілі та вибір наступного тайла для кожного досягнутого тайла"""
+        distances = self.distances
+        next_tiles = self.next_tiles
+        for index in self.visited:
+            distances[index] = -1
+            next_tiles[index] = -1
+        self.visited = []
+        self.builds += 1
+        
+        if self.target is None or self.grid.cells[self.target]:
+            return
+        
+        width = self.grid.width
+        height = self.grid.height
+        cells = self.grid.cells
+        radius = self.radius
+        visited = [self.target]
+        distances[self.target] = 0
+        queue = deque(visited)
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            if distance > radius:
+                continue
+            tile_x, tile_y = index % width, index // width
+            for offset_x, offset_y in ORTHOGONAL:
+                neighbour_x = tile_x + offset_x
+                neighbour_y = tile_y + offset_y
+                if 0 <= neighbour_x < width and 0 <= neighbour_y < height:
+                    neighbour = neighbour_y * width + neighbour_x
+                    if distances[neighbour] < 0 and not cells[neighbour]:
+                        distances[neighbour] = distance
+                        visited.append(neighbour)
+                        queue.append(neighbour)
+        
+        # Наступний тайл - сусід з найменшою відстанню; діагональ лише без зрізання кутів
+        for index in visited:
+            best = distances[index]
+            best_tile = -1
+            tile_x, tile_y = index % width, index // width
+            for offset_x, offset_y in ORTHOGONAL + DIAGONAL:
+                neighbour_x = tile_x + offset_x
+                neighbour_y = tile_y + offset_y
+                if not (0 <= neighbour_x < width and 0 <= neighbour_y < height):
+                    continue
+                neighbour = neighbour_y * width + neighbour_x
+                neighbour_distance = distances[neighbour]
+                if neighbour_distance < 0 or neighbour_distance >= best:
+                    continue
+                if offset_x and offset_y and (cells[tile_y * width + neighbour_x] or cells[neighbour_y * width + tile_x]):
+                    continue
+                best = neighbour_distance
+                best_tile = neighbour
+            next_tiles[index] = best_tile
+        self.visited = visited
+    
+    def next_waypoint(self, x, y):
+        """
+        Центр наступного тайла шляху до цілі для точки (x, y)
+        
+        Returns:
+            tuple або None: (x, y) у координатах світу; None - точка в тайлі цілі або поза полем
+        """
+        index = self._tile_of(x, y)
+        if index is None:
+            return None
+        next_tile = self.next_tiles[index]
+        if next_tile < 0:
+            return None
+        width = self.grid.width
+        return (next_tile % width + 0.5) * TILE_SIZE, (next_tile // width + 0.5) * TILE_SIZE
+    
+    def next_waypoints(self, xs, ys):
+        """
+        Пакетний next_waypoint для масивів точок
+        
+        Returns:
+            tuple: (масив x, масив y, маска наявності точки шляху)
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        width = self.grid.width
+        tile_x = np.floor_divide(xs, TILE_SIZE).astype(np.int64)
+        tile_y = np.floor_divide(ys, TILE_SIZE).astype(np.int64)
+        inside = (tile_x >= 0) & (tile_x < width) & (tile_y >= 0) & (tile_y < self.grid.height)
+        next_tiles = np.frombuffer(self.next_tiles, dtype=np.int32)
+        if not len(next_tiles):
+            return xs, ys, np.zeros(xs.shape, dtype=bool)
+        next_tile = np.where(inside, next_tiles[np.where(inside, tile_y * width + tile_x, 0)], -1)
+        found = next_tile >= 0
+        return ((next_tile % width + 0.5) * TILE_SIZE, (next_tile // width + 0.5) * TILE_SIZE, found)
@@ -0,0 +1,190 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього пакетний режим перевіряє пари по одній
+    np = None
+
+from src.utils.constants import TILE_SIZE, LOS_CACHE_SIZE
+
+
+class LineOfSight:
+    """
+    Пряма видимість між тайлами сітки зіткнень (DDA Amanatides-Woo)
+    
+    Видимість рахується між центрами тайлів, тому результат залежить лише від пари
+    тайлів і кешується за нею. Кеш скидається, коли змінюється сітка (grid.version).
+    """
+    
+    def __init__(self, grid, cache_size=LOS_CACHE_SIZE):
+        """
+        Ініціалізація сервісу видимості
+        
+        Args:
+            grid: CollisionGrid
+            cache_size: Максимальна кількість пар тайлів у кеші (при переповненні кеш очищується)
+        """
+        self.grid = grid
+        self.cache_size = cache_size
+        self.cache = {}  # (індекс тайла спостерігача, індекс тайла цілі) -> bool
+        self.version = grid.version
+        self.hits = 0
+        self.misses = 0
+    
+    def _check_version(self):
+        """Скидання кешу після зміни сітки"""
+        if self.version != self.grid.version:
+            self.cache.clear()
+            self.version = self.grid.version
+    
+    def _tile_of(self, x, y):
+        """Індекс тайла точки (None - за межами сітки)"""
+        tile_x = int(x // TILE_SIZE)
+        tile_y = int(y // TILE_SIZE)
+        if 0 <= tile_x < self.grid.width and 0 <= tile_y < self.grid.height:
+            return tile_y * self.grid.width + tile_x
+        return None
+    
+    def can_see(self, from_x, from_y, to_x, to_y):
+        """Чи немає стін між тайлами двох точок у координатах світу"""
+        self._check_version()
+        start = self._tile_of(from_x, from_y)
+        end = self._tile_of(to_x, to_y)
+        if start is None or end is None:
+            return False
+        
+        key = (start, end)
+        visible = self.cache.get(key)
+        if visible is None:
+            self.misses += 1
+            visible = self.trace(start, end)
+            self._store(key, visible)
+        else:
+            self.hits += 1
+        return visible
+    
+    def _store(self, key, visible):
+        """Запис результату в кеш"""
+        if len(self.cache) >= self.cache_size:
+            self.cache.clear()
+        self.cache[key] = visible
+    
+    def trace(self, start, end):
+        """
+        Обхід тайлів між центрами двох тайлів
+        
+        Центри лежать на половинах тайлів, тому моменти перетину меж порівнюються
+        в цілих числах: крок по x робиться, коли (2i + 1) * |dy| <= (2j + 1) * |dx|,
+        де i і j - кількість уже зроблених кроків по осях. При рівності (лінія
+        проходить через кут) першим робиться крок по x.
+        
+        Returns:
+            bool: True, якщо жоден проміжний тайл не є стіною (початок і кінець не перевіряються)
+        """
+        width = self.grid.width
+        cells = self.grid.cells
+        tile_x, tile_y = start % width, start // width
+        delta_x = end % width - tile_x
+        delta_y = end // width - tile_y
+        abs_x = abs(delta_x)
+        abs_y = abs(delta_y)
+        step_x = 1 if delta_x > 0 else -1
+        step_y = width if delta_y > 0 else -width
+        
+        index = start
+        steps_x = 0
+        steps_y = 0
+        remaining = abs_x + abs_y - 1  # Проміжні тайли (кінцевий не перевіряється)
+        while remaining > 0:
+            if steps_y >= abs_y or (steps_x < abs_x and (2 * steps_x + 1) * abs_y <= (2 * steps_y + 1) * abs_x):
+                index += step_x
+                steps_x += 1
+            else:
+                index += step_y
+                steps_y += 1
+            if cells[index]:
+                return False
+            remaining -= 1
+        return True
+    
+    def can_see_many(self, xs, ys, to_x, to_y):
+        """
+        Пакетна перевірка видимості однієї цілі з багатьох точок
+        
+        Точки групуються за тайлами; для пар, яких немає в кеші, обхід DDA
+        виконується для всіх променів одночасно масивами NumPy.
+        
+        Returns:
+            Масив NumPy bool (або список bool без NumPy)
+        """
+        if np is None:
+            return [self.can_see(x, y, to_x, to_y) for x, y in zip(xs, ys)]
+        
+        self._check_version()
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        result = np.zeros(xs.shape, dtype=bool)
+        end = self._tile_of(to_x, to_y)
+        if end is None or not len(xs):
+            return result
+        
+        width = self.grid.width
+        tile_x = np.floor_divide(xs, TILE_SIZE).astype(np.int64)
+        tile_y = np.floor_divide(ys, TILE_SIZE).astype(np.int64)
+        inside = (tile_x >= 0) & (tile_x < width) & (tile_y >= 0) & (tile_y < self.grid.height)
+        starts = np.where(inside, tile_y * width + tile_x, -1)
+        
+        # Унікальні тайли спостерігачів: з кешу або одним векторним обходом
+        unique, inverse = np.unique(starts, return_inverse=True)
+        visible = np.zeros(unique.shape, dtype=bool)
+        missing = []
+        cache = self.cache
+        for position, start in enumerate(unique.tolist()):
+            if start < 0:
+                continue
+            cached = cache.get((start, end))
+            if cached is None:
+                missing.append(position)
+            else:
+                visible[position] = cached
+        self.hits += len(unique) - len(missing)
+        self.misses += len(missing)
+        
+        if missing:
+            missing = np.array(missing, dtype=np.int64)
+            traced = self._trace_many(unique[missing], end)
+            visible[missing] = traced
+            for start, value in zip(unique[missing].tolist(), traced.tolist()):
+                self._store((start, end), value)
+        
+        result[:] = visible[inverse.reshape(-1)]
+        return result
+    
+    def _trace_many(self, starts, end):
+        """Векторизований trace: усі промені до одного тайла роблять кроки одночасно"""
+        width = self.grid.width
+        cells = np.frombuffer(bytes(self.grid.cells), dtype=np.uint8)
+        delta_x = end % width - starts % width
+        delta_y = end // width - starts // width
+        abs_x = np.abs(delta_x)
+        abs_y = np.abs(delta_y)
+        step_x = np.where(delta_x > 0, 1, -1)
+        step_y = np.where(delta_y > 0, width, -width)
+        
+        index = starts.copy()
+        steps_x = np.zeros(starts.shape, dtype=np.int64)
+        steps_y = np.zeros(starts.shape, dtype=np.int64)
+        remaining = abs_x + abs_y - 1
+        visible = np.ones(starts.shape, dtype=bool)
+        active = remaining > 0
+        while active.any():
+            move_x = (steps_y >= abs_y) | ((steps_x < abs_x) & ((2 * steps_x + 1) * abs_y <= (2 * steps_y + 1) * abs_x))
+            move_x &= active
+            move_y = active & ~move_x
+            index += np.where(move_x, step_x, 0) + np.where(move_y, step_y, 0)
+            steps_x += move_x
+            steps_y += move_y
+            
+            blocked = active & (cells[np.where(active, index, 0)] != 0)
+            visible &= ~blocked
+            remaining -= active
+            active &= ~blocked & (remaining > 0)
+        return visible
@@ -0,0 +1,318 @@
+import heapq
+from collections import OrderedDict
+from src.utils.constants import TILE_SIZE, PATH_CLUSTER_SIZE, PATH_CACHE_SIZE
+
+# Вартість діагонального кроку (рух по 8 напрямках без зрізання кутів стін)
+DIAGONAL_COST = 2 ** 0.5
+NEIGHBOURS = ((1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+              (1, 1, DIAGONAL_COST), (-1, 1, DIAGONAL_COST), (1, -1, DIAGONAL_COST), (-1, -1, DIAGONAL_COST))
+INF = float("inf")
+# Прохід між кластерами, довший за це значення, дає два входи (на кінцях), коротший - один (посередині)
+ENTRANCE_SPLIT_LENGTH = 6
+
+
+class HierarchicalPathfinder:
+    """
+    Ієрархічний A* (HPA*) над сіткою зіткнень
+    
+    Карта ділиться на квадратні кластери. При створенні знаходяться входи між
+    сусідніми кластерами і будується абстрактний граф: ребра між входами одного
+    кластера (з готовими шляхами по тайлах) і ребра через межу кластерів. Довгий
+    маршрут шукається A* по абстрактному графу, а середня частина маршруту
+    кешується за парою (кластер старту, кластер цілі).
+    """
+    
+    def __init__(self, grid, cluster_size=PATH_CLUSTER_SIZE, cache_size=PATH_CACHE_SIZE):
+        """
+        Ініціалізація і побудова абстрактного графа
+        
+        Args:
+            grid: CollisionGrid
+            cluster_size: Розмір кластера в тайлах
+            cache_size: Кількість маршрутів між парами кластерів у LRU-кеші
+        """
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # (кластер старту, кластер цілі) -> (перший вхід, останній вхід, тайли між ними)
+        self.hits = 0
+        self.misses = 0
+        self.build()
+    
+    def build(self):
+        """Пошук входів між кластерами і шляхів між входами всередині кластерів"""
+        self.version = self.grid.version
+        self.clusters_x = -(-self.grid.width // self.cluster_size)
+        self.edges = {}  # тайл входу -> [(сусідній вхід, вартість)]
+        self.edge_paths = {}  # (вхід, вхід) -> тайли шляху без початкового
+        self.cluster_nodes = {}  # кластер -> входи в ньому
+        self.cache.clear()
+        
+        self._find_entrances()
+        for cluster, nodes in self.cluster_nodes.items():
+            for node in nodes:
+                costs, parents = self._search_cluster(node, cluster)
+                for other in nodes:
+                    if other != node and other in costs:
+                        self._add_edge(node, other, costs[other], self._trace(parents, other, node))
+    
+    def _check_version(self):
+        """Перебудова графа після зміни сітки"""
+        if self.version != self.grid.version:
+            self.build()
+    
+    def _cluster_of(self, tile):
+        """Індекс кластера тайла"""
+        width = self.grid.width
+        return (tile // width) // self.cluster_size * self.clusters_x + (tile % width) // self.cluster_size
+    
+    def _add_node(self, tile):
+        """Додавання входу до абстрактного графа"""
+        if tile not in self.edges:
+            self.edges[tile] = []
+            self.cluster_nodes.setdefault(self._cluster_of(tile), []).append(tile)
+    
+    def _add_edge(self, node, other, cost, path):
+        """Ребро абстрактного графа з шляхом по тайлах"""
+        self.edges[node].append((other, cost))
+        self.edge_paths[(node, other)] = path
+    
+    def _find_entrances(self):
+        """Входи на межах кластерів: відрізки вільних пар тайлів по обидва боки межі"""
+        width = self.grid.width
+        height = self.grid.height
+        cells = self.grid.cells
+        size = self.cluster_size
+        
+        # Вертикальні межі (між кластером і сусідом праворуч), потім горизонтальні
+        borders = []
+        for border_x in range(size, width, size):
+            for start_y in range(0, height, size):
+                borders.append([((border_x - 1) + y * width, border_x + y * width)
+                                for y in range(start_y, min(start_y + size, height))])
+        for border_y in range(size, height, size):
+            for start_x in range(0, width, size):
+                borders.append([((border_y - 1) * width + x, border_y * width + x)
+                                for x in range(start_x, min(start_x + size, width))])
+        
+        for border in borders:
+            run = []
+            for inner, outer in border + [(None, None)]:
+                if inner is not None and not cells[inner] and not cells[outer]:
+                    run.append((inner, outer))
+                    continue
+                if run:
+                    # Довгий прохід отримує два входи, короткий - один посередині
+                    if len(run) >= ENTRANCE_SPLIT_LENGTH:
+                        transitions = (run[0], run[-1])
+                    else:
+                        transitions = (run[len(run) // 2],)
+                    for first, second in transitions:
+                        self._add_node(first)
+                        self._add_node(second)
+                        self._add_edge(first, second, 1.0, [second])
+                        self._add_edge(second, first, 1.0, [first])
+                    run = []
+    
+    def _search_cluster(self, start, cluster, goal=None):
+        """
+        Дейкстра від тайла в межах одного кластера
+        
+        Returns:
+            tuple: (тайл -> вартість, тайл -> попередній тайл)
+        """
+        width = self.grid.width
+        height = self.grid.height
+        cells = self.grid.cells
+        size = self.cluster_size
+        min_x = cluster % self.clusters_x * size
+        min_y = cluster // self.clusters_x * size
+        max_x = min(min_x + size, width) - 1
+        max_y = min(min_y + size, height) - 1
+        
+        costs = {start: 0.0}
+        parents = {}
+        queue = [(0.0, start)]
+        while queue:
+            cost, tile = heapq.heappop(queue)
+            if cost > costs[tile]:
+                continue
+            if tile == goal:
+                break
+            tile_x, tile_y = tile % width, tile // width
+            for offset_x, offset_y, step in NEIGHBOURS:
+                next_x = tile_x + offset_x
+                next_y = tile_y + offset_y
+                if not (min_x <= next_x <= max_x and min_y <= next_y <= max_y):
+                    continue
+                neighbour = next_y * width + next_x
+                if cells[neighbour]:
+                    continue
+                if offset_x and offset_y and (cells[tile_y * width + next_x] or cells[next_y * width + tile_x]):
+                    continue
+                new_cost = cost + step
+                if new_cost < costs.get(neighbour, INF):
+                    costs[neighbour] = new_cost
+                    parents[neighbour] = tile
+                    heapq.heappush(queue, (new_cost, neighbour))
+        return costs, parents
+    
+    def _trace(self, parents, tile, start):
+        """Тайли від start (не включно) до tile за словником попередників"""
+        path = []
+        while tile != start:
+            path.append(tile)
+            tile = parents[tile]
+        path.reverse()
+        return path
+    
+    def _heuristic(self, tile, goal):
+        """Октильна відстань між тайлами"""
+        width = self.grid.width
+        dx = abs(tile % width - goal % width)
+        dy = abs(tile // width - goal // width)
+        return max(dx, dy) + (DIAGONAL_COST - 1) * min(dx, dy)
+    
+    def _tile_of(self, x, y):
+        """Вільний тайл точки (None - стіна або за межами сітки)"""
+        tile_x = int(x // TILE_SIZE)
+        tile_y = int(y // TILE_SIZE)
+        if 0 <= tile_x < self.grid.width and 0 <= tile_y < self.grid.height:
+            tile = tile_y * self.grid.width + tile_x
+            if not self.grid.cells[tile]:
+                return tile
+        return None
+    
+    def is_walkable(self, x, y):
+        """Чи лежить точка світу на вільному тайлі"""
+        return self._tile_of(x, y) is not None
+    
+    def find_path(self, start_x, start_y, goal_x, goal_y):
+        """
+        Пошук шляху між двома точками світу
+        
+        Returns:
+            list або None: Точки шляху (центри тайлів у місцях зміни напрямку, остання -
+                           центр тайла цілі) або None, якщо ціль недосяжна
+        """
+        self._check_version()
+        start = self._tile_of(start_x, start_y)
+        goal = self._tile_of(goal_x, goal_y)
+        if start is None or goal is None:
+            return None
+        if start == goal:
+            return self._to_waypoints([goal])
+        
+        tiles = self.find_tile_path(start, goal)
+        if tiles is None:
+            return None
+        return self._to_waypoints(tiles)
+    
+    def find_tile_path(self, start, goal):
+        """
+        Пошук шляху між двома вільними тайлами
+        
+        Returns:
+            list або None: Тайли шляху без початкового
+        """
+        start_cluster = self._cluster_of(start)
+        goal_cluster = self._cluster_of(goal)
+        start_costs, start_parents = self._search_cluster(start, start_cluster)
+        
+        # У межах одного кластера досить локального пошуку
+        if start_cluster == goal_cluster and goal in start_costs:
+            return self._trace(start_parents, goal, start)
+        
+        goal_costs, goal_parents = self._search_cluster(goal, goal_cluster)
+        
+        # Середина маршруту між входами кластерів береться з кешу, якщо входи досяжні
+        key = (start_cluster, goal_cluster)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] in start_costs and cached[1] in goal_costs:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            first, last, middle = cached
+        else:
+            self.misses += 1
+            nodes = self._search_abstract(start_cluster, start_costs, goal_cluster, goal_costs, goal)
+            if nodes is None:
+                return None
+            first, last = nodes[0], nodes[-1]
+            middle = []
+            for node, next_node in zip(nodes, nodes[1:]):
+                middle.extend(self.edge_paths[(node, next_node)])
+            self.cache[key] = (first, last, middle)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        
+        # Повний шлях: старт -> перший вхід -> ... -> останній вхід -> ціль
+        path = self._trace(start_parents, first, start) + middle
+        path.extend(reversed(self._trace(goal_parents, last, goal)[:-1]))
+        if last != goal:
+            path.append(goal)
+        return path
+    
+    def _search_abstract(self, start_cluster, start_costs, goal_cluster, goal_costs, goal):
+        """
+        A* по абстрактному графу від входів кластера старту до входів кластера цілі
+        
+        Returns:
+            list або None: Входи маршруту
+        """
+        edges = self.edges
+        goal_cost_of = {node: goal_costs[node] for node in self.cluster_nodes.get(goal_cluster, ())
+                        if node in goal_costs}
+        if not goal_cost_of:
+            return None
+        
+        best = {}
+        parents = {}
+        queue = []
+        for node in self.cluster_nodes.get(start_cluster, ()):
+            if node in start_costs:
+                best[node] = start_costs[node]
+                parents[node] = None
+                heapq.heappush(queue, (start_costs[node] + self._heuristic(node, goal), start_costs[node], node))
+        
+        finish = None
+        finish_cost = INF
+        while queue:
+            estimate, cost, node = heapq.heappop(queue)
+            if estimate >= finish_cost:
+                break
+            if cost > best[node]:
+                continue
+            if node in goal_cost_of and cost + goal_cost_of[node] < finish_cost:
+                finish = node
+                finish_cost = cost + goal_cost_of[node]
+            for neighbour, step in edges[node]:
+                new_cost = cost + step
+                if new_cost < best.get(neighbour, INF):
+                    best[neighbour] = new_cost
+                    parents[neighbour] = node
+                    heapq.heappush(queue, (new_cost + self._heuristic(neighbour, goal), new_cost, neighbour))
+        
+        if finish is None:
+            return None
+        nodes = []
+        while finish is not None:
+            nodes.append(finish)
+            finish = parents[finish]
+        nodes.reverse()
+        return nodes
+    
+    def _to_waypoints(self, tiles):
+        """Центри тайлів шляху, де змінюється напрямок руху (і кінцевий тайл)"""
+        width = self.grid.width
+        waypoints = []
+        previous = None
+        direction = None
+        for tile in tiles:
+            if previous is not None:
+                step = tile - previous
+                if direction is not None and step != direction:
+                    waypoints.append(previous)
+                direction = step
+            previous = tile
+        waypoints.append(tiles[-1])
+        return [((tile % width + 0.5) * TILE_SIZE, (tile // width + 0.5) * TILE_SIZE) for tile in waypoints]
@@ -1,5 +1,10 @@
 import math
-from src.utils.constants import GRAVITY, FRICTION
+from src.utils.constants import GRAVITY, FRICTION, CCD_THRESHOLD
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього тіла оновлюються по одному через update()
+    np = None
 
 class PhysicsSystem:
     """Система фізики для ігрових об'єктів"""
@@ -8,6 +13,140 @@ class PhysicsSystem:
         """Ініціалізація системи фізики"""
         self.collision_system = collision_system
         self.gravity_enabled = False  # Увімкнення/вимкнення гравітації
+        
+        # Зареєстровані фізичні тіла (сутності з velocity_x і velocity_y) для update_bodies
+        self.bodies = []
+        self.max_speeds = []  # Максимальна швидкість кожного тіла
+        self.body_index = {}  # тіло -> позиція в bodies
+        self._body_arrays = None  # Кеш (сховище, ідентифікатори, максимальні швидкості)
+    
+    def register_body(self, entity, max_speed=None):
+        """
+        Реєстрація фізичного тіла для пакетного оновлення
+        
+        Args:
+            entity: Сутність з x, y, width, height, velocity_x, velocity_y
+            max_speed: Максимальна швидкість (за замовчуванням entity.max_speed або 500)
+        """
+        if entity in self.body_index:
+            return
+        self.body_index[entity] = len(self.bodies)
+        self.bodies.append(entity)
+        self.max_speeds.append(max_speed if max_speed is not None else getattr(entity, 'max_speed', 500))
+        self._body_arrays = None
+    
+    def unregister_body(self, entity):
+        """Видалення фізичного тіла"""
+        index = self.body_index.pop(entity, None)
+        if index is None:
+            return
+        del self.bodies[index]
+        del self.max_speeds[index]
+        self.body_index = {body: position for position, body in enumerate(self.bodies)}
+        self._body_arrays = None
+    
+    def _gather(self, name):
+        """Поле всіх тіл масивом NumPy"""
+        return np.fromiter((getattr(body, name) for body in self.bodies), dtype=np.float64, count=len(self.bodies))
+    
+    def update_bodies(self, delta_time):
+        """
+        Пакетне оновлення всіх зареєстрованих тіл
+        
+        Ті самі кроки, що й update(): гравітація, тертя, зупинка, обмеження
+        швидкості й рух з розв'язанням зіткнень окремо по осях, але над масивами.
+        Поля тіл з одного EntityStore читаються і записуються поданнями без
+        копіювання об'єктів. Тіла, що зміщуються на CCD_THRESHOLD і більше,
+        рухаються через resolve_movement (неперервна перевірка).
+        """
+        bodies = list(self.bodies)  # Обробники зіткнень можуть змінити список тіл
+        if not bodies:
+            return
+        if np is None:
+            for body in bodies:
+                self.update(body, delta_time)
+            return
+        
+        if self._body_arrays is None:
+            store = getattr(bodies[0], 'store', None)
+            if store is None or any(getattr(body, 'store', None) is not store for body in bodies):
+                store = None
+            ids = store.ids_of(bodies) if store is not None else None
+            self._body_arrays = (store, ids, np.array(self.max_speeds, dtype=np.float64))
+        store, ids, max_speeds = self._body_arrays
+        
+        if store is not None:
+            x, y, width, height, velocity_x, velocity_y = (store.view(name)[ids] for name in
+                                                           ('x', 'y', 'width', 'height', 'velocity_x', 'velocity_y'))
+        else:
+            x, y, width, height, velocity_x, velocity_y = (self._gather(name) for name in
+                                                           ('x', 'y', 'width', 'height', 'velocity_x', 'velocity_y'))
+        
+        # Гравітація і тертя
+        if self.gravity_enabled:
+            velocity_y += GRAVITY * delta_time
+        velocity_x *= (1 - FRICTION * delta_time)
+        velocity_y *= (1 - FRICTION * delta_time)
+        
+        # Зупинка тіл з дуже малою швидкістю
+        velocity_x[np.abs(velocity_x) < 0.1] = 0
+        velocity_y[np.abs(velocity_y) < 0.1] = 0
+        
+        # Обмеження максимальної швидкості
+        speed = np.sqrt(velocity_x**2 + velocity_y**2)
+        over = speed > max_speeds
+        if over.any():
+            scale = max_speeds[over] / speed[over]
+            velocity_x[over] *= scale
+            velocity_y[over] *= scale
+        
+        # Рух окремо по осях з перевіркою тайлів (як у CollisionSystem._resolve_movement)
+        collision_system = self.collision_system
+        delta_x = velocity_x * delta_time
+        delta_y = velocity_y * delta_time
+        slow = np.maximum(np.abs(delta_x), np.abs(delta_y)) < CCD_THRESHOLD
+        with collision_system.profiler.section("collision"):
+            new_x = x + delta_x
+            moved_x = slow & ~collision_system.check_tile_collisions(new_x, y, width, height)
+            x = np.where(moved_x, new_x, x)
+            new_y = y + delta_y
+            moved_y = slow & ~collision_system.check_tile_collisions(x, new_y, width, height)
+            y = np.where(moved_y, new_y, y)
+        
+        # Якщо тіло стикнулося з перешкодою, скидаємо відповідну компоненту швидкості
+        velocity_x[slow & (x != new_x)] = 0
+        velocity_y[slow & (y != new_y)] = 0
+        
+        if store is not None:
+            for name, values in (('x', x), ('y', y), ('velocity_x', velocity_x), ('velocity_y', velocity_y)):
+                store.view(name)[ids] = values
+        else:
+            for body, body_x, body_y, body_velocity_x, body_velocity_y in zip(
+                    bodies, x.tolist(), y.tolist(), velocity_x.tolist(), velocity_y.tolist()):
+                body.x, body.y = body_x, body_y
+                body.velocity_x, body.velocity_y = body_velocity_x, body_velocity_y
+        
+        # Швидкі тіла - неперервна перевірка по одному
+        for index in np.flatnonzero(~slow).tolist():
+            body = bodies[index]
+            step_x = float(delta_x[index])
+            step_y = float(delta_y[index])
+            new_body_x = body.x + step_x
+            new_body_y = body.y + step_y
+            body.x, body.y = collision_system.resolve_movement(body, step_x, step_y)
+            if body.x != new_body_x:
+                body.velocity_x = 0
+            if body.y != new_body_y:
+                body.velocity_y = 0
+        
+        # Оновлення broadphase для зміщених тіл і обробники зіткнень з сутностями
+        with collision_system.profiler.section("collision"):
+            moved = moved_x | moved_y
+            for index in np.flatnonzero(slow).tolist():
+                body = bodies[index]
+                if moved[index]:
+                    collision_system.update_entity(body)
+                collision_system.dispatch_collisions(body)
     
     def update(self, entity, delta_time):
         """Оновлення фізики для сутності"""
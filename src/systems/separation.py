@@ -0,0 +1,197 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий: без нього сусіди шукаються через словник комірок
+    np = None
+
+from src.entities.enemy import DEAD
+from src.utils.constants import SEPARATION_RADIUS, SEPARATION_MAX_NEIGHBORS, SEPARATION_STRENGTH
+
+# Комірки-сусіди в порядку обходу: спочатку власна, далі кільце навколо (порядок визначає,
+# які сусіди потрапляють у ліміт)
+NEIGHBOR_CELLS = ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1))
+
+# Зсув і крок ключа комірки в пакетному режимі (комірки з від'ємними координатами теж допустимі)
+CELL_KEY_OFFSET = 1 << 19
+CELL_KEY_STRIDE = 1 << 20
+
+
+class SeparationSteering:
+    """
+    Розштовхування ворогів, що переслідують або атакують гравця
+    
+    Кожен крок центри живих ворогів розкладаються по сітці з коміркою розміром
+    radius, тож сусідів шукають лише в 3x3 комірках навколо і не більше
+    max_neighbors на ворога - вартість лінійна за кількістю ворогів. Поштовх
+    тим сильніший, чим ближче сусід, і застосовується окремо по кожній осі,
+    лише якщо новий прямокутник не заходить у стіну.
+    """
+    
+    def __init__(self, grid=None, radius=SEPARATION_RADIUS, max_neighbors=SEPARATION_MAX_NEIGHBORS,
+                 strength=SEPARATION_STRENGTH):
+        """
+        Ініціалізація розштовхування
+        
+        Args:
+            grid: CollisionGrid для перевірки стін (None - без перевірки)
+            radius: Відстань між центрами, ближче якої вороги відштовхуються
+            max_neighbors: Скільки сусідів враховується для одного ворога
+            strength: Максимальна швидкість розштовхування (пікселів за секунду)
+        """
+        self.grid = grid
+        self.radius = radius
+        self.max_neighbors = max_neighbors
+        self.strength = strength
+    
+    def apply(self, enemies, steered, delta_time):
+        """
+        Розштовхування ворогів
+        
+        Args:
+            enemies: Список ворогів (сусідами є всі живі вороги)
+            steered: Індекси ворогів у списку, які розштовхуються
+            delta_time: Тривалість кроку
+        """
+        if not steered:
+            return
+        radius = self.radius
+        
+        # Сітка сусідів будується заново кожен крок
+        cells = {}
+        centers = []
+        for index, enemy in enumerate(enemies):
+            center_x = enemy.x + enemy.width / 2
+            center_y = enemy.y + enemy.height / 2
+            centers.append((center_x, center_y))
+            if enemy.state_id != DEAD:
+                cells.setdefault((int(center_x // radius), int(center_y // radius)), []).append(index)
+        
+        pushes = []
+        for index in steered:
+            center_x, center_y = centers[index]
+            cell_x = int(center_x // radius)
+            cell_y = int(center_y // radius)
+            push_x = push_y = 0.0
+            found = 0
+            for offset_x, offset_y in NEIGHBOR_CELLS:
+                for other in cells.get((cell_x + offset_x, cell_y + offset_y), ()):
+                    if found == self.max_neighbors:
+                        break
+                    if other == index:
+                        continue
+                    found += 1
+                    dx = center_x - centers[other][0]
+                    dy = center_y - centers[other][1]
+                    distance = math.sqrt(dx * dx + dy * dy)
+                    if distance >= radius:
+                        continue
+                    if distance == 0:
+                        # Ворогів в одній точці розводить порядок у списку
+                        push_x += 1.0 if index > other else -1.0
+                        continue
+                    weight = (radius - distance) / (radius * distance)
+                    push_x += dx * weight
+                    push_y += dy * weight
+            pushes.append((push_x, push_y))
+        
+        # Поштовхи застосовуються після підрахунку, щоб не залежати від порядку ворогів
+        for index, (push_x, push_y) in zip(steered, pushes):
+            length = math.sqrt(push_x * push_x + push_y * push_y)
+            if length == 0:
+                continue
+            step = self.strength * delta_time / max(length, 1.0)
+            self._push(enemies[index], push_x * step, push_y * step)
+    
+    def _push(self, enemy, delta_x, delta_y):
+        """Зсув ворога окремо по осях, якщо він не заходить у стіну"""
+        if delta_x and not (self.grid and self.grid.rect_blocked(enemy.x + delta_x, enemy.y,
+                                                                  enemy.width, enemy.height)):
+            enemy.x += delta_x
+        if delta_y and not (self.grid and self.grid.rect_blocked(enemy.x, enemy.y + delta_y,
+                                                                  enemy.width, enemy.height)):
+            enemy.y += delta_y
+    
+    def apply_batch(self, store, ids, alive, steered, delta_time):
+        """
+        Векторизоване розштовхування ворогів з одного EntityStore
+        
+        Повторює apply: ті самі комірки, порядок сусідів і ліміт, але сітка -
+        це відсортований масив ключів комірок, а сусіди кожної комірки
+        знаходяться двійковим пошуком.
+        
+        Args:
+            store: EntityStore ворогів
+            ids: Ідентифікатори ворогів у сховищі (у порядку списку)
+            alive: Маска живих ворогів
+            steered: Індекси (у ids) ворогів, які розштовхуються
+            delta_time: Тривалість кроку
+        """
+        if not len(steered):
+            return
+        radius = self.radius
+        x = store.view("x")
+        y = store.view("y")
+        width = store.view("width")[ids]
+        height = store.view("height")[ids]
+        center_x = x[ids] + width / 2
+        center_y = y[ids] + height / 2
+        keys = ((np.floor_divide(center_y, radius).astype(np.int64) + CELL_KEY_OFFSET) * CELL_KEY_STRIDE
+                + np.floor_divide(center_x, radius).astype(np.int64) + CELL_KEY_OFFSET)
+        
+        # Живі вороги, впорядковані за коміркою, а в комірці - за позицією в списку
+        members = np.flatnonzero(alive)
+        members = members[np.argsort(keys[members], kind="stable")]
+        member_keys = keys[members]
+        
+        own_x = center_x[steered]
+        own_y = center_y[steered]
+        own_keys = keys[steered]
+        push_x = np.zeros(len(steered))
+        push_y = np.zeros(len(steered))
+        found = np.zeros(len(steered), dtype=np.int64)
+        for offset_x, offset_y in NEIGHBOR_CELLS:
+            cell_keys = own_keys + offset_y * CELL_KEY_STRIDE + offset_x
+            first = np.searchsorted(member_keys, cell_keys, "left")
+            last = np.searchsorted(member_keys, cell_keys, "right")
+            for slot in range(self.max_neighbors + 1):
+                position = first + slot
+                valid = (position < last) & (found < self.max_neighbors)
+                if not valid.any():
+                    break
+                other = members[np.minimum(position, len(members) - 1)]
+                valid &= other != steered
+                found += valid
+                dx = own_x - center_x[other]
+                dy = own_y - center_y[other]
+                distance = np.sqrt(dx * dx + dy * dy)
+                near = valid & (distance < radius)
+                stacked = near & (distance == 0)
+                push_x += np.where(stacked, np.where(steered > other, 1.0, -1.0), 0.0)
+                spread = near & ~stacked
+                weight = np.where(spread, (radius - distance) / (radius * np.where(spread, distance, 1.0)), 0.0)
+                push_x += dx * weight
+                push_y += dy * weight
+        
+        length = np.sqrt(push_x * push_x + push_y * push_y)
+        moving = length > 0
+        step = self.strength * delta_time / np.maximum(length[moving], 1.0)
+        moving_ids = ids[steered[moving]]
+        delta_x = push_x[moving] * step
+        delta_y = push_y[moving] * step
+        moving_width = width[steered[moving]]
+        moving_height = height[steered[moving]]
+        
+        # Перевірка стін окремо по кожній осі, як у _push
+        new_x = x[moving_ids] + delta_x
+        if self.grid:
+            new_x = np.where((delta_x != 0) & ~self.grid.rects_blocked(new_x, y[moving_ids],
+                                                                      moving_width, moving_height),
+                             new_x, x[moving_ids])
+        x[moving_ids] = new_x
+        new_y = y[moving_ids] + delta_y
+        if self.grid:
+            new_y = np.where((delta_y != 0) & ~self.grid.rects_blocked(x[moving_ids], new_y,
+                                                                      moving_width, moving_height),
+                             new_y, y[moving_ids])
+        y[moving_ids] = new_y
@@ -0,0 +1,108 @@
+class SpatialHash:
+    """Рівномірна сітка (просторовий хеш) для швидкого пошуку сусідніх об'єктів"""
+    
+    def __init__(self, cell_size):
+        """
+        Ініціалізація просторового хешу
+        
+        Args:
+            cell_size: Розмір клітинки сітки в пікселях
+        """
+        self.cell_size = cell_size
+        self.cells = {}         # (cx, cy) -> множина об'єктів
+        self.object_cells = {}  # об'єкт -> (cx1, cy1, cx2, cy2)
+    
+    def __len__(self):
+        return len(self.object_cells)
+    
+    def __contains__(self, obj):
+        return obj in self.object_cells
+    
+    def _cell_range(self, x, y, width, height):
+        """Діапазон клітинок, які перекриває прямокутник"""
+        size = self.cell_size
+        return (int(x // size), int(y // size), int((x + width) // size), int((y + height) // size))
+    
+    def insert(self, obj, x, y, width, height):
+        """Додавання об'єкта з прямокутником (x, y, width, height)"""
+        if obj in self.object_cells:
+            self.update(obj, x, y, width, height)
+            return
+        cell_range = self._cell_range(x, y, width, height)
+        self.object_cells[obj] = cell_range
+        self._add_to_cells(obj, cell_range)
+    
+    def remove(self, obj):
+        """Видалення об'єкта"""
+        cell_range = self.object_cells.pop(obj, None)
+        if cell_range is not None:
+            self._remove_from_cells(obj, cell_range)
+    
+    def update(self, obj, x, y, width, height):
+        """
+        Оновлення положення об'єкта
+        
+        Клітинки змінюються лише тоді, коли об'єкт перетнув межу клітинки.
+        
+        Returns:
+            bool: True якщо діапазон клітинок змінився
+        """
+        old_range = self.object_cells.get(obj)
+        if old_range is None:
+            return False
+        new_range = self._cell_range(x, y, width, height)
+        if new_range == old_range:
+            return False
+        self._remove_from_cells(obj, old_range)
+        self._add_to_cells(obj, new_range)
+        self.object_cells[obj] = new_range
+        return True
+    
+    def query_rect(self, x, y, width, height):
+        """
+        Пошук кандидатів, чиї клітинки перекриваються з прямокутником
+        
+        Returns:
+            set: Об'єкти-кандидати (потребують точної перевірки)
+        """
+        cx1, cy1, cx2, cy2 = self._cell_range(x, y, width, height)
+        cells = self.cells
+        
+        # Для прямокутника в одній клітинці не потрібно об'єднувати множини
+        if cx1 == cx2 and cy1 == cy2:
+            return set(cells.get((cx1, cy1), ()))
+        
+        result = set()
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    result.update(cell)
+        return result
+    
+    def clear(self):
+        """Видалення всіх об'єктів"""
+        self.cells.clear()
+        self.object_cells.clear()
+    
+    def _add_to_cells(self, obj, cell_range):
+        cx1, cy1, cx2, cy2 = cell_range
+        cells = self.cells
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = {obj}
+                else:
+                    cell.add(obj)
+    
+    def _remove_from_cells(self, obj, cell_range):
+        cx1, cy1, cx2, cy2 = cell_range
+        cells = self.cells
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(obj)
+                    if not cell:
+                        del cells[(cx, cy)]
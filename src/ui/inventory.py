@@ -74,6 +74,7 @@ import pygame
 from pygame.locals import *
 from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, INVENTORY_SLOTS
 from src.utils.helpers import load_image
+from src.engine.text_cache import get_font, render_text
 
 
 class Inventory:
@@ -274,8 +275,8 @@ class Inventory:
                 
             # Відображення поточного боєзапасу
             ammo_text = f"{active_item.current_ammo}/{active_item.max_ammo}"
-            font = pygame.font.Font(None, 24)
-            text_surface = font.render(ammo_text, True, COLORS["white"])
+            font = get_font(None, 24)
+            text_surface = render_text(font, ammo_text, COLORS["white"])
             surface.blit(text_surface, (80, SCREEN_HEIGHT - 70))
         
         # Якщо інвентар не видимий, не малюємо його
@@ -286,8 +287,8 @@ class Inventory:
         surface.blit(self.background, (self.x, self.y))
         
         # Заголовок інвентаря
-        font = pygame.font.Font(None, 32)
-        title = font.render("ІНВЕНТАР", True, COLORS["white"])
+        font = get_font(None, 32)
+        title = render_text(font, "ІНВЕНТАР", COLORS["white"])
         surface.blit(title, (self.x + 20, self.y + 10))
         
         # Малюємо слоти інвентаря
@@ -318,14 +319,14 @@ class Inventory:
                 
                 # Відображаємо кількість, якщо більше одиниці
                 if item.quantity > 1:
-                    quantity_font = pygame.font.Font(None, 20)
-                    quantity_text = quantity_font.render(str(item.quantity), True, COLORS["white"])
+                    quantity_font = get_font(None, 20)
+                    quantity_text = render_text(quantity_font, str(item.quantity), COLORS["white"])
                     surface.blit(quantity_text, (slot_x + self.slot_width - 15, 
                                                slot_y + self.slot_height - 15))
             
             # Відображення номера слота (для гарячих клавіш)
-            slot_num_font = pygame.font.Font(None, 18)
-            slot_num = slot_num_font.render(str(i + 1), True, COLORS["dark_gray"])
+            slot_num_font = get_font(None, 18)
+            slot_num = render_text(slot_num_font, str(i + 1), COLORS["dark_gray"])
             surface.blit(slot_num, (slot_x + 5, slot_y + 5))
         
         # Якщо є активний предмет, відображаємо додаткову інформацію про нього
@@ -335,13 +336,13 @@ class Inventory:
             info_y = self.y + 50 + ((INVENTORY_SLOTS // 5) + 1) * (self.slot_height + self.slot_spacing)
             
             # Назва предмета
-            item_font = pygame.font.Font(None, 28)
-            item_name = item_font.render(item.display_name, True, COLORS["white"])
+            item_font = get_font(None, 28)
+            item_name = render_text(item_font, item.display_name, COLORS["white"])
             surface.blit(item_name, (info_x, info_y))
             
             # Опис предмета
-            desc_font = pygame.font.Font(None, 20)
-            desc_text = desc_font.render(item.description, True, COLORS["light_gray"])
+            desc_font = get_font(None, 20)
+            desc_text = render_text(desc_font, item.description, COLORS["light_gray"])
             surface.blit(desc_text, (info_x, info_y + 30))
             
             # Додаткова інформація про зброю
@@ -349,8 +350,8 @@ class Inventory:
                 ammo_text = f"Боєзапас: {item.current_ammo}/{item.max_ammo}"
                 damage_text = f"Пошкодження: {item.damage}"
                 
-                ammo_surf = desc_font.render(ammo_text, True, COLORS["light_gray"])
-                damage_surf = desc_font.render(damage_text, True, COLORS["light_gray"])
+                ammo_surf = render_text(desc_font, ammo_text, COLORS["light_gray"])
+                damage_surf = render_text(desc_font, damage_text, COLORS["light_gray"])
                 
                 surface.blit(ammo_surf, (info_x, info_y + 50))
                 surface.blit(damage_surf, (info_x, info_y + 70))
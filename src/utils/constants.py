@@ -9,13 +9,52 @@ SCREEN_HEIGHT = 768
 SCREEN_TITLE = "2D Doom - Pygame"
 FPS = 60
 
+# Кольори
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+
+# Налаштування ігрового циклу
+FIXED_TIMESTEP = True  # Симуляція з фіксованим кроком (незалежно від частоти кадрів)
+TICK_RATE = 60  # Кількість кроків симуляції за секунду
+MAX_SIMULATION_STEPS = 5  # Максимум кроків наздоганяння за один кадр
+MAX_FRAME_TIME = 0.25  # Максимальний час кадру (секунди), що враховується симуляцією
+DIRTY_RECT_RENDERING = False  # Оновлення лише змінених областей екрану замість flip
+
+# Налаштування кешу трансформованих спрайтів
+SPRITE_CACHE_ANGLE_STEP = 2  # Крок квантування кута повороту (градуси)
+SPRITE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Максимальний обсяг кешу (байти)
+
+# Налаштування атласу текстур
+ATLAS_PATH = "assets/atlas/"  # Папка з побудованим атласом
+ATLAS_INDEX_FILE = "atlas.json"  # Файл індексу атласу
+ATLAS_PAGE_SIZE = 2048  # Розмір сторінки атласу (пікселі)
+ATLAS_PADDING = 1  # Відступ між текстурами на сторінці
+
+# Шари малювання сутностей (менші шари малюються раніше)
+RENDER_LAYERS = {
+    "items": 1,
+    "enemies": 2,
+    "player": 3,
+    "weapons": 4,
+    "overlay": 5
+}
+
+# Налаштування кешу тексту
+TEXT_CACHE_SIZE = 512  # Максимальна кількість відрендерених рядків у кеші
+
 # Розмір тайлів у грі
 TILE_SIZE = 64
+MAP_CHUNK_TILES = 8  # Розмір попередньо намальованого фрагмента карти (тайлів по осі)
+MAP_CHUNK_CACHE_SIZE = 48  # Максимальна кількість фрагментів карти в пам'яті
+SPATIAL_HASH_CELL_SIZE = 128  # Розмір клітинки просторового хешу зіткнень (пікселі)
+CCD_THRESHOLD = TILE_SIZE // 2  # Зміщення за крок (пікселі), з якого рух перевіряється неперервно
 
 # Налаштування гравця
 PLAYER_SPEED = 5.0
 PLAYER_ROTATION_SPEED = 3.0
 PLAYER_MAX_HEALTH = 100
+PLAYER_HEALTH = PLAYER_MAX_HEALTH  # Початкове здоров'я
 PLAYER_MAX_ARMOR = 100
 PLAYER_RADIUS = 20
 PLAYER_START_WEAPONS = ["pistol", "shotgun"]  # Початкова зброя
@@ -45,8 +84,17 @@ ENEMY_ATTACK_RANGE = {
     "demon": 60,
     "cacodemon": 350  # Може стріляти
 }
+# Базовий ворог (тип basic) має характеристики зомбі; для fast і heavy до них застосовуються множники
+ENEMY_BASE_HEALTH = ENEMY_HEALTH["zombie"]
+ENEMY_BASE_SPEED = ENEMY_SPEEDS["zombie"] * TICK_RATE  # Пікселів за секунду (ENEMY_SPEEDS - пікселів за крок)
+ENEMY_BASE_DAMAGE = ENEMY_DAMAGE["zombie"]
+ENEMY_BASE_ATTACK_RATE = 1.0  # Секунди між атаками (у налаштуваннях ворогів не задано)
 ENEMY_SIGHT_RANGE = 500  # Відстань, на якій вороги бачать гравця
+ENEMY_VIEW_DISTANCE = ENEMY_SIGHT_RANGE  # Радіус, у якому AI перевіряє видимість гравця
 ENEMY_SPAWN_RATE = 0.01  # Ймовірність появи ворога за кадр
+ENEMY_STATES = ("idle", "patrol", "chase", "attack", "hurt", "dead")  # Стани ворогів (індекс - state_id)
+ENEMY_TYPES = ("basic", "fast", "heavy")  # Типи ворогів (індекс - type_id; невідомі типи додаються при створенні)
+ENEMY_ANIMATION_FRAMES = 4  # Кількість кадрів анімації ворога
 
 # Налаштування зброї
 WEAPON_DAMAGE = {
@@ -61,6 +109,7 @@ WEAPON_FIRE_RATE = {
     "chaingun": 0.1,
     "rocket_launcher": 1.2
 }
+PLAYER_ATTACK_RATE = WEAPON_FIRE_RATE[PLAYER_START_WEAPONS[0]]  # Секунди між атаками гравця (як у початкової зброї)
 WEAPON_RELOAD_TIME = {
     "pistol": 1.0,
     "shotgun": 1.5,
@@ -135,6 +184,18 @@ FRICTION = 0.9  # Тертя для плавного гальмування
 
 # Налаштування штучного інтелекту
 AI_UPDATE_RATE = 5  # Оновлення штучного інтелекту кожні N кадрів
+AI_TICK_BUDGET_MS = 4.0  # Бюджет часу AI на один крок симуляції (None - без обмеження)
+AI_LOD_NEAR_DISTANCE = 600  # Вороги ближче до гравця (або на екрані) думають кожен крок
+AI_SCHEDULER_CHUNK = 256  # Кількість ворогів між перевірками бюджету часу
+AI_BATCH_THRESHOLD = 64  # Кількість ворогів, з якої AI оновлюється векторизовано (потрібен NumPy)
+AI_WORKER_ENABLED = False  # Рішення AI в окремому процесі з запізненням на один крок (потрібен NumPy)
+LOS_CACHE_SIZE = 65536  # Максимальна кількість пар тайлів у кеші прямої видимості
+FLOW_FIELD_RADIUS = 32  # Максимальна довжина шляху поля напрямків до гравця (тайли)
+PATH_CLUSTER_SIZE = 8  # Розмір кластера ієрархічного пошуку шляху (тайли)
+PATH_CACHE_SIZE = 256  # Кількість маршрутів між парами кластерів у кеші
+SEPARATION_RADIUS = 32  # Відстань між центрами ворогів, ближче якої вони розштовхуються
+SEPARATION_MAX_NEIGHBORS = 6  # Максимальна кількість сусідів, що враховуються для одного ворога
+SEPARATION_STRENGTH = 60  # Максимальна швидкість розштовхування (пікселів за секунду)
 AI_ROAMING_DISTANCE = 200  # Відстань для випадкового переміщення ворогів
 AI_PURSUIT_DISTANCE = 300  # Відстань для переслідування гравця
 
@@ -189,8 +250,12 @@ RESOURCE_PATHS = {
     "fonts": "assets/fonts/",
     "saves": "saves/"
 }
+MAP_PATH = RESOURCE_PATHS["maps"]  # Папка з картами рівнів
 
 # Додаткові налаштування гри
 DEBUG_MODE = False  # Увімкнення/вимкнення режиму відлагодження
 SHOW_FPS = True  # Показувати лічильник FPS
+PROFILER_HISTORY = 3000  # Кількість останніх кадрів, що зберігає профайлер
+PROFILER_OVERLAY_REFRESH = 30  # Оновлення статистики оверлею кожні N кадрів
+PROFILER_EXPORT_PATH = None  # Файл (.csv або .json) для збереження профілю при виході
 ENABLE_VSYNC = True  # Увімкнення/вимкнення вертикальної синхронізації
\ No newline at end of file
@@ -13,6 +13,7 @@ import pickle
 from datetime import datetime
 
 from src.utils.constants import RESOURCE_PATHS, SCREEN_WIDTH, SCREEN_HEIGHT, COLORS
+from src.engine.text_cache import get_font, render_text
 
 
 def load_image(filename, alpha=True):
@@ -33,8 +34,8 @@ def load_image(filename, alpha=True):
         surface = pygame.Surface((64, 64))
         surface.fill(COLORS["purple"])  # Фіолетовий колір для відсутніх текстур
         pygame.draw.rect(surface, COLORS["black"], (0, 0, 64, 64), 1)
-        text_font = pygame.font.Font(None, 12)
-        text_surface = text_font.render("NO TEXTURE", True, COLORS["black"])
+        text_font = get_font(None, 12)
+        text_surface = render_text(text_font, "NO TEXTURE", COLORS["black"])
         surface.blit(text_surface, (10, 25))
         return surface
     
@@ -344,8 +345,8 @@ def draw_text(surface, text, size, x, y, color=COLORS["white"],
         align: Вирівнювання тексту ("left", "center", "right")
         font_name: Назва шрифту (None для стандартного)
     """
-    font = pygame.font.Font(font_name, size)
-    text_surface = font.render(text, True, color)
+    font = get_font(font_name, size)
+    text_surface = render_text(font, text, color)
     text_rect = text_surface.get_rect()
     
     if align == "center":
@@ -653,7 +654,7 @@ def draw_text_box(surface, text, rect, font, text_color=COLORS["white"],
     # Відображення кожного рядка
     line_height = font.get_height()
     for i, line in enumerate(lines):
-        text_surface = font.render(line, True, text_color)
+        text_surface = render_text(font, line, text_color)
         text_rect = text_surface.get_rect()
         text_rect.x = rect.x + padding
         text_rect.y = rect.y + padding + i * line_height
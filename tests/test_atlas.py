@@ -0,0 +1,67 @@
+"""
+Перевірка текстур з атласу: логічні назви сцен посилаються на області,
+названі за іменами файлів.
+
+Запуск:
+    python -m pytest tests
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+from src.engine.atlas import build_atlas
+from src.engine.renderer import Renderer
+
+
+@pytest.fixture
+def display():
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.quit()
+
+
+def _save_png(path, size, color):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    pygame.image.save(surface, str(path))
+
+
+def test_load_texture_uses_atlas_region(display, tmp_path):
+    textures = tmp_path / "textures"
+    textures.mkdir()
+    _save_png(textures / "menu_bg.png", (8, 4), (255, 0, 0, 255))
+    _save_png(textures / "tile_1.png", (4, 4), (0, 0, 255, 255))
+    assert build_atlas(str(textures), str(tmp_path / "atlas"))
+
+    renderer = Renderer()
+    assert renderer.load_atlas(str(tmp_path / "atlas"))
+    # Текстура має братися з атласу, а не з файлу
+    os.remove(textures / "menu_bg.png")
+
+    assert renderer.load_texture("menu_background", str(textures / "menu_bg.png"))
+    page, rect = renderer.atlas_regions["menu_background"]
+    assert renderer.textures["menu_background"].get_parent() is page
+    assert rect.size == (8, 4)
+    # Область за іменем файлу лишається доступною для інших назв
+    assert renderer.atlas_regions["menu_bg"] == (page, rect)
+    assert renderer.load_texture("menu_background_copy", str(textures / "menu_bg.png"))
+
+    surface = pygame.Surface((16, 16), pygame.SRCALPHA)
+    renderer.draw_texture(surface, "menu_background", (2, 2))
+    assert surface.get_at((2, 2)) == (255, 0, 0, 255)
+    assert surface.get_at((9, 5)) == (255, 0, 0, 255)
+    assert surface.get_at((10, 2)) == (0, 0, 0, 0)
+
+
+def test_load_texture_without_atlas_region_reads_file(display, tmp_path):
+    _save_png(tmp_path / "menu_bg.png", (8, 4), (0, 255, 0, 255))
+
+    renderer = Renderer()
+    assert renderer.load_texture("menu_background", str(tmp_path / "menu_bg.png"))
+    assert "menu_background" not in renderer.atlas_regions
+    assert renderer.textures["menu_background"].get_size() == (8, 4)
+    assert not renderer.load_texture("missing", str(tmp_path / "missing.png"))
@@ -0,0 +1,108 @@
+"""
+Перевірка пакетного оновлення фізичних тіл (PhysicsSystem.update_bodies)
+та руху гравця через систему фізики в ігровій сцені.
+
+Запуск:
+    python -m pytest tests
+"""
+
+from src.engine.headless import HeadlessRunner
+from src.entities.entity_store import EntityStore
+from src.entities.player import Player
+from src.systems.collision import CollisionSystem
+from src.systems.physics import PhysicsSystem
+from src.utils.constants import FRICTION, TICK_RATE, TILE_SIZE
+
+DELTA_TIME = 1.0 / TICK_RATE
+
+# Кімната 6x6 тайлів зі стінами по краях
+ROOM = {"tiles": [[1] * 6] + [[1, 0, 0, 0, 0, 1] for _ in range(4)] + [[1] * 6]}
+
+
+def _expected(position, velocity, steps):
+    """Позиція і швидкість після кількох кроків тертя та руху у вільному просторі"""
+    for _ in range(steps):
+        velocity *= (1 - FRICTION * DELTA_TIME)
+        position += velocity * DELTA_TIME
+    return position, velocity
+
+
+def _bodies(velocities):
+    """Система фізики з гравцями в одному сховищі посеред кімнати"""
+    store = EntityStore(len(velocities))
+    physics = PhysicsSystem(CollisionSystem(ROOM))
+    bodies = []
+    for index, (velocity_x, velocity_y) in enumerate(velocities):
+        body = Player(TILE_SIZE * 2 + index * 40, TILE_SIZE * 2, store=store)
+        body.velocity_x = velocity_x
+        body.velocity_y = velocity_y
+        physics.register_body(body)
+        bodies.append(body)
+    return physics, bodies
+
+
+def test_update_bodies_integrates_positions():
+    velocities = [(120.0, 0.0), (0.0, -90.0), (60.0, 45.0)]
+    physics, bodies = _bodies(velocities)
+    starts = [(body.x, body.y) for body in bodies]
+    for _ in range(5):
+        physics.update_bodies(DELTA_TIME)
+
+    for body, (start_x, start_y), (velocity_x, velocity_y) in zip(bodies, starts, velocities):
+        expected_x, expected_velocity_x = _expected(start_x, velocity_x, 5)
+        expected_y, expected_velocity_y = _expected(start_y, velocity_y, 5)
+        assert abs(body.x - expected_x) < 1e-9
+        assert abs(body.y - expected_y) < 1e-9
+        assert abs(body.velocity_x - expected_velocity_x) < 1e-9
+        assert abs(body.velocity_y - expected_velocity_y) < 1e-9
+
+
+def test_update_bodies_matches_update():
+    velocities = [(300.0, 20.0), (-250.0, 0.0), (0.05, 400.0)]
+    batch, batch_bodies = _bodies(velocities)
+    scalar, scalar_bodies = _bodies(velocities)
+    for _ in range(30):
+        batch.update_bodies(DELTA_TIME)
+        for body in scalar_bodies:
+            scalar.update(body, DELTA_TIME)
+
+    for batch_body, scalar_body in zip(batch_bodies, scalar_bodies):
+        assert (batch_body.x, batch_body.y) == (scalar_body.x, scalar_body.y)
+        assert (batch_body.velocity_x, batch_body.velocity_y) == (scalar_body.velocity_x, scalar_body.velocity_y)
+
+
+def test_update_bodies_stops_at_wall():
+    physics, (body,) = _bodies([(-400.0, 0.0)])
+    for _ in range(60):
+        physics.update_bodies(DELTA_TIME)
+
+    # Тіло зупиняється перед лівою стіною, і його швидкість по осі x скидається
+    assert TILE_SIZE - 400.0 * DELTA_TIME <= body.x
+    assert body.x < TILE_SIZE + 400.0 * DELTA_TIME
+    assert body.y == TILE_SIZE * 2
+    assert body.velocity_x == 0
+
+
+def test_gameplay_scene_moves_player_through_physics():
+    runner = HeadlessRunner("level1", seed=1)
+    try:
+        assert runner.setup()
+        scene = runner.scene_manager.current_scene
+        input_handler = runner.game_loop.input_handler
+        player = scene.player
+        assert player in scene.physics_system.body_index
+
+        start_x, start_y = player.x, player.y
+        right = 1 << list(input_handler.key_map).index("right")
+        for _ in range(3):
+            input_handler.apply_snapshot((right, 0, 0, 0))
+            runner.game_loop.step(DELTA_TIME)
+
+        # За крок гравець отримує швидкість speed пікселів за крок і рухається один раз
+        position = start_x
+        for _ in range(3):
+            position, _velocity = _expected(position, player.speed * TICK_RATE, 1)
+        assert abs(player.x - position) < 1e-9
+        assert player.y == start_y
+    finally:
+        runner.shutdown()
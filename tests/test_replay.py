@@ -0,0 +1,90 @@
+"""
+Перевірка запису і відтворення введення: сесія, записана віконним ігровим
+циклом (як у main.py --record), відтворюється headless-запуском з тим самим станом.
+
+Запуск:
+    python -m pytest tests
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.engine.game_loop import GameLoop
+from src.engine.headless import HeadlessRunner
+from src.engine.replay import InputReplay
+from src.engine.scene_manager import SceneManager
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+TICKS = 240
+SEED = 12345
+
+
+def _scripted_input(monkeypatch, key_map):
+    """Підміна опитування клавіатури і миші послідовністю натискань по кроках"""
+    tick = [0]
+    moves = [("right",), ("down",), ("left", "up"), ("right", "down")]
+
+    def get_pressed():
+        pressed = moves[tick[0] // 60 % len(moves)]
+        tick[0] += 1
+        return {key: action in pressed for action, key in key_map.items()}
+
+    monkeypatch.setattr(pygame.key, "get_pressed", get_pressed)
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (tick[0] * 3 % SCREEN_WIDTH, SCREEN_HEIGHT // 2))
+    monkeypatch.setattr(pygame.mouse, "get_pressed", lambda: (tick[0] % 15 == 0, False, False))
+
+
+def _state(scene):
+    """Стан гравця і ворогів сцени"""
+    state = [(scene.player.x, scene.player.y, scene.player.health, scene.player.direction)]
+    state += [(enemy.entity_id, enemy.x, enemy.y, enemy.health, enemy.state_id) for enemy in scene.enemies]
+    return state
+
+
+def _record(path, monkeypatch):
+    """Запис сесії віконним ігровим циклом з фіксованим кроком"""
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        game_loop = GameLoop(screen, SceneManager())
+        assert game_loop.start_session(SEED, record_path=str(path))
+        assert game_loop.load_scene("gameplay", map_name="level1")
+        _scripted_input(monkeypatch, game_loop.input_handler.key_map)
+
+        for _ in range(TICKS):
+            game_loop.process_events()
+            game_loop.step(game_loop.tick_duration)
+        game_loop.end_session()
+
+        scene = game_loop.scene_manager.current_scene
+        state = _state(scene)
+        scene.unload()
+        return state
+    finally:
+        pygame.quit()
+
+
+def test_record_replay_round_trip(tmp_path, monkeypatch):
+    path = tmp_path / "session.rpl"
+    recorded = _record(path, monkeypatch)
+    monkeypatch.undo()
+
+    replay = InputReplay.load(str(path))
+    assert replay.seed == SEED
+    assert replay.ticks == TICKS
+    snapshots = [replay.next_snapshot() for _ in range(TICKS)]
+    assert len({snapshot[0] for snapshot in snapshots}) == 4  # Записано всі чотири комбінації клавіш
+    assert any(snapshot[3] for snapshot in snapshots)
+
+    runner = HeadlessRunner("level1", replay_path=str(path))
+    try:
+        assert runner.setup()
+        assert runner.seed == SEED
+        runner.run(TICKS * 2)
+        assert not runner.game_loop.running  # Відтворення зупиняється в кінці запису
+        assert _state(runner.scene_manager.current_scene) == recorded
+    finally:
+        runner.shutdown()